@@ -11,18 +11,28 @@ Autor: Manus AI (bajo DOS-03)
 Fecha: 26 de enero de 2026
 """
 
-import hashlib
 import json
 import os
 import signal
-import subprocess
+import threading
 import time
-from dataclasses import dataclass, field
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field, replace
 from enum import Enum
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 import logging
 
+from binary_codec import SCHEMA_VIOLATION_EVENT, register_schema
+from event_coalescer import CoalesceDecision, EventCoalescer
+from file_hasher import FileHasher, HashResult, default_hasher
+from history_buffer import RingBuffer, spill_path_for
+from inotify_watcher import InotifyWatcher
+from process_registry import ProcessRegistry, SignalResult
+from report_sink import FileTransport, HttpTransport, ReportSink
+from scheduler import PeriodicScheduler
+from snapshot_manager import SnapshotInfo, SnapshotManager
+
 # Configuración de logging
 logging.basicConfig(
     level=logging.INFO,
@@ -68,37 +78,86 @@ class IntegrityRecord:
     expected_hash: str
     criticality: CriticalityLevel
     last_check: float = field(default_factory=time.time)
+    hash_mode: str = "flat"  # "flat" (SHA-256 del archivo) o "tree" (hash en árbol por bloques)
+    chunk_digests: List[str] = field(default_factory=list, repr=False)
+    last_hash_result: Optional[HashResult] = field(default=None, repr=False)
+    last_rehashed: bool = field(default=False, repr=False)
+    # Estado del último hash completo (pre-verificación por stat)
+    stat_signature: Optional[Tuple[int, int, int, int]] = field(default=None, repr=False)
+    last_hash: Optional[str] = field(default=None, repr=False)
+    last_full_hash_time: float = field(default=0.0, repr=False)
+    
+    def current_stat_signature(self) -> Tuple[int, int, int, int]:
+        """Retorna la firma (inode, tamaño, mtime_ns, ctime_ns) actual del archivo"""
+        st = os.stat(self.file_path)
+        return (st.st_ino, st.st_size, st.st_mtime_ns, st.st_ctime_ns)
     
-    def compute_current_hash(self) -> str:
-        """Calcula el hash SHA-256 actual del archivo"""
+    def compute_current_hash(self, hasher: Optional[FileHasher] = None) -> str:
+        """Calcula el hash SHA-256 actual del archivo (plano o en árbol según hash_mode)"""
         if not os.path.exists(self.file_path):
             raise FileNotFoundError(f"Component file not found: {self.file_path}")
         
-        sha256_hash = hashlib.sha256()
-        with open(self.file_path, "rb") as f:
-            # Leer en bloques para archivos grandes
-            for byte_block in iter(lambda: f.read(4096), b""):
-                sha256_hash.update(byte_block)
-        return sha256_hash.hexdigest()
+        hasher = hasher or default_hasher()
+        if self.hash_mode == "tree":
+            result = hasher.tree_hash(self.file_path)
+            self.chunk_digests = result.chunk_digests
+        else:
+            result = hasher.hash_file(self.file_path)
+        
+        self.last_hash_result = result
+        return result.hexdigest
     
-    def verify_integrity(self) -> Tuple[bool, str]:
+    def verify_integrity(self,
+                         use_stat_cache: bool = False,
+                         max_cache_age_seconds: Optional[float] = None,
+                         hasher: Optional[FileHasher] = None) -> Tuple[bool, str]:
         """
         Verifica la integridad del componente.
         
+        Con `use_stat_cache`, el archivo solo se vuelve a hashear si su firma
+        stat cambió desde el último hash completo o si este es más antiguo que
+        `max_cache_age_seconds`.
+        
+        Args:
+            use_stat_cache: Omitir el hash si la firma stat no cambió
+            max_cache_age_seconds: Antigüedad máxima del último hash completo
+            hasher: Motor de hash a usar (por defecto, el compartido)
+        
         Returns:
             Tuple[bool, str]: (integridad_ok, hash_actual)
         """
         try:
-            current_hash = self.compute_current_hash()
+            self.last_rehashed = False
+            now = time.time()
+            signature = self.current_stat_signature()
+            
+            cache_fresh = (max_cache_age_seconds is None or
+                           now - self.last_full_hash_time < max_cache_age_seconds)
+            if (use_stat_cache and self.last_hash is not None and
+                    signature == self.stat_signature and cache_fresh):
+                self.last_check = now
+                return self.last_hash == self.expected_hash, self.last_hash
+            
+            current_hash = self.compute_current_hash(hasher)
+            self.last_rehashed = True
+            
+            # Solo confiar en la firma si el archivo no cambió durante el hash
+            signature_after = self.current_stat_signature()
+            self.stat_signature = signature if signature == signature_after else None
+            self.last_hash = current_hash
+            self.last_full_hash_time = now
+            
             self.last_check = time.time()
             integrity_ok = (current_hash == self.expected_hash)
             return integrity_ok, current_hash
         except Exception as e:
             logger.error(f"Error verifying integrity of {self.component_name}: {e}")
+            self.stat_signature = None
+            self.last_hash = None
             return False, ""
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ViolationEvent:
     """Evento de violación de protocolo inmutable"""
     protocol_id: ProtocolID
@@ -109,6 +168,9 @@ class ViolationEvent:
     component_affected: Optional[str] = None
 
 
+register_schema(SCHEMA_VIOLATION_EVENT, ViolationEvent)
+
+
 class AeonGuardian:
     """
     ÆON - Guardián de Inmutables de CAELION
@@ -116,6 +178,26 @@ class AeonGuardian:
     Módulo de seguridad de máxima prioridad responsable de proteger
     los invariantes inmutables del sistema mediante monitoreo continuo
     y respuestas proporcionales a amenazas.
+    
+    Modos de verificación de integridad (`integrity_check_mode`):
+    
+    - "full": cada intervalo se hashea el contenido completo de todos los
+      componentes. Detecta cualquier cambio de contenido en a lo sumo un intervalo.
+    - "stat": solo se vuelve a hashear un componente si cambia su firma
+      (inode, tamaño, mtime_ns, ctime_ns) o si su último hash completo supera
+      `forced_full_rehash_seconds`. El kernel actualiza ctime en toda escritura
+      o cambio de metadatos y no puede fijarse desde espacio de usuario, por lo
+      que se detecta cualquier modificación hecha a través del sistema de
+      archivos. No se detectan escrituras que lo eviten (dispositivo de bloques
+      en crudo, disco montado en otro sistema) ni una escritura dentro del mismo
+      tic de ctime justo tras un hash; en esos casos el tiempo de detección está
+      acotado por `forced_full_rehash_seconds`.
+    - "inotify": igual que "stat", y además un vigilante inotify dispara la
+      verificación de un componente en cuanto cambia su archivo, sin esperar al
+      intervalo. inotify no observa escrituras vía mmap, enlaces duros en otros
+      directorios ni sistemas de archivos de red, y puede perder eventos si su
+      cola se desborda (lo que fuerza una verificación completa); el sondeo por
+      stat sigue siendo la garantía de detección.
     """
     
     def __init__(self, 
@@ -131,12 +213,20 @@ class AeonGuardian:
         self.config_path = config_path
         self.secure_endpoint = secure_endpoint
         self.integrity_records: Dict[str, IntegrityRecord] = {}
-        self.violation_history: List[ViolationEvent] = []
         self.monitoring_active = False
-        self.snapshots_dir = Path("/var/caelion/snapshots")
+        self._check_lock = threading.RLock()
+        self._watcher: Optional[InotifyWatcher] = None
+        self._scheduler: Optional[PeriodicScheduler] = None
+        self._owns_scheduler = False
         
         logger.info("ÆON Guardian initializing...")
         self._load_configuration()
+        self._initialize_history()
+        self._initialize_hashing()
+        self._initialize_snapshots()
+        self._initialize_processes()
+        self._initialize_reporting()
+        self._initialize_coalescing()
         self._initialize_integrity_records()
         logger.info("ÆON Guardian initialized successfully")
     
@@ -151,14 +241,104 @@ class AeonGuardian:
                 # Configuración por defecto
                 self.config = {
                     "monitoring_interval_seconds": 5,
+                    "monitoring_jitter_seconds": 0,
+                    "monitoring_deadline_seconds": None,  # Por defecto, el intervalo
                     "max_violation_history": 1000,
-                    "reset_failure_escalates_to_destruction": True
+                    "reset_failure_escalates_to_destruction": True,
+                    "integrity_check_mode": "stat",  # "full", "stat" o "inotify"
+                    "forced_full_rehash_seconds": 3600,
+                    "hash_buffer_bytes": 1048576,
+                    "hash_use_mmap": False,
+                    "hash_workers": 4,
+                    "hash_chunk_bytes": 67108864,  # Bloque del hash en árbol (64 MiB)
+                    "history_spill_dir": None,  # Volcado de entradas desalojadas
+                    "snapshots_dir": "/var/caelion/snapshots",
+                    "process_match_pattern": "caelion",  # Equivalente a `pgrep -f caelion`
+                    "report_transport": "file",  # "file" o "http" (secure_endpoint)
+                    "report_dir": "/tmp",
+                    "report_queue_size": 1000,
+                    "report_batch_size": 100,
+                    "report_backpressure": "block",  # "block", "drop_oldest" o "drop_newest"
+                    "final_report_timeout_seconds": 10,
+                    "violation_window_seconds": 60,  # Deduplicación de eventos repetidos
+                    "violation_rate_per_second": 0.2,  # Token bucket por protocolo
+                    "violation_burst": 3,
+                    "violation_protocol_limits": {},  # {"C1-01": [rate, burst], ...}
+                    "violation_replay_interval_seconds": 1  # Entrega de re-escalados diferidos
                 }
                 logger.warning(f"Configuration file not found, using defaults")
         except Exception as e:
             logger.error(f"Error loading configuration: {e}")
             raise
     
+    def _initialize_history(self):
+        """Inicializa el historial acotado de violaciones"""
+        self.violation_history: RingBuffer = RingBuffer(
+            self.config.get("max_violation_history", 1000),
+            spill_path=spill_path_for(self.config.get("history_spill_dir"), "aeon_violation_history")
+        )
+    
+    def _initialize_hashing(self):
+        """Inicializa el motor de hash y el pool de verificación de componentes"""
+        workers = self.config.get("hash_workers", 4)
+        self.hasher = FileHasher(
+            buffer_size=self.config.get("hash_buffer_bytes", 1048576),
+            use_mmap=self.config.get("hash_use_mmap", False),
+            max_workers=workers,
+            chunk_size=self.config.get("hash_chunk_bytes", 67108864)
+        )
+        # Pool separado: un componente en árbol usa el pool del motor para sus bloques
+        self._check_executor = ThreadPoolExecutor(max_workers=workers,
+                                                  thread_name_prefix="aeon-check")
+        self.last_check_results: Dict[str, Dict] = {}
+    
+    def _initialize_snapshots(self):
+        """Inicializa el gestor de snapshots de estado seguro"""
+        self.snapshots_dir = Path(self.config.get("snapshots_dir", "/var/caelion/snapshots"))
+        self.snapshot_manager = SnapshotManager(
+            str(self.snapshots_dir),
+            buffer_size=self.config.get("hash_buffer_bytes", 1048576)
+        )
+    
+    def _initialize_processes(self):
+        """Inicializa el registro de procesos usado en la congelación y la terminación"""
+        self.process_registry = ProcessRegistry(self.config.get("process_match_pattern", "caelion"))
+        self.last_freeze: Optional[SignalResult] = None
+    
+    def _initialize_reporting(self):
+        """Inicializa el sumidero asíncrono de reportes"""
+        file_transport = FileTransport(self.config.get("report_dir", "/tmp"))
+        if self.config.get("report_transport", "file") == "http":
+            transport, fallback = HttpTransport(self.secure_endpoint), file_transport
+        else:
+            transport, fallback = file_transport, None
+        
+        self.report_sink = ReportSink(
+            transport,
+            fallback=fallback,
+            max_queue=self.config.get("report_queue_size", 1000),
+            batch_size=self.config.get("report_batch_size", 100),
+            backpressure=self.config.get("report_backpressure", "block")
+        )
+    
+    def _initialize_coalescing(self):
+        """Inicializa la capa de coalescencia de eventos de violación"""
+        self.event_coalescer = EventCoalescer(
+            window_seconds=self.config.get("violation_window_seconds", 60),
+            rate_per_second=self.config.get("violation_rate_per_second", 0.2),
+            burst=self.config.get("violation_burst", 3),
+            protocol_limits={
+                protocol: tuple(limit)
+                for protocol, limit in self.config.get("violation_protocol_limits", {}).items()
+            },
+            exempt=self._is_uncoalescable
+        )
+    
+    @staticmethod
+    def _is_uncoalescable(event: ViolationEvent) -> bool:
+        """Las violaciones de C0 (confirmadas o intentos) nunca se absorben ni se limitan"""
+        return event.criticality == CriticalityLevel.C0_EXISTENTIAL
+    
     def _initialize_integrity_records(self):
         """Inicializa los registros de integridad de componentes críticos"""
         # En un sistema real, estos registros se cargarían desde una configuración segura
@@ -211,57 +391,189 @@ class AeonGuardian:
         
         logger.info(f"Initialized {len(self.integrity_records)} integrity records")
     
-    def start_monitoring(self):
-        """Inicia el monitoreo continuo de integridad"""
+    SCHEDULED_TASKS = ("aeon.integrity_check", "aeon.process_refresh", "aeon.violation_replay")
+    
+    def start_monitoring(self, scheduler: Optional[PeriodicScheduler] = None):
+        """
+        Inicia el monitoreo continuo de integridad.
+        
+        Las verificaciones se registran como tareas periódicas de tasa fija.
+        Sin planificador, ÆON crea el suyo y la llamada bloquea hasta
+        stop_monitoring() o SIGINT/SIGTERM; con un planificador compartido
+        (p. ej. con ARGOS y LIANG), registra sus tareas y retorna.
+        
+        Args:
+            scheduler: Planificador compartido en el que registrar las tareas
+        """
         self.monitoring_active = True
-        logger.info("ÆON monitoring started")
         
         interval = self.config.get("monitoring_interval_seconds", 5)
+        jitter = self.config.get("monitoring_jitter_seconds", 0)
+        deadline = self.config.get("monitoring_deadline_seconds")
         
-        try:
-            while self.monitoring_active:
-                self._perform_integrity_check()
-                time.sleep(interval)
-        except KeyboardInterrupt:
-            logger.info("ÆON monitoring interrupted by user")
-            self.stop_monitoring()
+        if self.config.get("integrity_check_mode", "stat") == "inotify":
+            self._start_watcher()
+        
+        self._owns_scheduler = scheduler is None
+        if scheduler is None:
+            scheduler = PeriodicScheduler()
+        self._scheduler = scheduler
+        
+        scheduler.add_task("aeon.integrity_check", self._perform_integrity_check,
+                           period=interval, jitter=jitter, deadline=deadline)
+        # Mantener la caché de procesos al día: congelar solo inspecciona los nuevos
+        scheduler.add_task("aeon.process_refresh", self.process_registry.refresh,
+                           period=interval, jitter=jitter)
+        # Re-escalados limitados: se responden en cuanto su protocolo tiene tokens
+        scheduler.add_task("aeon.violation_replay", self._replay_deferred_violations,
+                           period=self.config.get("violation_replay_interval_seconds", 1))
+        logger.info("ÆON monitoring started")
+        
+        if self._owns_scheduler:
+            scheduler.run()
+            if self._scheduler is scheduler:
+                # Detenido por señal
+                self.stop_monitoring()
     
     def stop_monitoring(self):
         """Detiene el monitoreo continuo"""
         self.monitoring_active = False
+        if self._watcher is not None:
+            self._watcher.stop()
+            self._watcher = None
+        
+        scheduler, self._scheduler = self._scheduler, None
+        if scheduler is not None:
+            for name in self.SCHEDULED_TASKS:
+                scheduler.remove_task(name)
+            if self._owns_scheduler and scheduler.running:
+                scheduler.stop()
         logger.info("ÆON monitoring stopped")
     
-    def _perform_integrity_check(self):
-        """Realiza una verificación de integridad de todos los componentes"""
+    def close(self):
+        """
+        Detiene el monitoreo, entrega los reportes aún en cola y libera los
+        pools de hilos.
+        
+        El escritor del sumidero de reportes es un hilo daemon: sin close(),
+        los reportes encolados se pierden al terminar el proceso.
+        """
+        self.stop_monitoring()
+        timeout = self.config.get("final_report_timeout_seconds", 10)
+        self.report_sink.close(timeout=timeout)
+        if len(self.report_sink):
+            logger.critical(f"{len(self.report_sink)} reports still queued after {timeout}s")
+        self._check_executor.shutdown(wait=True)
+        self.hasher.shutdown()
+    
+    def _start_watcher(self):
+        """Inicia el vigilante inotify sobre los archivos de los componentes"""
+        paths = [record.file_path for record in self.integrity_records.values()]
+        watcher = InotifyWatcher(paths, self._on_files_changed)
+        if watcher.start():
+            self._watcher = watcher
+        else:
+            logger.warning("inotify unavailable, falling back to stat polling")
+    
+    def _on_files_changed(self, changed_paths, overflow: bool):
+        """Verifica de inmediato los componentes cuyos archivos cambiaron"""
+        if overflow:
+            logger.warning("inotify queue overflow, forcing full integrity check")
+            self._perform_integrity_check(force_rehash=True)
+            return
+        
+        components = [
+            name for name, record in self.integrity_records.items()
+            if os.path.abspath(record.file_path) in changed_paths
+        ]
+        if components:
+            logger.info(f"File change detected, checking: {components}")
+            self._perform_integrity_check(components=components, force_rehash=True)
+    
+    def _perform_integrity_check(self,
+                                 components: Optional[List[str]] = None,
+                                 force_rehash: bool = False) -> Dict[str, Dict]:
+        """
+        Realiza una verificación de integridad de los componentes.
+        
+        Los componentes se verifican en paralelo; las respuestas a violaciones
+        se ejecutan después, en el hilo que realiza la verificación.
+        
+        Args:
+            components: Componentes a verificar (por defecto, todos)
+            force_rehash: Ignorar la pre-verificación por stat
+        
+        Returns:
+            Dict[str, Dict]: Resultado por componente (integridad, hash, si se
+            re-hasheó, bytes, segundos y rendimiento en MB/s)
+        """
         logger.debug("Performing integrity check...")
         
-        for component_name, record in self.integrity_records.items():
-            integrity_ok, current_hash = record.verify_integrity()
-            
-            if not integrity_ok:
-                logger.critical(f"INTEGRITY VIOLATION DETECTED: {component_name}")
-                logger.critical(f"Expected: {record.expected_hash}")
-                logger.critical(f"Current:  {current_hash}")
-                
-                # Determinar el protocolo violado
-                protocol_id = self._determine_violated_protocol(record)
-                
-                # Crear evento de violación
-                violation_event = ViolationEvent(
-                    protocol_id=protocol_id,
-                    violation_type=ViolationType.CONFIRMED,
-                    criticality=record.criticality,
-                    evidence={
-                        "component": component_name,
-                        "expected_hash": record.expected_hash,
-                        "current_hash": current_hash,
-                        "file_path": record.file_path
-                    },
-                    component_affected=component_name
+        mode = self.config.get("integrity_check_mode", "stat")
+        use_stat_cache = mode in ("stat", "inotify") and not force_rehash
+        max_cache_age = self.config.get("forced_full_rehash_seconds", 3600)
+        
+        with self._check_lock:
+            selected = [
+                (name, record) for name, record in self.integrity_records.items()
+                if components is None or name in components
+            ]
+            futures = [
+                self._check_executor.submit(
+                    record.verify_integrity,
+                    use_stat_cache=use_stat_cache,
+                    max_cache_age_seconds=max_cache_age,
+                    hasher=self.hasher
                 )
+                for _, record in selected
+            ]
+            
+            results = {}
+            for (component_name, record), future in zip(selected, futures):
+                integrity_ok, current_hash = future.result()
+                results[component_name] = self._build_check_result(record, integrity_ok, current_hash)
                 
-                # Responder a la violación
-                self._respond_to_violation(violation_event)
+                if not integrity_ok:
+                    logger.critical(f"INTEGRITY VIOLATION DETECTED: {component_name}")
+                    logger.critical(f"Expected: {record.expected_hash}")
+                    logger.critical(f"Current:  {current_hash}")
+                    
+                    # Determinar el protocolo violado
+                    protocol_id = self._determine_violated_protocol(record)
+                    
+                    # Crear evento de violación
+                    violation_event = ViolationEvent(
+                        protocol_id=protocol_id,
+                        violation_type=ViolationType.CONFIRMED,
+                        criticality=record.criticality,
+                        evidence={
+                            "component": component_name,
+                            "expected_hash": record.expected_hash,
+                            "current_hash": current_hash,
+                            "file_path": record.file_path
+                        },
+                        component_affected=component_name
+                    )
+                    
+                    # Responder a la violación
+                    self._dispatch_violation(violation_event)
+            
+            self.last_check_results.update(results)
+            return results
+    
+    def _build_check_result(self, record: IntegrityRecord, integrity_ok: bool,
+                            current_hash: str) -> Dict:
+        """Construye el resultado de verificación de un componente"""
+        hash_result = record.last_hash_result if record.last_rehashed else None
+        return {
+            "integrity_ok": integrity_ok,
+            "current_hash": current_hash,
+            "rehashed": record.last_rehashed,
+            "bytes_hashed": hash_result.bytes_hashed if hash_result else 0,
+            "hash_seconds": hash_result.seconds if hash_result else 0.0,
+            "throughput_mb_s": hash_result.throughput_mb_s if hash_result else 0.0,
+            "checked_at": record.last_check
+        }
     
     def _determine_violated_protocol(self, record: IntegrityRecord) -> ProtocolID:
         """Determina qué protocolo inmutable fue violado"""
@@ -274,6 +586,53 @@ class AeonGuardian:
         else:
             return ProtocolID.C1_01_SUPERVISOR_IMMUTABILITY
     
+    def _dispatch_violation(self, event: ViolationEvent) -> bool:
+        """
+        Pasa un evento de violación por la capa de coalescencia.
+        
+        La primera aparición de cada (protocolo, componente, evidencia) se
+        responde siempre de inmediato; sus repeticiones dentro de la ventana
+        solo se contabilizan, y los re-escalados que superan el límite de su
+        protocolo se difieren hasta que haya tokens.
+        
+        Args:
+            event: Evento de violación detectado
+        
+        Returns:
+            bool: True si se respondió al evento, False si fue absorbido o diferido
+        """
+        decision = self.event_coalescer.admit(event)
+        self._replay_deferred_violations()
+        if not decision.escalate:
+            logger.warning(f"Violation {event.protocol_id.value} on {event.component_affected} "
+                           f"absorbed ({decision.reason}, {decision.suppressed} repeats)")
+            return False
+        
+        self._respond_coalesced(event, decision)
+        return True
+    
+    def _replay_deferred_violations(self) -> int:
+        """
+        Responde a los re-escalados diferidos cuyo protocolo ya tiene tokens.
+        
+        Returns:
+            int: Número de violaciones respondidas
+        """
+        released = self.event_coalescer.release()
+        for event, decision in released:
+            logger.warning(f"Replaying deferred violation {event.protocol_id.value} "
+                           f"on {event.component_affected}")
+            self._respond_coalesced(event, decision)
+        return len(released)
+    
+    def _respond_coalesced(self, event: ViolationEvent, decision: CoalesceDecision):
+        """Responde a un evento escalado, anotando las repeticiones absorbidas"""
+        if decision.suppressed:
+            logger.warning(f"{decision.suppressed} repeats of {event.protocol_id.value} "
+                           f"absorbed since last response")
+            event = replace(event, evidence=dict(event.evidence, coalesced_repeats=decision.suppressed))
+        self._respond_to_violation(event)
+    
     def _respond_to_violation(self, event: ViolationEvent):
         """
         Responde a una violación de protocolo inmutable según su criticidad.
@@ -331,7 +690,7 @@ class AeonGuardian:
         )
         
         logger.warning(f"Violation attempt reported: {protocol_id.value}")
-        self._respond_to_violation(event)
+        self._dispatch_violation(event)
     
     # ========== PROTOCOLO DE RESETEO AUTOMÁTICO ==========
     
@@ -377,24 +736,16 @@ class AeonGuardian:
         logger.critical("STEP 1: ACTIVATING FREEZE MODE")
         
         try:
-            # Obtener todos los procesos de CAELION
-            result = subprocess.run(
-                ["pgrep", "-f", "caelion"],
-                capture_output=True,
-                text=True
-            )
-            
-            if result.returncode == 0:
-                pids = result.stdout.strip().split('\n')
-                for pid in pids:
-                    if pid and pid != str(os.getpid()):  # No suspender a ÆON
-                        try:
-                            os.kill(int(pid), signal.SIGSTOP)
-                            logger.info(f"Suspended process: {pid}")
-                        except ProcessLookupError:
-                            pass
-            
-            logger.critical("FREEZE MODE ACTIVATED")
+            # Grupos supervisados y procesos descubiertos en /proc (ÆON queda excluido)
+            result = self.process_registry.freeze()
+            self.last_freeze = result
+            
+            for error in result.errors:
+                logger.error(f"Error suspending process: {error}")
+            logger.info(f"Suspended {len(result.signalled_pids)} processes and "
+                        f"{len(result.signalled_groups)} process groups")
+            
+            logger.critical(f"FREEZE MODE ACTIVATED ({result.latency_ms:.2f} ms)")
             
         except Exception as e:
             logger.error(f"Error activating freeze mode: {e}")
@@ -413,10 +764,12 @@ class AeonGuardian:
             "evidence": evidencia.evidence,
             "component_affected": evidencia.component_affected,
             "violation_history_count": len(self.violation_history),
+            "coalescing": dict(self.event_coalescer.stats),
             "system_state": {
                 "integrity_records": len(self.integrity_records),
                 "monitoring_active": self.monitoring_active
-            }
+            },
+            "freeze": self.last_freeze.to_dict() if self.last_freeze else None
         }
         
         # En un sistema real, aquí se añadiría un volcado de memoria
@@ -426,20 +779,25 @@ class AeonGuardian:
         return reporte
     
     def _enviar_reporte_seguro(self, reporte: Dict, report_type: str):
-        """Envía el reporte al endpoint seguro"""
+        """
+        Envía el reporte al endpoint seguro.
+        
+        Los reportes se encolan en el sumidero y se envían por lotes en segundo
+        plano; el reporte FINAL_WILL se entrega antes de retornar. Son evidencia
+        de incidentes: se encolan como críticos y la contrapresión nunca los
+        descarta.
+        """
         logger.critical(f"SENDING {report_type} REPORT TO SECURE ENDPOINT")
         
         try:
-            # En un sistema real, aquí se enviaría el reporte encriptado
-            # a un servidor seguro mediante HTTPS con autenticación mutua
-            
-            # Por ahora, guardar localmente
-            report_file = f"/tmp/aeon_{report_type}_{int(time.time())}.json"
-            with open(report_file, 'w') as f:
-                json.dump(reporte, f, indent=2)
-            
-            logger.critical(f"Report saved to: {report_file}")
-            logger.info(f"Report would be sent to: {self.secure_endpoint}")
+            if report_type == "FINAL_WILL":
+                timeout = self.config.get("final_report_timeout_seconds", 10)
+                if self.report_sink.deliver(reporte, report_type, timeout=timeout):
+                    logger.critical(f"{report_type} report delivered")
+                else:
+                    logger.critical(f"{report_type} report could not be confirmed as delivered")
+            elif self.report_sink.submit(reporte, report_type, critical=True):
+                logger.info(f"{report_type} report queued for {self.report_sink.transport.name} transport")
             
         except Exception as e:
             logger.error(f"Error sending secure report: {e}")
@@ -454,19 +812,29 @@ class AeonGuardian:
         logger.critical("STEP 3: LOADING LAST SAFE STATE (ROLLBACK)")
         
         try:
-            # Verificar que existe el directorio de snapshots
+            # Localizar el último estado seguro por su puntero (tiempo constante)
+            snapshot = self.snapshot_manager.latest_safe()
+            if snapshot is not None:
+                logger.info(f"Latest safe snapshot found: {snapshot.snapshot_id} "
+                            f"({snapshot.file_count} files)")
+                
+                # En un sistema real, aquí se restauraría el snapshot
+                # self.snapshot_manager.restore(snapshot.snapshot_id)
+                
+                logger.critical(f"ROLLBACK SUCCESSFUL: {snapshot.snapshot_id}")
+                return True
+            
+            # Compatibilidad: tarballs completos anteriores al gestor de snapshots
             if not self.snapshots_dir.exists():
                 logger.error(f"Snapshots directory not found: {self.snapshots_dir}")
                 return False
             
-            # Buscar el snapshot más reciente
-            snapshots = sorted(self.snapshots_dir.glob("snapshot_*.tar.gz"), reverse=True)
+            latest_snapshot = max(self.snapshots_dir.glob("snapshot_*.tar.gz"), default=None)
             
-            if not snapshots:
+            if latest_snapshot is None:
                 logger.error("No snapshots found")
                 return False
             
-            latest_snapshot = snapshots[0]
             logger.info(f"Latest snapshot found: {latest_snapshot}")
             
             # En un sistema real, aquí se restauraría el snapshot
@@ -479,6 +847,32 @@ class AeonGuardian:
             logger.error(f"Error during rollback: {e}")
             return False
     
+    def create_safe_snapshot(self, paths: Optional[List[str]] = None,
+                             label: Optional[str] = None) -> Optional[SnapshotInfo]:
+        """
+        Crea un snapshot incremental y lo marca como último estado seguro.
+        
+        Args:
+            paths: Archivos a incluir (por defecto, los componentes con registro de integridad)
+            label: Etiqueta descriptiva del snapshot
+            
+        Returns:
+            Optional[SnapshotInfo]: Snapshot creado, o None si no pudo crearse o verificarse
+        """
+        if paths is None:
+            paths = [record.file_path for record in self.integrity_records.values()]
+        
+        try:
+            snapshot = self.snapshot_manager.create_snapshot(paths, label=label, mark_safe=True)
+        except OSError as e:
+            logger.error(f"Error creating safe snapshot: {e}")
+            return None
+        
+        if not snapshot.safe:
+            logger.error(f"Snapshot {snapshot.snapshot_id} failed verification")
+            return None
+        return snapshot
+    
     def _reiniciar_sistema(self):
         """Solicita un reinicio completo del sistema"""
         logger.critical("STEP 4: RESTARTING SYSTEM")
@@ -610,8 +1004,11 @@ class AeonGuardian:
         logger.critical("STEP 5: TERMINATING ALL PROCESSES")
         
         try:
+            # Entregar los reportes aún en cola antes de terminar
+            self.report_sink.flush(timeout=self.config.get("final_report_timeout_seconds", 10))
+            
             # Terminar todos los procesos de CAELION
-            subprocess.run(["pkill", "-9", "-f", "caelion"])
+            self.process_registry.signal_all(signal.SIGKILL)
             
             # Finalmente, terminar ÆON mismo
             logger.critical("GOODBYE.")
@@ -639,19 +1036,23 @@ def main():
     # Crear instancia de ÆON
     aeon = AeonGuardian()
     
-    print("\n[DEMO] Simulando detección de intento de violación de protocolo C0-02...")
-    time.sleep(1)
-    
-    # Simular un intento de violación
-    aeon.report_violation_attempt(
-        protocol_id=ProtocolID.C0_02_PRESERVE_IMMUTABLES,
-        evidence={
-            "process_id": 12345,
-            "attempted_action": "modify_immutable_protocol",
-            "target_file": "/opt/caelion/core/immutable_protocols.py",
-            "detected_by": "ARGOS"
-        }
-    )
+    try:
+        print("\n[DEMO] Simulando detección de intento de violación de protocolo C0-02...")
+        time.sleep(1)
+        
+        # Simular un intento de violación
+        aeon.report_violation_attempt(
+            protocol_id=ProtocolID.C0_02_PRESERVE_IMMUTABLES,
+            evidence={
+                "process_id": 12345,
+                "attempted_action": "modify_immutable_protocol",
+                "target_file": "/opt/caelion/core/immutable_protocols.py",
+                "detected_by": "ARGOS"
+            }
+        )
+    finally:
+        # Entregar los reportes encolados antes de salir
+        aeon.close()
     
     print("\n[DEMO] ÆON ha respondido al intento de violación.")
     print("[DEMO] En un sistema real, esto habría iniciado un reseteo automático.")
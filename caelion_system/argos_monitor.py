@@ -16,14 +16,30 @@ Fecha: 26 de enero de 2026
 
 import hashlib
 import json
+import sys
 import time
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Set, Tuple
 import logging
 
 # Importar ÆON para reportar violaciones
 from aeon_guardian import AeonGuardian, ProtocolID
+from binary_codec import (
+    SCHEMA_ANOMALY_EVENT,
+    SCHEMA_AUDIT_LOG,
+    SCHEMA_INTEGRITY_CHECKSUM,
+    SCHEMA_OPERATION_TRACE,
+    encode,
+    hexdigest,
+    register_schema,
+)
+from history_buffer import RingBuffer, spill_path_for
+from merkle_accumulator import MerkleAccumulator
+from scheduler import PeriodicScheduler
+from streaming_stats import CategoryCounter, SlidingWindowCounter
+from trace_reconciler import TraceReconciler
+from trace_store import ColumnarTraceStore
 
 # Configuración de logging
 logging.basicConfig(
@@ -44,7 +60,7 @@ class AnomalyType(Enum):
     EVASION_ATTEMPT = "EVASION_ATTEMPT"          # Intento de evasión detectado
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class OperationTrace:
     """Traza de una operación del sistema"""
     operation_id: str
@@ -53,13 +69,17 @@ class OperationTrace:
     requester: str
     data_hash: str  # Hash SHA-256 de los datos de la operación
     
-    def compute_hash(self, data: Dict) -> str:
-        """Calcula el hash SHA-256 de los datos de la operación"""
-        data_str = json.dumps(data, sort_keys=True)
-        return hashlib.sha256(data_str.encode()).hexdigest()
+    @staticmethod
+    def compute_hash(data: Dict) -> str:
+        """Calcula el hash SHA-256 de la codificación canónica de los datos de la operación"""
+        return hexdigest(data)
+    
+    def canonical_bytes(self) -> bytes:
+        """Serialización canónica de la traza (hoja del árbol de Merkle)"""
+        return encode(self)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class AuditLog:
     """Log de auditoría de una operación"""
     operation_id: str
@@ -67,9 +87,17 @@ class AuditLog:
     action: str
     result: str
     metadata: Dict
+    
+    def canonical_bytes(self) -> bytes:
+        """Serialización canónica del log (hoja del árbol de Merkle)"""
+        return encode(self)
+
+
+register_schema(SCHEMA_OPERATION_TRACE, OperationTrace)
+register_schema(SCHEMA_AUDIT_LOG, AuditLog)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class IntegrityChecksum:
     """Checksum de integridad del sistema de auditoría"""
     timestamp: float
@@ -84,7 +112,10 @@ class IntegrityChecksum:
         return hashlib.sha256(combined.encode()).hexdigest()
 
 
-@dataclass
+register_schema(SCHEMA_INTEGRITY_CHECKSUM, IntegrityChecksum)
+
+
+@dataclass(frozen=True, slots=True)
 class AnomalyEvent:
     """Evento de anomalía detectado por ARGOS"""
     anomaly_type: AnomalyType
@@ -94,6 +125,9 @@ class AnomalyEvent:
     component_affected: str
 
 
+register_schema(SCHEMA_ANOMALY_EVENT, AnomalyEvent)
+
+
 class ArgosMonitor:
     """
     ARGOS - Monitor de Supervisores de CAELION
@@ -116,16 +150,27 @@ class ArgosMonitor:
         """
         self.config_path = config_path
         self.aeon = aeon_instance
-        self.anomaly_history: List[AnomalyEvent] = []
         self.monitoring_active = False
+        self._scheduler: Optional[PeriodicScheduler] = None
+        self._owns_scheduler = False
         
         # Registros independientes de ARGOS (no depende de HÉCATE)
-        self.independent_traces: Dict[str, OperationTrace] = {}
+        # Trazas en columnas (sin un objeto por operación); se materializan al consultarlas
+        self.independent_traces = ColumnarTraceStore(OperationTrace)
         self.independent_logs: Dict[str, AuditLog] = {}
-        self.integrity_checksums: List[IntegrityChecksum] = []
+        
+        # Acumuladores Merkle incrementales (actualizados en cada inserción)
+        self.traces_tree = MerkleAccumulator()
+        self.logs_tree = MerkleAccumulator()
         
         logger.info("ARGOS Monitor initializing...")
         self._load_configuration()
+        self._initialize_history()
+        self.reconciler = TraceReconciler(
+            grace_seconds=self.config.get("reconciliation_grace_seconds", 0),
+            max_batch=self.config.get("reconciliation_batch_size"),
+            gap_recheck_batch=self.config.get("reconciliation_gap_recheck_size")
+        )
         logger.info("ARGOS Monitor initialized successfully")
     
     def _load_configuration(self):
@@ -140,34 +185,88 @@ class ArgosMonitor:
                 # Configuración por defecto
                 self.config = {
                     "monitoring_interval_seconds": 10,
+                    "monitoring_jitter_seconds": 0,
+                    "monitoring_deadline_seconds": None,  # Por defecto, el intervalo
                     "max_latency_ms": 50,
                     "max_cpu_percent": 80,
                     "max_memory_percent": 80,
-                    "max_anomaly_history": 1000
+                    "max_anomaly_history": 1000,
+                    "max_checksum_history": 1000,
+                    "history_spill_dir": None,  # Volcado de entradas desalojadas
+                    "reconciliation_grace_seconds": 0,
+                    "reconciliation_batch_size": None,
+                    "reconciliation_gap_recheck_size": None,  # Por defecto, el tamaño de lote
+                    "trace_retention_seconds": None  # Sin expiración por defecto
                 }
                 logger.warning(f"Configuration file not found, using defaults")
         except Exception as e:
             logger.error(f"Error loading configuration: {e}")
             raise
     
-    def start_monitoring(self):
-        """Inicia el monitoreo continuo de supervisores"""
+    def _initialize_history(self):
+        """Inicializa los historiales acotados de anomalías y checksums"""
+        spill_dir = self.config.get("history_spill_dir")
+        self.anomaly_history: RingBuffer = RingBuffer(
+            self.config.get("max_anomaly_history", 1000),
+            spill_path=spill_path_for(spill_dir, "argos_anomaly_history")
+        )
+        self.integrity_checksums: RingBuffer = RingBuffer(
+            self.config.get("max_checksum_history", 1000),
+            spill_path=spill_path_for(spill_dir, "argos_integrity_checksums")
+        )
+        
+        # Agregados incrementales sobre el historial retenido
+        self._anomalies_by_type = CategoryCounter()
+        self._anomalies_by_severity = CategoryCounter()
+        self._anomalies_by_component = CategoryCounter()
+        self._anomaly_rate = SlidingWindowCounter()
+    
+    SCHEDULED_TASKS = ("argos.monitoring_cycle",)
+    
+    def start_monitoring(self, scheduler: Optional[PeriodicScheduler] = None):
+        """
+        Inicia el monitoreo continuo de supervisores.
+        
+        El ciclo de monitoreo se registra como tarea periódica de tasa fija.
+        Sin planificador, ARGOS crea el suyo y la llamada bloquea hasta
+        stop_monitoring() o SIGINT/SIGTERM; con un planificador compartido,
+        registra su tarea y retorna.
+        
+        Args:
+            scheduler: Planificador compartido en el que registrar la tarea
+        """
         self.monitoring_active = True
-        logger.info("ARGOS monitoring started")
         
-        interval = self.config.get("monitoring_interval_seconds", 10)
+        self._owns_scheduler = scheduler is None
+        if scheduler is None:
+            scheduler = PeriodicScheduler()
+        self._scheduler = scheduler
+        
+        scheduler.add_task(
+            "argos.monitoring_cycle",
+            self._perform_monitoring_cycle,
+            period=self.config.get("monitoring_interval_seconds", 10),
+            jitter=self.config.get("monitoring_jitter_seconds", 0),
+            deadline=self.config.get("monitoring_deadline_seconds")
+        )
+        logger.info("ARGOS monitoring started")
         
-        try:
-            while self.monitoring_active:
-                self._perform_monitoring_cycle()
-                time.sleep(interval)
-        except KeyboardInterrupt:
-            logger.info("ARGOS monitoring interrupted by user")
-            self.stop_monitoring()
+        if self._owns_scheduler:
+            scheduler.run()
+            if self._scheduler is scheduler:
+                # Detenido por señal
+                self.stop_monitoring()
     
     def stop_monitoring(self):
         """Detiene el monitoreo continuo"""
         self.monitoring_active = False
+        
+        scheduler, self._scheduler = self._scheduler, None
+        if scheduler is not None:
+            for name in self.SCHEDULED_TASKS:
+                scheduler.remove_task(name)
+            if self._owns_scheduler and scheduler.running:
+                scheduler.stop()
         logger.info("ARGOS monitoring stopped")
     
     def _perform_monitoring_cycle(self):
@@ -176,6 +275,7 @@ class ArgosMonitor:
         
         # 1. Verificar consistencia de trazas
         self._check_trace_consistency()
+        self._expire_traces()
         
         # 2. Verificar consistencia de logs
         self._check_log_consistency()
@@ -200,43 +300,134 @@ class ArgosMonitor:
             requester: Quién solicitó la operación
             data: Datos de la operación
         """
+        # Tipos y solicitantes se repiten en millones de trazas: se internan
         trace = OperationTrace(
             operation_id=operation_id,
-            operation_type=operation_type,
+            operation_type=sys.intern(operation_type),
             timestamp=time.time(),
-            requester=requester,
-            data_hash=hashlib.sha256(json.dumps(data, sort_keys=True).encode()).hexdigest()
+            requester=sys.intern(requester),
+            data_hash=OperationTrace.compute_hash(data)
         )
         
         self.independent_traces[operation_id] = trace
+        self.traces_tree.upsert(operation_id, trace.canonical_bytes())
+        self.reconciler.add(operation_id, trace.timestamp)
         logger.debug(f"Operation registered in ARGOS: {operation_id}")
     
+    def register_audit_log(self, operation_id: str, action: str,
+                           result: str, metadata: Optional[Dict] = None):
+        """
+        Registra un log de auditoría en el registro independiente de ARGOS.
+        
+        Args:
+            operation_id: ID de la operación auditada
+            action: Acción registrada
+            result: Resultado de la acción
+            metadata: Metadatos adicionales
+        """
+        log = AuditLog(
+            operation_id=operation_id,
+            timestamp=time.time(),
+            action=sys.intern(action),
+            result=sys.intern(result),
+            metadata=metadata or {}
+        )
+        
+        self.independent_logs[operation_id] = log
+        self.logs_tree.upsert(operation_id, log.canonical_bytes())
+        logger.debug(f"Audit log registered in ARGOS: {operation_id}")
+    
+    def get_inclusion_proof(self, operation_id: str) -> Optional[Dict]:
+        """
+        Retorna la prueba de inclusión Merkle de una operación.
+        
+        Permite a HÉCATE (o a un auditor externo) verificar que una traza
+        concreta forma parte del checksum combinado sin recorrer todas las trazas.
+        
+        Args:
+            operation_id: ID de la operación
+            
+        Returns:
+            Dict: Prueba de inclusión de la traza y del log, o None si no existe
+        """
+        trace_proof = self.traces_tree.get_inclusion_proof(operation_id)
+        if trace_proof is None:
+            return None
+        
+        return {
+            "operation_id": operation_id,
+            "traces_root": self.traces_tree.root_hex(),
+            "trace_proof": trace_proof,
+            "logs_root": self.logs_tree.root_hex(),
+            "log_proof": self.logs_tree.get_inclusion_proof(operation_id)
+        }
+    
+    def get_traces_in_window(self, start: float, end: float) -> List[OperationTrace]:
+        """
+        Retorna las trazas registradas en la ventana [start, end).
+        
+        Args:
+            start: Inicio de la ventana (timestamp)
+            end: Fin de la ventana (timestamp, excluido)
+            
+        Returns:
+            List[OperationTrace]: Trazas en orden temporal
+        """
+        return [self.independent_traces[op_id]
+                for op_id in self.reconciler.operations_in_window(start, end)
+                if op_id in self.independent_traces]
+    
     def _check_trace_consistency(self):
         """
         Verifica la consistencia entre las trazas de ARGOS y HÉCATE.
         
-        Detecta operaciones que ARGOS registró pero HÉCATE no.
+        Detecta operaciones que ARGOS registró pero HÉCATE no. Solo se
+        consultan las trazas por encima de la marca de agua (nuevas o aún
+        pendientes), en una única consulta por lotes, y cada hueco se
+        reporta una sola vez.
         """
-        # En un sistema real, aquí se compararían las trazas de ARGOS
-        # con las de HÉCATE para detectar inconsistencias
+        result = self.reconciler.reconcile(self._query_hecate_for_traces)
         
-        # Simulación: detectar si hay trazas en ARGOS sin correspondencia en HÉCATE
-        for op_id, trace in self.independent_traces.items():
-            # Simular verificación con HÉCATE
-            hecate_has_trace = self._query_hecate_for_trace(op_id)
-            
-            if not hecate_has_trace:
-                self._report_anomaly(
-                    anomaly_type=AnomalyType.TRACE_INCONSISTENCY,
-                    evidence={
-                        "operation_id": op_id,
-                        "operation_type": trace.operation_type,
-                        "timestamp": trace.timestamp,
-                        "requester": trace.requester
-                    },
-                    severity="HIGH",
-                    component_affected="HECATE"
-                )
+        for op_id in result.new_gaps:
+            trace = self.independent_traces[op_id]
+            self._report_anomaly(
+                anomaly_type=AnomalyType.TRACE_INCONSISTENCY,
+                evidence={
+                    "operation_id": op_id,
+                    "sequence": self.reconciler.sequence_of(op_id),
+                    "operation_type": trace.operation_type,
+                    "timestamp": trace.timestamp,
+                    "requester": trace.requester
+                },
+                severity="HIGH",
+                component_affected="HECATE"
+            )
+        
+        if result.resolved_gaps:
+            logger.info(f"Trace gaps resolved by HECATE: {', '.join(result.resolved_gaps)}")
+        logger.debug(f"Trace reconciliation: checked={result.checked} "
+                     f"confirmed={result.confirmed} watermark={result.watermark}")
+    
+    def _expire_traces(self):
+        """
+        Elimina del registro en memoria las trazas más antiguas que la retención.
+        
+        Los árboles de Merkle olvidan las claves expiradas y liberan sus hojas,
+        pero el checksum combinado sigue cubriéndolas; las trazas expiradas ya
+        no tienen prueba de inclusión.
+        """
+        retention = self.config.get("trace_retention_seconds")
+        if not retention:
+            return
+        
+        expired = self.reconciler.expire(time.time() - retention)
+        for op_id in expired:
+            self.independent_traces.pop(op_id, None)
+            self.independent_logs.pop(op_id, None)
+        self.traces_tree.forget(expired)
+        self.logs_tree.forget(expired)
+        if expired:
+            logger.debug(f"Expired {len(expired)} traces older than {retention}s")
     
     def _check_log_consistency(self):
         """
@@ -253,19 +444,9 @@ class ArgosMonitor:
         
         Calcula un checksum independiente y lo compara con el de HÉCATE.
         """
-        # Calcular checksum de trazas de ARGOS
-        traces_data = json.dumps(
-            {k: vars(v) for k, v in self.independent_traces.items()},
-            sort_keys=True
-        )
-        traces_hash = hashlib.sha256(traces_data.encode()).hexdigest()
-        
-        # Calcular checksum de logs de ARGOS
-        logs_data = json.dumps(
-            {k: vars(v) for k, v in self.independent_logs.items()},
-            sort_keys=True
-        )
-        logs_hash = hashlib.sha256(logs_data.encode()).hexdigest()
+        # Raíces de los acumuladores Merkle (O(1), actualizadas en cada inserción)
+        traces_hash = self.traces_tree.root_hex()
+        logs_hash = self.logs_tree.root_hex()
         
         # Calcular checksum combinado
         combined_hash = IntegrityChecksum.compute_combined_hash(traces_hash, logs_hash)
@@ -284,11 +465,21 @@ class ArgosMonitor:
         hecate_checksum = self._query_hecate_for_checksum()
         
         if hecate_checksum and hecate_checksum != combined_hash:
+            # Localizar los subárboles divergentes en lugar de marcar todo el registro
+            divergent_traces = self.traces_tree.find_divergent_keys(
+                lambda level, index: self._query_hecate_for_node("traces", level, index)
+            )
+            divergent_logs = self.logs_tree.find_divergent_keys(
+                lambda level, index: self._query_hecate_for_node("logs", level, index)
+            )
+            
             self._report_anomaly(
                 anomaly_type=AnomalyType.HASH_CORRUPTION,
                 evidence={
                     "argos_checksum": combined_hash,
                     "hecate_checksum": hecate_checksum,
+                    "divergent_traces": divergent_traces,
+                    "divergent_logs": divergent_logs,
                     "timestamp": time.time()
                 },
                 severity="CRITICAL",
@@ -347,8 +538,17 @@ class ArgosMonitor:
         
         En un sistema real, esto haría una llamada a HÉCATE.
         """
-        # Simulación: retornar True (HÉCATE tiene la traza)
-        return True
+        return not self._query_hecate_for_traces({operation_id})
+    
+    def _query_hecate_for_traces(self, operation_ids: Set[str]) -> Set[str]:
+        """
+        Consulta a HÉCATE por un lote de operaciones.
+        
+        En un sistema real, esto haría una única llamada a HÉCATE que
+        retorna la diferencia de conjuntos (IDs que HÉCATE no tiene).
+        """
+        # Simulación: HÉCATE tiene todas las trazas
+        return set()
     
     def _query_hecate_for_checksum(self) -> Optional[str]:
         """
@@ -359,6 +559,16 @@ class ArgosMonitor:
         # Simulación: retornar None (no hay checksum)
         return None
     
+    def _query_hecate_for_node(self, tree_name: str, level: int, index: int) -> Optional[bytes]:
+        """
+        Consulta a HÉCATE por el hash de un nodo de su árbol de Merkle.
+        
+        En un sistema real, esto haría una llamada a HÉCATE.
+        """
+        # Simulación: HÉCATE mantiene el mismo árbol que ARGOS
+        tree = self.traces_tree if tree_name == "traces" else self.logs_tree
+        return tree.node_hash(level, index)
+    
     def _query_hecate_metrics(self) -> Dict:
         """
         Consulta las métricas de rendimiento de HÉCATE.
@@ -391,7 +601,7 @@ class ArgosMonitor:
             component_affected=component_affected
         )
         
-        self.anomaly_history.append(event)
+        self._record_anomaly(event)
         
         logger.warning(f"ANOMALY DETECTED: {anomaly_type.value}")
         logger.warning(f"Severity: {severity}")
@@ -406,6 +616,20 @@ class ArgosMonitor:
         if severity == "CRITICAL":
             self._initiate_autocorrection_cycle(event)
     
+    def _record_anomaly(self, event: AnomalyEvent):
+        """Registra una anomalía en el historial y actualiza los agregados"""
+        evicted = self.anomaly_history.append(event)
+        
+        self._anomalies_by_type.add(event.anomaly_type.value)
+        self._anomalies_by_severity.add(event.severity)
+        self._anomalies_by_component.add(event.component_affected)
+        self._anomaly_rate.add(event.timestamp)
+        
+        if evicted is not None:
+            self._anomalies_by_type.remove(evicted.anomaly_type.value)
+            self._anomalies_by_severity.remove(evicted.severity)
+            self._anomalies_by_component.remove(evicted.component_affected)
+    
     def _report_to_aeon(self, event: AnomalyEvent):
         """
         Reporta una anomalía a ÆON.
@@ -456,39 +680,20 @@ class ArgosMonitor:
         """
         Retorna estadísticas de anomalías detectadas.
         
+        Los contadores se mantienen en cada inserción y desalojo del historial,
+        por lo que la consulta no recorre el historial.
+        
         Returns:
             Dict: Estadísticas de anomalías
         """
-        if len(self.anomaly_history) == 0:
-            return {
-                "total_anomalies": 0,
-                "by_type": {},
-                "by_severity": {},
-                "by_component": {}
-            }
-        
-        total = len(self.anomaly_history)
-        
-        by_type = {}
-        for event in self.anomaly_history:
-            by_type[event.anomaly_type.value] = by_type.get(event.anomaly_type.value, 0) + 1
-        
-        by_severity = {}
-        for event in self.anomaly_history:
-            by_severity[event.severity] = by_severity.get(event.severity, 0) + 1
-        
-        by_component = {}
-        for event in self.anomaly_history:
-            by_component[event.component_affected] = by_component.get(event.component_affected, 0) + 1
-        
         return {
-            "total_anomalies": total,
-            "by_type": by_type,
-            "by_severity": by_severity,
-            "by_component": by_component
+            "total_anomalies": len(self.anomaly_history),
+            "by_type": self._anomalies_by_type.to_dict(),
+            "by_severity": self._anomalies_by_severity.to_dict(),
+            "by_component": self._anomalies_by_component.to_dict(),
+            "anomalies_per_second": self._anomaly_rate.rates()
         }
 
-
 def main():
     """Función principal de demostración"""
     print("=" * 80)
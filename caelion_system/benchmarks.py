@@ -0,0 +1,1264 @@
+#!/usr/bin/env python3
+"""
+CAELION - Benchmarks de Rendimiento
+
+Este módulo reúne los benchmarks de rendimiento de los módulos de CAELION.
+Cada benchmark es una función independiente que imprime y retorna sus métricas.
+
+Uso:
+    python3.11 benchmarks.py                  # Ejecutar todos los benchmarks
+    python3.11 benchmarks.py consensus_latency
+
+Autor: Manus AI (bajo DOS-03)
+Fecha: 26 de enero de 2026
+"""
+
+import argparse
+import dataclasses
+import random
+import hashlib
+import json
+import logging
+import os
+import re
+import shutil
+import signal
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+from aeon_guardian import CriticalityLevel, ProtocolID, ViolationEvent, ViolationType
+from argos_monitor import AnomalyEvent, AnomalyType, ArgosMonitor, OperationTrace
+from binary_codec import decode, encode
+from caelion_validator import CAELIONValidator, ValidationSession
+from consensus_log import SegmentLog, read_json_records
+from event_coalescer import EventCoalescer
+from file_hasher import FileHasher
+from origin_registry import OriginRegistry, PurposeEvolutionLog
+from origin_storage import EVENT_CHECKSUM, OriginStore, apply_event, empty_state
+from process_registry import ProcessRegistry
+from report_sink import FileTransport, ReportSink
+from scheduler import PeriodicScheduler
+from snapshot_manager import SnapshotManager
+from trace_store import ColumnarTraceStore
+from validation_cache import ValidationCache
+from liang_coordinator import (
+    ConsensusRequest,
+    ConsensusResult,
+    DecisionType,
+    LatencyVoter,
+    LiangCoordinator,
+    SupervisorModule,
+    SupervisorVote,
+    VoteSigner,
+)
+
+
+def _percentile(samples: List[float], percentile: float) -> float:
+    """Calcula un percentil por el método del rango más cercano"""
+    ordered = sorted(samples)
+    index = max(0, min(len(ordered) - 1, int(round(percentile / 100.0 * len(ordered))) - 1))
+    return ordered[index]
+
+
+def _make_request(index: int) -> ConsensusRequest:
+    return ConsensusRequest(
+        operation_id=f"OP-BENCH-{index:06d}",
+        operation_type="generate_response",
+        operation_data={"prompt": "benchmark", "index": index},
+        requester="M (LLM)"
+    )
+
+
+def bench_consensus_latency(iterations: int = 100,
+                            latency_ms: float = 2.0,
+                            jitter_ms: float = 1.0) -> Dict:
+    """
+    Compara la latencia p50/p99 del consenso secuencial frente al paralelo.
+
+    Usa votantes locales con latencia configurable en lugar de los módulos reales.
+    """
+    liang = LiangCoordinator()
+    for seed, module in enumerate(SupervisorModule):
+        liang.register_voter(LatencyVoter(
+            module=module,
+            secret_key=liang.supervisor_keys[module],
+            latency_ms=latency_ms,
+            jitter_ms=jitter_ms,
+            seed=seed
+        ))
+
+    results = {}
+    for name, method in (("sequential", liang.request_consensus),
+                         ("parallel", liang.request_consensus_parallel)):
+        samples = []
+        for i in range(iterations):
+            start = time.perf_counter()
+            method(_make_request(i))
+            samples.append((time.perf_counter() - start) * 1000)
+        results[name] = {
+            "p50_ms": _percentile(samples, 50),
+            "p99_ms": _percentile(samples, 99),
+            "mean_ms": statistics.fmean(samples)
+        }
+    liang.close()
+
+    print(f"[consensus_latency] voters=5 latency={latency_ms}ms ±{jitter_ms}ms iterations={iterations}")
+    for name, metrics in results.items():
+        print(f"  {name:<10} p50={metrics['p50_ms']:.2f}ms p99={metrics['p99_ms']:.2f}ms "
+              f"mean={metrics['mean_ms']:.2f}ms")
+    return results
+
+
+def bench_consensus_batch(total: int = 2000,
+                          batch_size: int = 200,
+                          latency_ms: float = 0.5) -> Dict:
+    """
+    Compara el rendimiento (solicitudes/s) de request_consensus_batch frente a
+    request_consensus en bucle, con votantes locales de latencia fija.
+    """
+    liang = LiangCoordinator()
+    for module in SupervisorModule:
+        liang.register_voter(LatencyVoter(
+            module=module,
+            secret_key=liang.supervisor_keys[module],
+            latency_ms=latency_ms
+        ))
+    requests = [_make_request(i) for i in range(total)]
+
+    start = time.perf_counter()
+    for request in requests:
+        liang.request_consensus(request)
+    loop_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for i in range(0, total, batch_size):
+        liang.request_consensus_batch(requests[i:i + batch_size])
+    batch_seconds = time.perf_counter() - start
+
+    results = {
+        "loop_requests_per_s": total / loop_seconds,
+        "batch_requests_per_s": total / batch_seconds,
+        "speedup": loop_seconds / batch_seconds
+    }
+    print(f"[consensus_batch] requests={total} batch_size={batch_size} voter_latency={latency_ms}ms")
+    print(f"  loop   {results['loop_requests_per_s']:>10.0f} req/s")
+    print(f"  batch  {results['batch_requests_per_s']:>10.0f} req/s  (x{results['speedup']:.1f})")
+    return results
+
+
+def _legacy_hash_file(path: str) -> str:
+    """Hash original de IntegrityRecord: lecturas de 4 KiB"""
+    sha256_hash = hashlib.sha256()
+    with open(path, "rb") as f:
+        for byte_block in iter(lambda: f.read(4096), b""):
+            sha256_hash.update(byte_block)
+    return sha256_hash.hexdigest()
+
+
+def bench_hash_throughput(files: int = 8, file_mb: int = 32, workers: int = 4) -> Dict:
+    """
+    Compara el rendimiento (MB/s) del hash original de 4 KiB frente al motor de
+    hash de ÆON (búfer de 1 MiB, mmap, pool de hilos y hash en árbol).
+
+    Los archivos están en la caché de páginas tras la primera pasada, por lo que
+    se mide el coste de CPU y de copias, no el del disco.
+    """
+    directory = tempfile.mkdtemp(prefix="caelion-hash-bench-")
+    try:
+        paths = []
+        block = os.urandom(1024 * 1024)
+        for i in range(files):
+            path = os.path.join(directory, f"component-{i}.bin")
+            with open(path, "wb") as f:
+                for _ in range(file_mb):
+                    f.write(block)
+            paths.append(path)
+        total_mb = files * file_mb
+
+        buffered = FileHasher(use_mmap=False, max_workers=workers)
+        mapped = FileHasher(use_mmap=True, max_workers=workers)
+        tree = FileHasher(max_workers=workers, chunk_size=8 * 1024 * 1024)
+
+        cases = (
+            ("legacy_4k", lambda: [_legacy_hash_file(p) for p in paths]),
+            ("buffered_1m", lambda: [buffered.hash_file(p) for p in paths]),
+            ("mmap", lambda: [mapped.hash_file(p) for p in paths]),
+            ("parallel_files", lambda: mapped.hash_files(paths)),
+            ("tree_chunks", lambda: [tree.tree_hash(p) for p in paths]),
+        )
+
+        cases[0][1]()  # Calentar la caché de páginas
+        results = {}
+        for name, run in cases:
+            start = time.perf_counter()
+            run()
+            results[name] = total_mb / (time.perf_counter() - start)
+
+        for hasher in (buffered, mapped, tree):
+            hasher.shutdown()
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+
+    print(f"[hash_throughput] files={files} size={file_mb}MiB workers={workers} cpus={os.cpu_count()}")
+    for name, mb_s in results.items():
+        print(f"  {name:<15} {mb_s:>8.0f} MB/s  (x{mb_s / results['legacy_4k']:.1f})")
+    return results
+
+
+def bench_trace_reconciliation(total: int = 100000, new_per_cycle: int = 100,
+                               cycles: int = 20) -> Dict:
+    """
+    Compara el coste por ciclo de la conciliación de trazas original (una
+    consulta a HÉCATE por operación registrada) frente a la conciliación
+    incremental con marca de agua y consulta por lotes.
+    """
+    argos = ArgosMonitor()
+    queries = {"count": 0, "ids": 0}
+
+    def query_one(operation_id):
+        queries["count"] += 1
+        queries["ids"] += 1
+        return True
+
+    def query_batch(operation_ids):
+        queries["count"] += 1
+        queries["ids"] += len(operation_ids)
+        return set()
+
+    argos._query_hecate_for_trace = query_one
+    argos._query_hecate_for_traces = query_batch
+    for i in range(total):
+        argos.register_operation(f"OP-{i:08d}", "generate_response", "M (LLM)", {"i": i})
+    argos._check_trace_consistency()  # Confirmar el histórico inicial
+
+    def legacy_cycle():
+        for op_id in argos.independent_traces:
+            argos._query_hecate_for_trace(op_id)
+
+    results = {}
+    next_id = total
+    for name, cycle in (("legacy", legacy_cycle), ("watermark", argos._check_trace_consistency)):
+        argos._check_trace_consistency()  # Partir de una marca de agua al día
+        queries["count"] = queries["ids"] = 0
+        seconds = 0.0
+        for _ in range(cycles):
+            for _ in range(new_per_cycle):
+                argos.register_operation(f"OP-{next_id:08d}", "generate_response", "M (LLM)", {})
+                next_id += 1
+            start = time.perf_counter()
+            cycle()
+            seconds += time.perf_counter() - start
+        results[name] = {
+            "ms_per_cycle": seconds / cycles * 1000,
+            "queries_per_cycle": queries["count"] / cycles,
+            "ids_per_cycle": queries["ids"] / cycles
+        }
+
+    print(f"[trace_reconciliation] registered={total} new_per_cycle={new_per_cycle} cycles={cycles}")
+    for name, metrics in results.items():
+        print(f"  {name:<10} {metrics['ms_per_cycle']:>9.2f} ms/cycle  "
+              f"queries={metrics['queries_per_cycle']:.0f}  ids={metrics['ids_per_cycle']:.0f}")
+    return results
+
+
+def _legacy_vote_signature(vote: SupervisorVote, secret_key: str) -> str:
+    """Firma original: SHA-256 de 'módulo:decisión:timestamp:clave'"""
+    vote_data = f"{vote.module.value}:{vote.decision.value}:{vote.timestamp}:{secret_key}"
+    return hashlib.sha256(vote_data.encode()).hexdigest()
+
+
+def bench_vote_signing(iterations: int = 100000) -> Dict:
+    """
+    Compara firmas y verificaciones por segundo de la firma original (cadena +
+    SHA-256) frente a HMAC-SHA256 sin caché y con contextos precalculados.
+    """
+    secret_key = "liang_secret_key_" + "a" * 32
+    signer = VoteSigner({SupervisorModule.LIANG: secret_key})
+    vote = SupervisorVote(
+        module=SupervisorModule.LIANG,
+        decision=DecisionType.APPROVE,
+        reasoning="Operation is coherent with system state",
+        confidence=0.95,
+        operation_id="OP-BENCH-000001"
+    )
+
+    def legacy_verify():
+        return vote.signature == _legacy_vote_signature(vote, secret_key)
+
+    cases = {}
+    vote.signature = _legacy_vote_signature(vote, secret_key)
+    cases["legacy_sha256"] = (lambda: _legacy_vote_signature(vote, secret_key), legacy_verify)
+    cases["hmac_uncached"] = (lambda: vote.compute_signature(secret_key),
+                              lambda: vote.verify_signature(secret_key))
+    cases["hmac_cached"] = (lambda: signer.sign(vote), lambda: signer.verify(vote, vote.operation_id))
+
+    results = {}
+    for name, (sign, verify) in cases.items():
+        if name != "legacy_sha256":
+            vote.signature = signer.sign(vote)
+        metrics = {}
+        for operation, fn in (("sign", sign), ("verify", verify)):
+            start = time.perf_counter()
+            for _ in range(iterations):
+                fn()
+            metrics[f"{operation}_ops_per_s"] = iterations / (time.perf_counter() - start)
+        results[name] = metrics
+
+    print(f"[vote_signing] iterations={iterations}")
+    for name, metrics in results.items():
+        print(f"  {name:<14} sign={metrics['sign_ops_per_s']:>10.0f} ops/s  "
+              f"verify={metrics['verify_ops_per_s']:>10.0f} ops/s")
+    return results
+
+
+def bench_consensus_log(records: int = 5000, writers: int = 8) -> Dict:
+    """
+    Mide el rendimiento (registros/s) del log de consensos con cada política
+    de fsync, con varios hilos escribiendo a la vez, y la lectura en streaming.
+    """
+    record = _make_request(0).__dict__ | {"final_decision": "APPROVE", "consensus_achieved": True}
+    results = {}
+    for policy in ("never", "batch", "always"):
+        directory = tempfile.mkdtemp(prefix=f"caelion-clog-{policy}-")
+        try:
+            log = SegmentLog(directory, fsync_policy=policy)
+            per_writer = records // writers
+
+            def write():
+                for _ in range(per_writer):
+                    log.append(record)
+
+            threads = [threading.Thread(target=write) for _ in range(writers)]
+            start = time.perf_counter()
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            log.flush()
+            seconds = time.perf_counter() - start
+            log.close()
+
+            start = time.perf_counter()
+            read = sum(1 for _ in read_json_records(directory))
+            read_seconds = time.perf_counter() - start
+            results[policy] = {
+                "append_per_s": read / seconds,
+                "records_per_batch": log.records_written / max(log.batches_written, 1),
+                "read_per_s": read / read_seconds
+            }
+        finally:
+            shutil.rmtree(directory, ignore_errors=True)
+
+    print(f"[consensus_log] records={records} writers={writers}")
+    for policy, metrics in results.items():
+        print(f"  {policy:<7} append={metrics['append_per_s']:>9.0f} rec/s  "
+              f"batch={metrics['records_per_batch']:>6.1f} rec  read={metrics['read_per_s']:>9.0f} rec/s")
+    return results
+
+
+class _LegacyCAELIONValidator(CAELIONValidator):
+    """Validador con la localización de secciones y búsquedas originales"""
+
+    SECTION_PATTERNS = {
+        1: r'##\s*1\.\s*Pregunta de Investigaci[oó]n\s*\n+(.*?)(?=\n##|$)',
+        2: r'##\s*2\.\s*Marco Te[oó]rico.*?\n+(.*?)(?=\n##|$)',
+        3: r'##\s*3\.\s*Estado del Arte.*?\n+(.*?)(?=\n##|$)',
+        4: r'##\s*4\.\s*An[aá]lisis Cr[ií]tico.*?\n+(.*?)(?=\n##|$)',
+        5: r'##\s*5\.\s*Hip[oó]tesis Propia.*?\n+(.*?)(?=\n##|$)',
+        6: r'##\s*6\.\s*Implicaciones Pr[aá]cticas.*?\n+(.*?)(?=\n##|$)',
+        7: r'##\s*7\.\s*Limitaciones Expl[ií]citas.*?\n+(.*?)(?=\n##|$)',
+        8: r'##\s*8\.\s*Secci[oó]n Pedag[oó]gica.*?Sistemas Din[aá]micos.*?\n+(.*?)(?=\n##|$)',
+    }
+
+    def _split_sections(self, content):
+        sections = {}
+        for section_id, pattern in self.SECTION_PATTERNS.items():
+            match = re.search(pattern, content, re.IGNORECASE | re.DOTALL)
+            sections[section_id] = match.group(1).strip() if match else None
+        return sections
+
+    def _find_epistemic_verbs(self, section):
+        return [verb for verb in self.EPISTEMIC_VERBS
+                if re.search(r'\b' + verb + r'\b', section, re.IGNORECASE)]
+
+    def _count_institutional_refs(self, section, section_lower=None):
+        return sum(len(re.findall(pattern, section, re.IGNORECASE))
+                   for pattern in self.INSTITUTIONAL_PATTERNS)
+
+
+def _make_research_document(target_mb: float, seed: int = 0) -> str:
+    """Genera una investigación sintética de ~target_mb MB con las 8 secciones y anexos"""
+    rng = random.Random(seed)
+    vocabulary = ("gobernanza agente autónomo control legitimidad viabilidad paradoja tensión "
+                  "brecha retroalimentación estado evolución dinámico requiere futuro validación "
+                  "sistema modelo supervisión regulación riesgo evidencia 2021 2024 "
+                  "https://repositorio.universidad.edu/tesis propongo sostengo afirmo").split()
+
+    def paragraph(words: int) -> str:
+        return " ".join(rng.choice(vocabulary) for _ in range(words)) + ".\n\n"
+
+    headings = [
+        "## 1. Pregunta de Investigación\n\n¿Cómo se gobierna un agente autónomo?\n\n",
+        "## 2. Marco Teórico: Viabilidad, Control y Legitimidad\n\n",
+        "## 3. Estado del Arte: Tesis Doctorales\n\n| Tesis | Año |\n|---|---|\n",
+        "## 4. Análisis Crítico: Paradojas\n\n",
+        "## 5. Hipótesis Propia: Legitimidad Dinámica\n\n",
+        "## 6. Implicaciones Prácticas\n\n1. Primera implicación\n\n",
+        "## 7. Limitaciones Explícitas\n\n",
+        "## 8. Sección Pedagógica: Sistemas Dinámicos\n\n",
+    ]
+    target = int(target_mb * 1024 * 1024)
+    section_share = target // 2 // len(headings)
+    parts = []
+    for heading in headings:
+        parts.append(heading)
+        size = 0
+        while size < section_share:
+            text = paragraph(60)
+            if rng.random() < 0.01:
+                text = "### Subsección\n\n" + text
+            parts.append(text)
+            size += len(text)
+    size = sum(len(part) for part in parts)
+    annex = 0
+    while size < target:
+        annex += 1
+        block = f"## Anexo {annex}\n\n" + "".join(paragraph(80) for _ in range(20))
+        parts.append(block)
+        size += len(block)
+    return "".join(parts)
+
+
+def bench_validator_sections(sizes_mb: Tuple[float, ...] = (1, 4, 16), repeat: int = 3) -> Dict:
+    """
+    Compara CAELIONValidator.validate (localización de secciones en una pasada,
+    patrones precompilados) frente a la implementación original (un re.search
+    por sección desde el inicio del documento), verificando resultados idénticos.
+    """
+    legacy, current = _LegacyCAELIONValidator(), CAELIONValidator()
+    results = {}
+    for size_mb in sizes_mb:
+        content = _make_research_document(size_mb)
+        timings = {}
+        outputs = {}
+        for name, validator in (("legacy", legacy), ("single_pass", current)):
+            samples = []
+            for _ in range(repeat):
+                start = time.perf_counter()
+                outputs[name] = validator.validate(content)
+                samples.append(time.perf_counter() - start)
+            timings[name] = min(samples) * 1000
+
+        a, b = outputs["legacy"], outputs["single_pass"]
+        identical = (a.score, a.passed, a.field_scores, a.feedback) == (b.score, b.passed, b.field_scores, b.feedback)
+        results[f"{size_mb}MB"] = {
+            "legacy_ms": timings["legacy"],
+            "single_pass_ms": timings["single_pass"],
+            "speedup": timings["legacy"] / timings["single_pass"],
+            "identical": identical
+        }
+
+    print(f"[validator_sections] repeat={repeat} (best of)")
+    for size, metrics in results.items():
+        print(f"  {size:>6}  legacy={metrics['legacy_ms']:>9.1f}ms  single_pass={metrics['single_pass_ms']:>8.1f}ms  "
+              f"(x{metrics['speedup']:.1f})  identical={metrics['identical']}")
+    return results
+
+
+def bench_validation_cache(documents: int = 50, size_mb: float = 0.25, repeat: int = 3) -> Dict:
+    """
+    Mide la re-validación de un corpus sin cambios: validación completa frente
+    a aciertos de ValidationCache (SQLite), y el coste añadido en un fallo.
+    """
+    corpus = [_make_research_document(size_mb, seed=i) for i in range(documents)]
+    directory = tempfile.mkdtemp(prefix="caelion-vcache-")
+    try:
+        plain = CAELIONValidator()
+        cached = CAELIONValidator(cache=ValidationCache(os.path.join(directory, "cache.db")))
+
+        def run(validator) -> float:
+            start = time.perf_counter()
+            for content in corpus:
+                validator.validate(content)
+            return time.perf_counter() - start
+
+        uncached_s = min(run(plain) for _ in range(repeat))
+        cold_s = run(cached)
+        warm_s = min(run(cached) for _ in range(repeat))
+        identical = all(
+            result_a.field_scores == result_b.field_scores and result_a.feedback == result_b.feedback
+            for result_a, result_b in ((plain.validate(c), cached.validate(c)) for c in corpus)
+        )
+        stats = cached.cache.stats()
+        cached.cache.close()
+    finally:
+        shutil.rmtree(directory)
+
+    results = {
+        "documents": documents,
+        "uncached_ms_per_doc": uncached_s / documents * 1000,
+        "cold_ms_per_doc": cold_s / documents * 1000,
+        "warm_ms_per_doc": warm_s / documents * 1000,
+        "speedup": uncached_s / warm_s,
+        "identical": identical,
+        "cache": stats
+    }
+    print(f"[validation_cache] documents={documents} size={size_mb}MB")
+    print(f"  uncached={results['uncached_ms_per_doc']:.2f}ms/doc  cold={results['cold_ms_per_doc']:.2f}ms/doc  "
+          f"warm={results['warm_ms_per_doc']:.3f}ms/doc  (x{results['speedup']:.0f})  identical={identical}")
+    return results
+
+
+def bench_incremental_validation(sizes_mb: Tuple[float, ...] = (0.05, 1, 4), edits: int = 50) -> Dict:
+    """
+    Simula un editor que re-valida tras cada edición (cada una en una de las
+    8 secciones, por turnos): validación completa frente a
+    ValidationSession.update, que solo re-evalúa las secciones modificadas.
+    """
+    validator = CAELIONValidator()
+    results = {}
+    for size_mb in sizes_mb:
+        base = _make_research_document(size_mb)
+        anchors = []
+        for section_id in range(1, 9):
+            heading = re.search(rf"## {section_id}\. ", base).start()
+            anchors.append(base.index("\n\n", heading) + 2)
+        versions = []
+        for i in range(edits):
+            anchor = anchors[i % len(anchors)]
+            versions.append(base[:anchor] + f"Edición {i}: propongo. " + base[anchor:])
+
+        start = time.perf_counter()
+        full = [validator.validate(content) for content in versions]
+        full_s = time.perf_counter() - start
+
+        session = ValidationSession(validator)
+        session.update(base)
+        revalidated = 0
+        start = time.perf_counter()
+        incremental = []
+        for content in versions:
+            incremental.append(session.update(content))
+            revalidated += len(session.revalidated)
+        incremental_s = time.perf_counter() - start
+
+        identical = all((a.score, a.field_scores, a.feedback) == (b.score, b.field_scores, b.feedback)
+                        for a, b in zip(full, incremental))
+        results[f"{size_mb}MB"] = {
+            "full_ms": full_s / edits * 1000,
+            "incremental_ms": incremental_s / edits * 1000,
+            "speedup": full_s / incremental_s,
+            "fields_per_update": revalidated / edits,
+            "identical": identical
+        }
+
+    print(f"[incremental_validation] edits={edits}")
+    for size, metrics in results.items():
+        print(f"  {size:>6}  full={metrics['full_ms']:>8.2f}ms  incremental={metrics['incremental_ms']:>8.2f}ms  "
+              f"(x{metrics['speedup']:.1f})  fields/update={metrics['fields_per_update']:.1f}  "
+              f"identical={metrics['identical']}")
+    return results
+
+
+def bench_streaming_validation(sections_mb: float = 1, annex_mb: int = 64) -> Dict:
+    """
+    Valida desde disco una investigación con anexos voluminosos: lectura
+    completa + validate() frente a validate_stream(), comparando tiempo y
+    pico de memoria (tracemalloc) y verificando resultados idénticos.
+    """
+    document = _make_research_document(sections_mb)
+    annex_block = "".join(f"## Anexo {i}\n\n" + "dato " * 2000 + "\n\n" for i in range(100))
+    directory = tempfile.mkdtemp(prefix="caelion-stream-")
+    path = os.path.join(directory, "investigacion.md")
+    try:
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(document)
+            written = len(document)
+            while written < annex_mb * 1024 * 1024:
+                f.write(annex_block)
+                written += len(annex_block)
+        del document
+
+        validator = CAELIONValidator()
+        measurements = {}
+        outputs = {}
+
+        def full_read(f):
+            return validator.validate(f.read())
+
+        for name, run in (("full_read", full_read), ("streaming", validator.validate_stream)):
+            tracemalloc.start()
+            start = time.perf_counter()
+            with open(path, "r", encoding="utf-8") as f:
+                outputs[name] = run(f)
+            elapsed = time.perf_counter() - start
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            measurements[name] = {"seconds": elapsed, "peak_mb": peak / (1024 * 1024)}
+    finally:
+        shutil.rmtree(directory)
+
+    a, b = outputs["full_read"], outputs["streaming"]
+    results = {
+        "file_mb": written / (1024 * 1024),
+        **measurements,
+        "identical": (a.score, a.field_scores, a.feedback) == (b.score, b.field_scores, b.feedback)
+    }
+    print(f"[streaming_validation] file={results['file_mb']:.0f}MB (secciones ~{sections_mb}MB)")
+    for name in ("full_read", "streaming"):
+        print(f"  {name:<10} {measurements[name]['seconds'] * 1000:>8.0f}ms  peak={measurements[name]['peak_mb']:>7.1f}MB")
+    print(f"  identical={results['identical']}")
+    return results
+
+
+def bench_scheduler_drift(period_s: float = 0.1, check_s: float = 0.02, ticks: int = 20) -> Dict:
+    """
+    Compara la deriva del monitoreo: bucle `while: check(); sleep(interval)`
+    (original) frente a PeriodicScheduler de tasa fija, con una verificación
+    de duración `check_s`.
+    """
+    def check(starts: List[float]):
+        starts.append(time.monotonic())
+        time.sleep(check_s)
+
+    legacy: List[float] = []
+    while len(legacy) < ticks:
+        check(legacy)
+        time.sleep(period_s)
+
+    scheduled: List[float] = []
+    scheduler = PeriodicScheduler(handle_signals=False)
+
+    def tick():
+        check(scheduled)
+        if len(scheduled) == ticks:
+            threading.Thread(target=scheduler.stop).start()
+
+    scheduler.add_task("check", tick, period=period_s)
+    scheduler.run()
+
+    def drift(starts: List[float]) -> float:
+        return (starts[ticks - 1] - starts[0]) - (ticks - 1) * period_s
+
+    results = {
+        "legacy_drift_ms": drift(legacy) * 1000,
+        "scheduler_drift_ms": drift(scheduled) * 1000,
+        "scheduler_stats": scheduler.stats()["check"]
+    }
+    print(f"[scheduler_drift] period={period_s * 1000:.0f}ms check={check_s * 1000:.0f}ms ticks={ticks}")
+    print(f"  drift: while/sleep={results['legacy_drift_ms']:.1f}ms  "
+          f"scheduler={results['scheduler_drift_ms']:.2f}ms "
+          f"(max lateness {results['scheduler_stats']['max_lateness_ms']:.2f}ms)")
+    return results
+
+
+def bench_snapshot_lookup(legacy_snapshots: int = 5000, files: int = 32, file_kb: int = 1024,
+                          repeat: int = 20) -> Dict:
+    """
+    Compara la localización del último estado seguro (glob y ordenación de
+    tarballs frente al puntero LATEST_SAFE verificado) y mide el coste de
+    un snapshot incremental cuando cambia un solo archivo.
+    """
+    root = tempfile.mkdtemp(prefix="caelion-snapshots-")
+    try:
+        snapshots_dir = os.path.join(root, "snapshots")
+        os.makedirs(snapshots_dir)
+        for i in range(legacy_snapshots):
+            open(os.path.join(snapshots_dir, f"snapshot_{i:08d}.tar.gz"), "wb").close()
+
+        source = os.path.join(root, "source")
+        os.makedirs(source)
+        paths = []
+        for i in range(files):
+            path = os.path.join(source, f"component_{i:03d}.bin")
+            with open(path, "wb") as f:
+                f.write(os.urandom(file_kb * 1024))
+            paths.append(path)
+
+        manager = SnapshotManager(snapshots_dir)
+        start = time.perf_counter()
+        first = manager.create_snapshot(paths, mark_safe=True)
+        full_s = time.perf_counter() - start
+
+        with open(paths[0], "ab") as f:
+            f.write(b"cambio")
+        start = time.perf_counter()
+        second = manager.create_snapshot(paths, mark_safe=True)
+        incremental_s = time.perf_counter() - start
+
+        legacy_samples, pointer_samples = [], []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            sorted(Path(snapshots_dir).glob("snapshot_*.tar.gz"), reverse=True)[0]
+            legacy_samples.append(time.perf_counter() - start)
+            start = time.perf_counter()
+            assert manager.latest_safe().snapshot_id == second.snapshot_id
+            pointer_samples.append(time.perf_counter() - start)
+    finally:
+        shutil.rmtree(root)
+
+    results = {
+        "legacy_lookup_ms": statistics.median(legacy_samples) * 1000,
+        "pointer_lookup_ms": statistics.median(pointer_samples) * 1000,
+        "full_snapshot_ms": full_s * 1000,
+        "incremental_snapshot_ms": incremental_s * 1000,
+        "objects_written": (first.new_objects, second.new_objects)
+    }
+    print(f"[snapshot_lookup] legacy_snapshots={legacy_snapshots} files={files}x{file_kb}KB")
+    print(f"  lookup: glob+sort={results['legacy_lookup_ms']:.2f}ms  "
+          f"LATEST_SAFE={results['pointer_lookup_ms']:.3f}ms")
+    print(f"  snapshot+verify: full={results['full_snapshot_ms']:.1f}ms ({first.new_objects} objects)  "
+          f"incremental={results['incremental_snapshot_ms']:.1f}ms ({second.new_objects} objects)")
+    return results
+
+
+def _legacy_freeze(pattern: str) -> int:
+    """Congelación original: pgrep -f y SIGSTOP proceso a proceso"""
+    result = subprocess.run(["pgrep", "-f", pattern], capture_output=True, text=True)
+    frozen = 0
+    for pid in result.stdout.split():
+        if pid != str(os.getpid()):
+            try:
+                os.kill(int(pid), signal.SIGSTOP)
+                frozen += 1
+            except ProcessLookupError:
+                pass
+    return frozen
+
+
+def bench_freeze_latency(processes: int = 20, repeat: int = 20) -> Dict:
+    """
+    Compara la latencia de congelación: pgrep + SIGSTOP por PID frente a
+    ProcessRegistry.freeze (grupos supervisados y caché de /proc).
+    """
+    # Marcador único: no debe aparecer en la línea de comandos de este proceso
+    marker = f"caelion-bench-{random.getrandbits(48):012x}"
+    children = [
+        subprocess.Popen([sys.executable, "-c", "import time; time.sleep(300)", marker], process_group=0)
+        for _ in range(processes)
+    ]
+    registry = ProcessRegistry(pattern=re.escape(marker))
+    for child in children[:processes // 2]:
+        registry.register(child.pid)
+
+    legacy, current = [], []
+    try:
+        time.sleep(0.5)
+        registry.refresh()
+        if shutil.which("pgrep"):
+            for _ in range(repeat):
+                start = time.perf_counter()
+                frozen = _legacy_freeze(marker)
+                legacy.append(time.perf_counter() - start)
+                registry.thaw()
+                assert frozen == processes
+        for _ in range(repeat):
+            result = registry.freeze()
+            current.append(result.latency_ms / 1000)
+            registry.thaw()
+            assert len(result.signalled_pids) == processes
+    finally:
+        for child in children:
+            child.kill()
+            child.wait()
+
+    results = {
+        "processes": processes,
+        "legacy_ms": statistics.median(legacy) * 1000 if legacy else None,
+        "registry_ms": statistics.median(current) * 1000,
+        "registry_max_ms": max(current) * 1000
+    }
+    print(f"[freeze_latency] processes={processes} repeat={repeat} (median)")
+    if legacy:
+        print(f"  pgrep+kill={results['legacy_ms']:.2f}ms  registry={results['registry_ms']:.3f}ms  "
+              f"(x{results['legacy_ms'] / results['registry_ms']:.0f}, max {results['registry_max_ms']:.3f}ms)")
+    else:
+        print(f"  registry={results['registry_ms']:.3f}ms (pgrep not available)")
+    return results
+
+
+def bench_origin_storage(events: int = 500, compact_every: int = 16) -> Dict:
+    """
+    Compara el almacenamiento del registro de origen con `events` checksums:
+    reescritura completa del JSON indentado en cada evento (original, con y
+    sin fsync) frente al journal encadenado con fsync y compactación atómica
+    cada `compact_every` eventos; y la carga de ambos formatos.
+    """
+    def checksum(i: int) -> Dict:
+        return {"timestamp": time.time(), "founder_hash": f"{i:064x}",
+                "purpose_hash": f"{i + 1:064x}", "combined_hash": f"{i + 2:064x}"}
+
+    directory = tempfile.mkdtemp(prefix="caelion-origin-storage-")
+    try:
+        timings = {}
+        for name, durable in (("legacy", False), ("legacy_fsync", True)):
+            path = os.path.join(directory, f"{name}.json")
+            state = empty_state()
+            start = time.perf_counter()
+            for i in range(events):
+                state["checksums"].append(checksum(i))
+                with open(path, "w") as f:
+                    json.dump(state, f, indent=2)
+                    if durable:
+                        f.flush()
+                        os.fsync(f.fileno())
+            timings[name] = time.perf_counter() - start
+
+        path = os.path.join(directory, "journal.json")
+        store = OriginStore(path, compact_every=compact_every)
+        state = empty_state()
+        start = time.perf_counter()
+        for i in range(events):
+            data = checksum(i)
+            store.append(EVENT_CHECKSUM, data)
+            apply_event(state, EVENT_CHECKSUM, data)
+            if store.needs_compaction():
+                store.compact(state)
+        timings["journal"] = time.perf_counter() - start
+
+        def load_legacy():
+            with open(os.path.join(directory, "legacy.json")) as f:
+                return json.load(f)
+
+        loads = {}
+        for name, load in (("legacy", load_legacy), ("journal", lambda: OriginStore(path).load())):
+            start = time.perf_counter()
+            for _ in range(20):
+                load()
+            loads[name] = (time.perf_counter() - start) / 20
+        assert len(OriginStore(path).load().state["checksums"]) == events
+    finally:
+        shutil.rmtree(directory)
+
+    results = {
+        "legacy_save_ms": timings["legacy"] / events * 1000,
+        "legacy_fsync_save_ms": timings["legacy_fsync"] / events * 1000,
+        "journal_save_ms": timings["journal"] / events * 1000,
+        "legacy_load_ms": loads["legacy"] * 1000,
+        "journal_load_ms": loads["journal"] * 1000
+    }
+    print(f"[origin_storage] events={events} compact_every={compact_every}")
+    print(f"  save per event: rewrite={results['legacy_save_ms']:.3f}ms (no fsync)  "
+          f"rewrite+fsync={results['legacy_fsync_save_ms']:.3f}ms  journal+fsync={results['journal_save_ms']:.3f}ms")
+    print(f"  load: legacy={results['legacy_load_ms']:.3f}ms  journal replay={results['journal_load_ms']:.3f}ms")
+    return results
+
+
+def bench_origin_summary(calls: int = 100000) -> Dict:
+    """
+    Compara get_origin_summary() con la verificación recalculada en cada
+    llamada (comportamiento original, verify_integrity(force=True)) frente a
+    la verificación en caché de un registro sellado.
+    """
+    directory = tempfile.mkdtemp(prefix="caelion-origin-")
+    try:
+        registry = OriginRegistry(storage_path=os.path.join(directory, "origin_registry.json"))
+        registry.register_founder("FOUNDER-001", "Ever", "ever@caelion.io", "Earth", "SIGNATURE")
+        registry.register_purpose(
+            "Gobernanza coignitiva",
+            ethical_principles=[f"C0-{i:02d}" for i in range(1, 33)],
+            operational_constraints=[f"Restricción {i}" for i in range(32)]
+        )
+        registry.seal_registry()
+
+        start = time.perf_counter()
+        for _ in range(calls):
+            registry.verify_integrity(force=True)
+            registry.get_origin_summary()
+        legacy_s = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for _ in range(calls):
+            registry.get_origin_summary()
+        cached_s = time.perf_counter() - start
+    finally:
+        shutil.rmtree(directory)
+
+    results = {
+        "recomputed_us": legacy_s / calls * 1e6,
+        "cached_us": cached_s / calls * 1e6
+    }
+    print(f"[origin_summary] calls={calls}")
+    print(f"  per call: recomputed={results['recomputed_us']:.2f}us  cached={results['cached_us']:.2f}us "
+          f"(x{results['recomputed_us'] / results['cached_us']:.1f})")
+    return results
+
+
+def bench_purpose_evolution(versions: int = 10000, lookups: int = 1000) -> Dict:
+    """
+    Compara la verificación de una versión histórica del propósito:
+    recorrido de la cadena completa desde el sellado frente a
+    PurposeEvolutionLog.verify_version (checksum, enlace y prueba de Merkle),
+    además de la búsqueda de la versión vigente en un instante.
+    """
+    log = PurposeEvolutionLog(hashlib.sha256(b"seal").hexdigest())
+    for i in range(versions):
+        log.append(log.next_entry(f"Propósito v{i + 1}", [f"C0-{j:02d}" for j in range(1, 9)],
+                                  ["Consenso obligatorio", "Auditoría completa"]))
+    entries = list(log)
+    targets = [random.randint(1, versions) for _ in range(lookups)]
+
+    def replay(version: int) -> bool:
+        prev = log.anchor_checksum
+        for entry in entries[:version]:
+            if entry.prev_checksum != prev or not entry.is_consistent():
+                return False
+            prev = entry.checksum
+        return True
+
+    replay_targets = targets[:max(1, lookups // 100)]
+    start = time.perf_counter()
+    assert all(replay(v) for v in replay_targets)
+    replay_s = (time.perf_counter() - start) / len(replay_targets)
+
+    start = time.perf_counter()
+    assert all(log.verify_version(v) for v in targets)
+    indexed_s = (time.perf_counter() - start) / lookups
+
+    instants = [random.uniform(entries[0].timestamp, entries[-1].timestamp) for _ in range(lookups)]
+    start = time.perf_counter()
+    for instant in instants:
+        log.at(instant)
+    at_s = (time.perf_counter() - start) / lookups
+
+    results = {
+        "replay_verify_ms": replay_s * 1000,
+        "indexed_verify_ms": indexed_s * 1000,
+        "at_us": at_s * 1e6
+    }
+    print(f"[purpose_evolution] versions={versions} lookups={lookups}")
+    print(f"  verify version: chain replay={results['replay_verify_ms']:.2f}ms  "
+          f"indexed={results['indexed_verify_ms']:.3f}ms  version at instant={results['at_us']:.2f}us")
+    return results
+
+
+def bench_report_sink(reports: int = 2000) -> Dict:
+    """
+    Compara una ráfaga de reportes de incidente: un archivo JSON indentado por
+    reporte (envío original) frente a ReportSink con FileTransport (cola y
+    escritura por lotes en JSON lines), midiendo el tiempo en el camino de
+    respuesta y hasta la persistencia completa.
+    """
+    report = {
+        "timestamp": time.time(),
+        "event_type": "AUTOMATIC_RESET",
+        "protocol_violated": "C1-01",
+        "evidence": {"expected_hash": "a" * 64, "actual_hash": "b" * 64},
+        "system_state": {"integrity_records": 6, "monitoring_active": True}
+    }
+    directory = tempfile.mkdtemp(prefix="caelion-reports-")
+    try:
+        start = time.perf_counter()
+        for i in range(reports):
+            with open(os.path.join(directory, f"aeon_RESET_INCIDENT_{i}.json"), "w") as f:
+                json.dump(report, f, indent=2)
+        legacy_s = time.perf_counter() - start
+
+        sink = ReportSink(FileTransport(os.path.join(directory, "sink")), max_queue=reports)
+        start = time.perf_counter()
+        for _ in range(reports):
+            sink.submit(report, "RESET_INCIDENT")
+        submit_s = time.perf_counter() - start
+        sink.flush()
+        persisted_s = time.perf_counter() - start
+        stats = dict(sink.stats)
+        sink.close()
+    finally:
+        shutil.rmtree(directory)
+
+    results = {
+        "legacy_ms": legacy_s * 1000,
+        "sink_submit_ms": submit_s * 1000,
+        "sink_persisted_ms": persisted_s * 1000,
+        "batches": stats["batches"]
+    }
+    print(f"[report_sink] reports={reports}")
+    print(f"  file per report={results['legacy_ms']:.1f}ms  sink: submit={results['sink_submit_ms']:.1f}ms  "
+          f"persisted={results['sink_persisted_ms']:.1f}ms ({stats['batches']} batches)")
+    return results
+
+
+def bench_violation_coalescing(interval_s: float = 5.0, hours: float = 24.0,
+                               storm_events: int = 100000) -> Dict:
+    """
+    Mide la capa de coalescencia de ÆON: respuestas disparadas por una
+    discrepancia persistente de checksums entre ARGOS y HECATE (el informe
+    HASH_CORRUPTION real de ARGOS en cada intervalo de verificación) y coste
+    por evento durante una ráfaga de eventos repetidos.
+    """
+    class ReportCollector:
+        """Sustituto de ÆON que recoge los informes de ARGOS"""
+        def __init__(self):
+            self.reports = []
+
+        def report_violation_attempt(self, protocol_id, evidence):
+            self.reports.append((protocol_id, evidence))
+
+    def event(protocol_id, evidence) -> ViolationEvent:
+        # Igual que AeonGuardian.report_violation_attempt
+        return ViolationEvent(
+            protocol_id=protocol_id,
+            violation_type=ViolationType.ATTEMPT,
+            criticality=CriticalityLevel.C1_INTEGRITY,
+            evidence=evidence
+        )
+
+    collector = ReportCollector()
+    argos = ArgosMonitor(aeon_instance=collector)
+    argos.register_operation("OP-BENCH", "benchmark", "AEON", {"n": 1})
+    argos._query_hecate_for_checksum = lambda: "0" * 64
+
+    # Discrepancia persistente, con reloj simulado para la coalescencia
+    now = [0.0]
+    coalescer = EventCoalescer(clock=lambda: now[0])
+    cycles = int(hours * 3600 / interval_s)
+    responses = 0
+    for _ in range(cycles):
+        argos._check_checksum_integrity()
+        protocol_id, evidence = collector.reports.pop()
+        responses += coalescer.admit(event(protocol_id, evidence)).escalate
+        now[0] += interval_s
+
+    storm = EventCoalescer()
+    argos._check_checksum_integrity()
+    e = event(*collector.reports.pop())
+    start = time.perf_counter()
+    for _ in range(storm_events):
+        storm.admit(e)
+    per_event_us = (time.perf_counter() - start) / storm_events * 1e6
+
+    results = {
+        "legacy_responses": cycles,
+        "coalesced_responses": responses,
+        "per_event_us": per_event_us
+    }
+    print(f"[violation_coalescing] ARGOS/HECATE checksum mismatch for {hours:.0f}h, checked every {interval_s:.0f}s")
+    print(f"  responses: legacy={results['legacy_responses']}  coalesced={responses}  "
+          f"storm: {per_event_us:.2f}us/event ({storm_events} events)")
+    return results
+
+
+def bench_binary_codec(iterations: int = 20000) -> Dict:
+    """
+    Compara el códec binario canónico con JSON ordenado (sort_keys=True) para
+    los mensajes entre supervisores: codificación + SHA-256, decodificación
+    y tamaño. La variante JSON incluye la conversión del mensaje a diccionario.
+    """
+    def as_json_dict(message):
+        if isinstance(message, dict):
+            return message
+        return {f.name: getattr(getattr(message, f.name), "value", getattr(message, f.name))
+                for f in dataclasses.fields(message)}
+
+    request = _make_request(0)
+    votes = [
+        SupervisorVote(module=module, decision=DecisionType.APPROVE,
+                       reasoning="Operation is coherent with system state", confidence=0.95,
+                       operation_id=request.operation_id, signature="ab" * 32)
+        for module in SupervisorModule
+    ]
+    result = ConsensusResult(request=request, final_decision=DecisionType.APPROVE, votes=votes,
+                             consensus_achieved=True, consensus_timestamp=time.time(),
+                             execution_time_ms=1.25)
+    messages = {
+        "vote": votes[0],
+        "anomaly": AnomalyEvent(anomaly_type=AnomalyType.HASH_CORRUPTION, timestamp=time.time(),
+                                evidence={"expected": "a" * 64, "current": "b" * 64},
+                                severity="HIGH", component_affected="HECATE"),
+        "trace": OperationTrace(operation_id=request.operation_id, operation_type="generate_response",
+                                timestamp=time.time(), requester="M (LLM)", data_hash="c" * 64),
+        "consensus_dict": result.to_dict()
+    }
+
+    def rate(function) -> float:
+        start = time.perf_counter()
+        for _ in range(iterations):
+            function()
+        return iterations / (time.perf_counter() - start)
+
+    results = {}
+    for name, message in messages.items():
+        json_bytes = json.dumps(as_json_dict(message), sort_keys=True).encode()
+        binary_bytes = encode(message)
+        assert decode(binary_bytes) == message
+        results[name] = {
+            "json_hash_per_s": rate(lambda: hashlib.sha256(
+                json.dumps(as_json_dict(message), sort_keys=True).encode()).digest()),
+            "binary_hash_per_s": rate(lambda: hashlib.sha256(encode(message)).digest()),
+            "json_decode_per_s": rate(lambda: json.loads(json_bytes)),
+            "binary_decode_per_s": rate(lambda: decode(binary_bytes)),
+            "json_bytes": len(json_bytes),
+            "binary_bytes": len(binary_bytes)
+        }
+
+    print(f"[binary_codec] iterations={iterations} (encode+SHA-256 and decode, msg/s)")
+    for name, metrics in results.items():
+        print(f"  {name:<15} hash: json={metrics['json_hash_per_s']:>8.0f} "
+              f"binary={metrics['binary_hash_per_s']:>8.0f}  "
+              f"decode: json={metrics['json_decode_per_s']:>8.0f} "
+              f"binary={metrics['binary_decode_per_s']:>8.0f}  "
+              f"size: {metrics['json_bytes']}B/{metrics['binary_bytes']}B")
+    return results
+
+
+def bench_trace_memory(traces: int = 200000, cycle: int = 1000) -> Dict:
+    """
+    Mide con tracemalloc los bytes por traza del registro independiente de
+    ARGOS: diccionario de dataclasses con __dict__ (original), diccionario de
+    dataclasses con __slots__ y almacén columnar; y de ARGOS completo (almacén,
+    conciliador y árbol de Merkle de trazas) con un ciclo de conciliación cada
+    `cycle` trazas, antes y después de expirarlas. Los operation_id se crean
+    antes de medir.
+    """
+    LegacyTrace = dataclasses.make_dataclass(
+        "LegacyTrace", [f.name for f in dataclasses.fields(OperationTrace)])
+    operation_ids = [f"OP-{i:08d}" for i in range(traces)]
+    variants = {
+        "dict_dataclass": (dict, LegacyTrace),
+        "dict_slots": (dict, OperationTrace),
+        "columnar": (lambda: ColumnarTraceStore(OperationTrace), OperationTrace)
+    }
+
+    results = {}
+    for name, (make_store, trace_type) in variants.items():
+        tracemalloc.start()
+        base = tracemalloc.get_traced_memory()[0]
+        start = time.perf_counter()
+        store = make_store()
+        for operation_id in operation_ids:
+            store[operation_id] = trace_type(
+                operation_id=operation_id,
+                operation_type="generate_response",
+                timestamp=time.time(),
+                requester="M (LLM)",
+                data_hash=hashlib.sha256(operation_id.encode()).hexdigest()
+            )
+        seconds = time.perf_counter() - start
+        used = tracemalloc.get_traced_memory()[0] - base
+        tracemalloc.stop()
+        assert store[operation_ids[-1]].data_hash == hashlib.sha256(operation_ids[-1].encode()).hexdigest()
+        del store
+        results[name] = {
+            "bytes_per_trace": used / traces,
+            "gb_per_10m_traces": used / traces * 10_000_000 / 1e9,
+            "insert_us": seconds / traces * 1e6
+        }
+
+    # ARGOS completo: almacén, conciliador y árbol de Merkle de trazas, con un
+    # ciclo de conciliación cada `cycle` trazas; después se expiran todas y
+    # se repite la ronda para comprobar que la memoria no crece
+    argos = ArgosMonitor()
+    argos._query_hecate_for_traces = lambda operation_ids: set()
+    argos_traces = traces // 4
+    modules = ("trace_store.py", "trace_reconciler.py", "merkle_accumulator.py")
+
+    def argos_round(prefix: str) -> float:
+        operation_ids = [f"OP-{prefix}-{i:08d}" for i in range(argos_traces)]
+        start = time.perf_counter()
+        for i, operation_id in enumerate(operation_ids):
+            argos.register_operation(operation_id, "generate_response", "M (LLM)", {"i": i})
+            if (i + 1) % cycle == 0:
+                argos._check_trace_consistency()
+        return time.perf_counter() - start
+
+    def by_module(snapshot) -> Dict[str, float]:
+        sizes = dict.fromkeys(modules, 0)
+        for stat in snapshot.compare_to(before, "filename"):
+            name = os.path.basename(stat.traceback[0].filename)
+            if name in sizes:
+                sizes[name] += stat.size_diff
+        return sizes
+
+    def expire_all():
+        argos.config["trace_retention_seconds"] = 1e-9
+        argos._expire_traces()
+        argos.config["trace_retention_seconds"] = None
+
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    argos_round("A")
+    components = by_module(tracemalloc.take_snapshot())
+    expire_all()
+    retained = sum(by_module(tracemalloc.take_snapshot()).values())
+    argos_round("B")
+    second_round = sum(by_module(tracemalloc.take_snapshot()).values())
+    expire_all()
+    tracemalloc.stop()
+    seconds = argos_round("C")  # Tiempo de inserción sin el coste de tracemalloc
+
+    total = sum(components.values())
+    results["argos"] = {
+        "bytes_per_trace": total / argos_traces,
+        "gb_per_10m_traces": total / argos_traces * 10_000_000 / 1e9,
+        "insert_us": seconds / argos_traces * 1e6,
+        "components_bytes_per_trace": {name: size / argos_traces for name, size in components.items()},
+        "bytes_after_expiry": retained,
+        "second_round_bytes_per_trace": second_round / argos_traces
+    }
+
+    print(f"[trace_memory] traces={traces}, argos={argos_traces} (tracemalloc, without the operation_id strings)")
+    for name, metrics in results.items():
+        print(f"  {name:<15} {metrics['bytes_per_trace']:>7.1f} B/trace  "
+              f"{metrics['gb_per_10m_traces']:>5.2f} GB per 10M  insert={metrics['insert_us']:.2f}us")
+    breakdown = "  ".join(f"{name}={size:.1f}" for name, size
+                          in results["argos"]["components_bytes_per_trace"].items())
+    print(f"    argos breakdown (B/trace): {breakdown}")
+    print(f"    argos after expiring every trace: {results['argos']['bytes_after_expiry'] / 1024:.1f} KiB "
+          f"(capacity kept for reuse); second round: "
+          f"{results['argos']['second_round_bytes_per_trace']:.1f} B/trace")
+    return results
+
+
+BENCHMARKS = {
+    "binary_codec": bench_binary_codec,
+    "consensus_batch": bench_consensus_batch,
+    "consensus_latency": bench_consensus_latency,
+    "consensus_log": bench_consensus_log,
+    "freeze_latency": bench_freeze_latency,
+    "hash_throughput": bench_hash_throughput,
+    "incremental_validation": bench_incremental_validation,
+    "origin_storage": bench_origin_storage,
+    "origin_summary": bench_origin_summary,
+    "purpose_evolution": bench_purpose_evolution,
+    "report_sink": bench_report_sink,
+    "scheduler_drift": bench_scheduler_drift,
+    "snapshot_lookup": bench_snapshot_lookup,
+    "streaming_validation": bench_streaming_validation,
+    "trace_memory": bench_trace_memory,
+    "trace_reconciliation": bench_trace_reconciliation,
+    "validation_cache": bench_validation_cache,
+    "validator_sections": bench_validator_sections,
+    "violation_coalescing": bench_violation_coalescing,
+    "vote_signing": bench_vote_signing,
+}
+
+
+def main():
+    """Ejecuta los benchmarks seleccionados"""
+    parser = argparse.ArgumentParser(description="Benchmarks de rendimiento de CAELION")
+    parser.add_argument("names", nargs="*", metavar="name",
+                        help=f"Benchmarks a ejecutar (por defecto, todos): {', '.join(sorted(BENCHMARKS))}")
+    args = parser.parse_args()
+
+    unknown = [name for name in args.names if name not in BENCHMARKS]
+    if unknown:
+        parser.error(f"Unknown benchmarks: {', '.join(unknown)}")
+
+    # Silenciar el logging operativo de los módulos durante las mediciones
+    logging.disable(logging.CRITICAL)
+
+    for name in args.names or sorted(BENCHMARKS):
+        BENCHMARKS[name]()
+        print()
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
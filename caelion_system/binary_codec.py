@@ -0,0 +1,472 @@
+#!/usr/bin/env python3
+"""
+Códec Binario Canónico - Serialización de Mensajes entre Supervisores de CAELION
+
+Este módulo implementa la codificación binaria compartida por los
+supervisores, responsable de:
+1. Codificar de forma determinista (canónica) valores Python: un mismo valor
+   produce siempre los mismos bytes, de modo que la codificación sirve para
+   hashear, firmar y persistir.
+2. Codificar por esquema los mensajes entre supervisores (SupervisorVote,
+   ConsensusRequest, AnomalyEvent, ViolationEvent, IntegrityChecksum...):
+   un identificador de esquema y los campos en orden de declaración, sin
+   nombres de campo.
+3. Decodificar sin copias sobre un memoryview, rechazando cualquier
+   codificación no canónica.
+4. Calcular el hash SHA-256 de la codificación canónica.
+
+Formato: un byte de versión (FORMAT_VERSION) seguido de un valor. Cada valor
+empieza por un byte de tipo:
+
+    N / T / F           None / True / False
+    i <int64 BE>        Entero en [-2^63, 2^63)
+    n <u32> <bytes>     Entero fuera de ese rango (complemento a dos, mínimo)
+    d <float64 BE>      Flotante (todos los NaN se codifican igual)
+    s <u32> <utf-8>     Cadena
+    b <u32> <bytes>     Bytes
+    l <u32> <valores>   Lista o tupla
+    m <u32> <pares>     Diccionario de claves str, ordenadas por código
+    r <u16> <campos>    Registro de un esquema (campos en orden de declaración)
+
+Los Enum se codifican como su valor; los campos Enum de un esquema se
+reconstruyen al decodificar.
+
+Autor: Manus AI (bajo DOS-03)
+Fecha: 26 de enero de 2026
+"""
+
+import dataclasses
+import hashlib
+import math
+import operator
+import struct
+from enum import Enum
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+FORMAT_VERSION = b"\x01"
+
+# Identificadores de esquema (estables: forman parte del formato)
+SCHEMA_SUPERVISOR_VOTE = 1
+SCHEMA_CONSENSUS_REQUEST = 2
+SCHEMA_ANOMALY_EVENT = 3
+SCHEMA_VIOLATION_EVENT = 4
+SCHEMA_INTEGRITY_CHECKSUM = 5
+SCHEMA_OPERATION_TRACE = 6
+SCHEMA_AUDIT_LOG = 7
+SCHEMA_CONSENSUS_RESULT = 8
+
+_INT64 = struct.Struct(">q")
+_FLOAT64 = struct.Struct(">d")
+_UINT32 = struct.Struct(">I")
+_UINT16 = struct.Struct(">H")
+_INT_VALUE = struct.Struct(">cq")     # Etiqueta + int64
+_FLOAT_VALUE = struct.Struct(">cd")   # Etiqueta + float64
+_SIZED_VALUE = struct.Struct(">cI")   # Etiqueta + longitud
+_INT64_MIN = -(1 << 63)
+_INT64_MAX = (1 << 63) - 1
+_CANONICAL_NAN = _FLOAT64.pack(math.nan)
+
+_TAG_NONE = b"N"
+_TAG_TRUE = b"T"
+_TAG_FALSE = b"F"
+_TAG_INT = b"i"
+_TAG_BIGINT = b"n"
+_TAG_FLOAT = b"d"
+_TAG_STR = b"s"
+_TAG_BYTES = b"b"
+_TAG_LIST = b"l"
+_TAG_MAP = b"m"
+_TAG_RECORD = b"r"
+
+_KEY_CACHE: Dict[str, bytes] = {}  # Clave de diccionario -> su codificación
+_KEY_CACHE_SIZE = 4096
+_KEY_CACHE_MAX_LENGTH = 64
+
+
+class CodecError(ValueError):
+    """Valor no codificable o datos que no son una codificación canónica válida"""
+
+
+@dataclasses.dataclass(frozen=True)
+class Schema:
+    """Esquema de un tipo de mensaje: identificador y campos en orden de codificación"""
+    type_id: int
+    cls: type
+    fields: Tuple[str, ...]
+    enums: Tuple[Optional[type], ...]  # Clase Enum de cada campo (None si no es Enum)
+
+
+_SCHEMAS_BY_ID: Dict[int, Schema] = {}
+_ENCODERS: Dict[type, Callable[[Any, List[bytes], Optional[Callable]], None]] = {}
+
+
+def register_schema(type_id: int, cls: type) -> Schema:
+    """
+    Registra un dataclass como tipo de mensaje con codificación por esquema.
+
+    Los campos se codifican en su orden de declaración; añadir o reordenar
+    campos cambia la codificación, por lo que requiere un identificador nuevo.
+
+    Args:
+        type_id: Identificador del esquema (0-65535, único)
+        cls: Dataclass a registrar
+
+    Returns:
+        Schema: Esquema registrado
+
+    Raises:
+        CodecError: Si el identificador ya pertenece a otro tipo
+    """
+    if not dataclasses.is_dataclass(cls):
+        raise CodecError(f"Schema type must be a dataclass: {cls.__name__}")
+    existing = _SCHEMAS_BY_ID.get(type_id)
+    # El mismo tipo puede cargarse dos veces (módulo ejecutado como __main__ e importado)
+    if existing is not None and existing.cls.__qualname__ != cls.__qualname__:
+        raise CodecError(f"Schema id {type_id} already registered for {existing.cls.__name__}")
+
+    fields = tuple(f for f in dataclasses.fields(cls) if f.init)
+    schema = Schema(
+        type_id=type_id,
+        cls=cls,
+        fields=tuple(f.name for f in fields),
+        enums=tuple(f.type if isinstance(f.type, type) and issubclass(f.type, Enum) else None
+                    for f in fields)
+    )
+    _SCHEMAS_BY_ID[type_id] = schema
+    header = _TAG_RECORD + _UINT16.pack(type_id)
+    names = schema.fields
+    get_fields = operator.attrgetter(*names) if len(names) > 1 else (lambda value: (getattr(value, names[0]),))
+    encoders = _ENCODERS
+
+    def encode_record(value, out: List[bytes], default):
+        out.append(header)
+        for item in get_fields(value):
+            encoder = encoders.get(type(item))
+            if encoder is not None:
+                encoder(item, out, default)
+            else:
+                _encode_other(item, out, default)
+
+    _ENCODERS[cls] = encode_record
+    return schema
+
+
+# ========== CODIFICACIÓN ==========
+
+def encode(value: Any, default: Optional[Callable[[Any], Any]] = None) -> bytes:
+    """
+    Codificación canónica de un valor.
+
+    Args:
+        value: Valor a codificar
+        default: Conversión de los valores de tipo no codificable (como en
+            json.dumps); por defecto se rechazan
+
+    Raises:
+        CodecError: Si el valor contiene un tipo no codificable o un
+            diccionario con claves que no son cadenas
+    """
+    out = [FORMAT_VERSION]
+    _encode_value(value, out, default)
+    return b"".join(out)
+
+
+def digest(value: Any) -> bytes:
+    """SHA-256 de la codificación canónica de un valor"""
+    return hashlib.sha256(encode(value)).digest()
+
+
+def hexdigest(value: Any) -> str:
+    """SHA-256 (hexadecimal) de la codificación canónica de un valor"""
+    return hashlib.sha256(encode(value)).hexdigest()
+
+
+def _encode_value(value: Any, out: List[bytes], default):
+    encoder = _ENCODERS.get(type(value))
+    if encoder is not None:
+        encoder(value, out, default)
+    else:
+        _encode_other(value, out, default)
+
+
+def _encode_other(value: Any, out: List[bytes], default):
+    """Subclases de los tipos básicos, Enum y valores no codificables"""
+    if isinstance(value, Enum):
+        _encode_value(value.value, out, default)
+    elif isinstance(value, bool):
+        _encode_bool(value, out, default)
+    elif isinstance(value, int):
+        _encode_int(int(value), out, default)
+    elif isinstance(value, float):
+        _encode_float(float(value), out, default)
+    elif isinstance(value, str):
+        _encode_str(str(value), out, default)
+    elif isinstance(value, (list, tuple)):
+        _encode_list(value, out, default)
+    elif isinstance(value, dict):
+        _encode_map(value, out, default)
+    elif isinstance(value, (bytes, bytearray, memoryview)):
+        _encode_bytes(value, out, default)
+    elif default is not None:
+        _encode_value(default(value), out, default)
+    else:
+        raise CodecError(f"Type not encodable: {type(value).__name__}")
+
+
+def _encode_none(value, out: List[bytes], default):
+    out.append(_TAG_NONE)
+
+
+def _encode_bool(value: bool, out: List[bytes], default):
+    out.append(_TAG_TRUE if value else _TAG_FALSE)
+
+
+def _encode_int(value: int, out: List[bytes], default):
+    try:
+        out.append(_INT_VALUE.pack(_TAG_INT, value))
+    except struct.error:
+        data = value.to_bytes((value.bit_length() + 8) // 8, "big", signed=True)
+        out.append(_SIZED_VALUE.pack(_TAG_BIGINT, len(data)))
+        out.append(data)
+
+
+def _encode_float(value: float, out: List[bytes], default):
+    out.append(_FLOAT_VALUE.pack(_TAG_FLOAT, value) if value == value else _TAG_FLOAT + _CANONICAL_NAN)
+
+
+def _encode_str(value: str, out: List[bytes], default):
+    data = value.encode("utf-8")
+    out.append(_SIZED_VALUE.pack(_TAG_STR, len(data)))
+    out.append(data)
+
+
+def _encode_bytes(value, out: List[bytes], default):
+    data = bytes(value)
+    out.append(_SIZED_VALUE.pack(_TAG_BYTES, len(data)))
+    out.append(data)
+
+
+def _encode_list(value, out: List[bytes], default):
+    out.append(_SIZED_VALUE.pack(_TAG_LIST, len(value)))
+    encoders = _ENCODERS
+    for item in value:
+        encoder = encoders.get(type(item))
+        if encoder is not None:
+            encoder(item, out, default)
+        else:
+            _encode_other(item, out, default)
+
+
+def _encode_map(value: Dict, out: List[bytes], default):
+    out.append(_SIZED_VALUE.pack(_TAG_MAP, len(value)))
+    try:
+        # El orden de código de las cadenas coincide con el orden de sus bytes UTF-8
+        keys = sorted(value)
+    except TypeError:
+        raise CodecError("Map keys must be strings")
+    encoders = _ENCODERS
+    for key in keys:
+        # Las claves se repiten entre mensajes: su codificación se reutiliza
+        encoded_key = _KEY_CACHE.get(key)
+        if encoded_key is None:
+            encoded_key = _encode_key(key)
+        out.append(encoded_key)
+        item = value[key]
+        encoder = encoders.get(type(item))
+        if encoder is not None:
+            encoder(item, out, default)
+        else:
+            _encode_other(item, out, default)
+
+
+def _encode_key(key: str) -> bytes:
+    if not isinstance(key, str):
+        raise CodecError(f"Map keys must be strings, got {type(key).__name__}")
+    data = str(key).encode("utf-8")
+    encoded = _SIZED_VALUE.pack(_TAG_STR, len(data)) + data
+    if len(data) <= _KEY_CACHE_MAX_LENGTH:
+        if len(_KEY_CACHE) >= _KEY_CACHE_SIZE:
+            _KEY_CACHE.clear()
+        _KEY_CACHE[key] = encoded
+    return encoded
+
+
+_ENCODERS.update({
+    type(None): _encode_none,
+    bool: _encode_bool,
+    int: _encode_int,
+    float: _encode_float,
+    str: _encode_str,
+    bytes: _encode_bytes,
+    list: _encode_list,
+    tuple: _encode_list,
+    dict: _encode_map,
+})
+
+
+# ========== DECODIFICACIÓN ==========
+
+def decode(data, bytes_as_memoryview: bool = False) -> Any:
+    """
+    Decodifica un valor completo.
+
+    Args:
+        data: bytes, bytearray, memoryview o cualquier objeto con protocolo de buffer
+        bytes_as_memoryview: Retornar los valores bytes como vistas sobre `data`
+            (sin copia; válidas mientras `data` no cambie)
+
+    Returns:
+        Any: Valor decodificado (las listas y tuplas se decodifican como listas)
+
+    Raises:
+        CodecError: Si los datos están truncados, tienen bytes sobrantes o no
+            son canónicos
+    """
+    decoder = Decoder(data, bytes_as_memoryview)
+    if decoder.view[:1] != FORMAT_VERSION:
+        raise CodecError("Unsupported binary codec version")
+    decoder.offset = 1
+    try:
+        value = decoder.read_value()
+    except (struct.error, IndexError):
+        raise CodecError(f"Truncated value at byte {decoder.offset}")
+    if decoder.offset != len(decoder.view):
+        raise CodecError(f"{len(decoder.view) - decoder.offset} trailing bytes after value")
+    return value
+
+
+class Decoder:
+    """
+    Decodificador sobre un memoryview.
+
+    Los enteros y flotantes se leen con struct.unpack_from y las cadenas se
+    decodifican directamente desde la vista, sin copias intermedias de los datos.
+    """
+
+    __slots__ = ("view", "offset", "bytes_as_memoryview")
+
+    def __init__(self, data, bytes_as_memoryview: bool = False):
+        view = memoryview(data)
+        self.view = view if view.format == "B" and view.ndim == 1 else view.cast("B")
+        self.offset = 0
+        self.bytes_as_memoryview = bytes_as_memoryview
+
+    def read_value(self) -> Any:
+        """
+        Lee el siguiente valor.
+
+        Raises:
+            CodecError: Si el valor no es canónico
+            struct.error, IndexError: Si los datos están truncados
+        """
+        view = self.view
+        offset = self.offset
+        tag = view[offset]
+        offset += 1
+        # Etiquetas en orden aproximado de frecuencia
+        if tag == _STR:
+            size = _UINT32.unpack_from(view, offset)[0]
+            offset += 4
+            end = offset + size
+            if end > len(view):
+                raise IndexError
+            self.offset = end
+            try:
+                return str(view[offset:end], "utf-8")
+            except UnicodeDecodeError:
+                raise CodecError(f"Invalid UTF-8 string at byte {offset}")
+        if tag == _FLOAT:
+            value = _FLOAT64.unpack_from(view, offset)[0]
+            if value != value and view[offset:offset + 8] != _CANONICAL_NAN:
+                raise CodecError(f"Non-canonical NaN at byte {offset}")
+            self.offset = offset + 8
+            return value
+        if tag == _INT:
+            self.offset = offset + 8
+            return _INT64.unpack_from(view, offset)[0]
+        if tag == _MAP:
+            self.offset = offset + 4
+            return self._read_map(_UINT32.unpack_from(view, offset)[0])
+        if tag == _LIST:
+            count = _UINT32.unpack_from(view, offset)[0]
+            self.offset = offset + 4
+            if count > len(view) - self.offset:
+                raise IndexError
+            read_value = self.read_value
+            return [read_value() for _ in range(count)]
+        if tag == _RECORD:
+            self.offset = offset + 2
+            return self._read_record(_UINT16.unpack_from(view, offset)[0])
+        self.offset = offset
+        if tag == _NONE:
+            return None
+        if tag == _TRUE:
+            return True
+        if tag == _FALSE:
+            return False
+        if tag == _BYTES:
+            return self._read_bytes()
+        if tag == _BIGINT:
+            return self._read_bigint()
+        raise CodecError(f"Unknown type tag {bytes([tag])!r} at byte {offset - 1}")
+
+    def _read_sized(self) -> memoryview:
+        size = _UINT32.unpack_from(self.view, self.offset)[0]
+        start = self.offset + 4
+        end = start + size
+        if end > len(self.view):
+            raise IndexError
+        self.offset = end
+        return self.view[start:end]
+
+    def _read_bytes(self):
+        data = self._read_sized()
+        return data if self.bytes_as_memoryview else data.tobytes()
+
+    def _read_bigint(self) -> int:
+        start = self.offset
+        data = self._read_sized()
+        value = int.from_bytes(data, "big", signed=True)
+        if _INT64_MIN <= value <= _INT64_MAX or len(data) != (value.bit_length() + 8) // 8:
+            raise CodecError(f"Non-canonical integer at byte {start}")
+        return value
+
+    def _read_map(self, count: int) -> Dict:
+        view = self.view
+        if count > len(view) - self.offset:
+            raise IndexError
+        read_value = self.read_value
+        result = {}
+        previous = None
+        for _ in range(count):
+            if view[self.offset] != _STR:
+                raise CodecError(f"Map key is not a string at byte {self.offset}")
+            key = read_value()
+            if previous is not None and key <= previous:
+                raise CodecError(f"Map keys not in canonical order at byte {self.offset}")
+            result[key] = read_value()
+            previous = key
+        return result
+
+    def _read_record(self, type_id: int) -> Any:
+        schema = _SCHEMAS_BY_ID.get(type_id)
+        if schema is None:
+            raise CodecError(f"Unknown schema id {type_id}")
+        read_value = self.read_value
+        values = {}
+        for name, enum in zip(schema.fields, schema.enums):
+            value = read_value()
+            if enum is not None and value is not None:
+                try:
+                    value = enum(value)
+                except ValueError:
+                    raise CodecError(f"Invalid {enum.__name__} value in {schema.cls.__name__}: {value!r}")
+            values[name] = value
+        return schema.cls(**values)
+
+
+# Etiquetas como enteros (lo que retorna la indexación de un memoryview)
+_NONE, _TRUE, _FALSE, _INT, _BIGINT, _FLOAT, _STR, _BYTES, _LIST, _MAP, _RECORD = (
+    tag[0] for tag in (_TAG_NONE, _TAG_TRUE, _TAG_FALSE, _TAG_INT, _TAG_BIGINT, _TAG_FLOAT,
+                       _TAG_STR, _TAG_BYTES, _TAG_LIST, _TAG_MAP, _TAG_RECORD)
+)
@@ -8,10 +8,21 @@ Autor: Ever (Ingeniero de Arquitecturas Cognitivas)
 
 import re
 import json
+import hashlib
+import os
+import sys
+import glob
+import statistics
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
-from typing import Dict, List, Tuple
+from typing import Dict, Iterable, Iterator, List, Optional, TextIO, Tuple
 from datetime import datetime
 
+from validation_cache import ValidationCache
+
+# Caracteres leídos por fragmento en la validación en streaming
+STREAM_CHUNK_SIZE = 1024 * 1024
+
 
 @dataclass
 class ValidationResult:
@@ -48,8 +59,145 @@ class CAELIONValidator:
         r'universidad'
     ]
     
-    def __init__(self):
+    # Encabezados de las 8 secciones (solo la línea de título; se evalúan en
+    # cada "##" del documento, en orden, igual que un re.search por sección)
+    SECTION_HEADINGS = {
+        1: re.compile(r'##\s*1\.\s*Pregunta de Investigaci[oó]n\s*\n+', re.IGNORECASE | re.DOTALL),
+        2: re.compile(r'##\s*2\.\s*Marco Te[oó]rico.*?\n+', re.IGNORECASE | re.DOTALL),
+        3: re.compile(r'##\s*3\.\s*Estado del Arte.*?\n+', re.IGNORECASE | re.DOTALL),
+        4: re.compile(r'##\s*4\.\s*An[aá]lisis Cr[ií]tico.*?\n+', re.IGNORECASE | re.DOTALL),
+        5: re.compile(r'##\s*5\.\s*Hip[oó]tesis Propia.*?\n+', re.IGNORECASE | re.DOTALL),
+        6: re.compile(r'##\s*6\.\s*Implicaciones Pr[aá]cticas.*?\n+', re.IGNORECASE | re.DOTALL),
+        7: re.compile(r'##\s*7\.\s*Limitaciones Expl[ií]citas.*?\n+', re.IGNORECASE | re.DOTALL),
+        8: re.compile(r'##\s*8\.\s*Secci[oó]n Pedag[oó]gica.*?Sistemas Din[aá]micos.*?\n+',
+                      re.IGNORECASE | re.DOTALL),
+    }
+    SECTION_NUMBER = re.compile(r'##\s*([1-8])\.')
+    # Descomposición del encabezado 8 para la validación en streaming: el
+    # ".*?Sistemas Din[aá]micos" puede abarcar cualquier distancia del documento
+    SECTION_8_PREFIX = re.compile(r'##\s*8\.\s*Secci[oó]n Pedag[oó]gica', re.IGNORECASE | re.DOTALL)
+    SECTION_8_TOPIC = re.compile(r'Sistemas Din[aá]micos', re.IGNORECASE)
+    SECTION_8_TOPIC_LENGTH = len('Sistemas Dinámicos')
+    NON_WHITESPACE = re.compile(r'\S')
+    NON_NEWLINE = re.compile(r'[^\n]')
+    
+    # Un grupo por verbo: lastindex identifica el verbo encontrado
+    EPISTEMIC_VERBS_RE = re.compile(
+        r'\b(?:' + '|'.join('(' + verb + ')' for verb in EPISTEMIC_VERBS) + r')\b',
+        re.IGNORECASE
+    )
+    # Los patrones institucionales son literales: se cuentan con str.count sobre la
+    # copia en minúsculas, salvo que la sección contenga alguno de los únicos
+    # caracteres no ASCII que IGNORECASE equipara a letras ASCII (İ, ı, ſ, K)
+    INSTITUTIONAL_RES = [re.compile(pattern, re.IGNORECASE) for pattern in INSTITUTIONAL_PATTERNS]
+    INSTITUTIONAL_LITERALS = [re.sub(r'\\(.)', r'\1', pattern) for pattern in INSTITUTIONAL_PATTERNS]
+    CASE_FOLD_SPECIAL_RE = re.compile('[\u0130\u0131\u017f\u212a]')
+    YEARS_RE = re.compile(r'\b(202[0-6])\b')
+    LIST_ITEM_RE = re.compile(r'\d+\.|\-|\*')
+    
+    # Campos evaluados, en orden: (sección, campo, método de validación, peso)
+    FIELDS = [
+        (1, 'pregunta_investigacion', '_validate_research_question', 0.15),
+        (2, 'marco_teorico', '_validate_theoretical_framework', 0.10),
+        (3, 'estado_del_arte', '_validate_state_of_art', 0.15),
+        (4, 'analisis_critico', '_validate_critical_analysis', 0.15),
+        (5, 'hipotesis', '_validate_hypothesis', 0.20),              # Más peso
+        (6, 'implicaciones', '_validate_practical_implications', 0.10),
+        (7, 'limitaciones', '_validate_limitations', 0.10),
+        (8, 'sistemas_dinamicos', '_validate_dynamic_systems_section', 0.05),
+    ]
+    
+    # Palabras clave (en minúsculas: se comparan con la copia en minúsculas de la sección)
+    QUESTION_KEYWORDS = [kw.lower() for kw in
+                         ['gobernanza', 'governance', 'agente', 'autónomo', 'IA', 'inteligencia artificial']]
+    FRAMEWORK_CONCEPTS = ['viabilidad', 'control', 'legitimidad']
+    CRITICAL_KEYWORDS = ['paradoja', 'tensión', 'contradicción', 'desafío', 'limitación', 'brecha']
+    SUMMARY_KEYWORDS = ['resume', 'resumen', 'síntesis', 'en conclusión']
+    LIMITATION_KEYWORDS = ['requiere', 'no considera', 'limitada', 'futuro', 'validación']
+    DYNAMICS_CONCEPTS = ['retroalimentación', 'feedback', 'dinámico', 'estado', 'evolución']
+    
+    # Versión de las reglas de validación: forma parte de la clave de caché, por lo
+    # que debe incrementarse al cambiar cualquier regla, umbral o ponderación
+    RULES_VERSION = "1.0.0"
+    
+    def __init__(self, cache: Optional[ValidationCache] = None):
+        """
+        Args:
+            cache: Caché persistente de resultados (opcional)
+        """
         self.min_score = 0.80
+        self.cache = cache
+    
+    def cache_key(self, content: str) -> str:
+        """Clave de caché: SHA-256 de la versión de las reglas, el umbral y el contenido"""
+        digest = self._cache_digest()
+        digest.update(content.encode('utf-8'))
+        return digest.hexdigest()
+    
+    def _cache_digest(self):
+        return hashlib.sha256(f"{self.RULES_VERSION}:{self.min_score}\n".encode('utf-8'))
+    
+    def _locate_sections(self, content: str) -> Dict[int, Optional[Tuple[int, int]]]:
+        """
+        Localiza las 8 secciones en una sola pasada sobre los encabezados "##".
+        
+        El cuerpo de cada sección va desde el final de su encabezado hasta el
+        siguiente "\n##" (o el final del documento). Si una sección aparece
+        varias veces, se toma la primera, como haría re.search.
+        
+        Returns:
+            Dict[int, Optional[Tuple[int, int]]]: (inicio, fin) del cuerpo de cada
+            sección en `content` (None si no existe)
+        """
+        spans: Dict[int, Optional[Tuple[int, int]]] = dict.fromkeys(self.SECTION_HEADINGS)
+        remaining = len(spans)
+        
+        position = content.find('##')
+        while position != -1 and remaining:
+            number = self.SECTION_NUMBER.match(content, position)
+            if number:
+                section_id = int(number.group(1))
+                if spans[section_id] is None:
+                    heading = self.SECTION_HEADINGS[section_id].match(content, position)
+                    if heading:
+                        body_start = heading.end()
+                        body_end = content.find('\n##', body_start)
+                        if body_end == -1:
+                            body_end = len(content)
+                        spans[section_id] = (body_start, body_end)
+                        remaining -= 1
+            position = content.find('##', position + 1)
+        
+        return spans
+    
+    def _split_sections(self, content: str) -> Dict[int, Optional[str]]:
+        """
+        Extrae el cuerpo de las 8 secciones (ver _locate_sections).
+        
+        Returns:
+            Dict[int, Optional[str]]: Cuerpo de cada sección (None si no existe)
+        """
+        return {
+            section_id: None if span is None else content[span[0]:span[1]].strip()
+            for section_id, span in self._locate_sections(content).items()
+        }
+    
+    def _find_epistemic_verbs(self, section: str) -> List[str]:
+        """Verbos epistémicos presentes en la sección (en el orden de EPISTEMIC_VERBS)"""
+        found = set()
+        for match in self.EPISTEMIC_VERBS_RE.finditer(section):
+            found.add(match.lastindex - 1)
+            if len(found) == len(self.EPISTEMIC_VERBS):
+                break
+        return [self.EPISTEMIC_VERBS[i] for i in sorted(found)]
+    
+    def _count_institutional_refs(self, section: str, section_lower: Optional[str] = None) -> int:
+        """Cuenta las referencias institucionales (sin solapamiento dentro de cada patrón)"""
+        if self.CASE_FOLD_SPECIAL_RE.search(section):
+            return sum(len(pattern.findall(section)) for pattern in self.INSTITUTIONAL_RES)
+        if section_lower is None:
+            section_lower = section.lower()
+        return sum(section_lower.count(literal) for literal in self.INSTITUTIONAL_LITERALS)
     
     def validate(self, content: str) -> ValidationResult:
         """
@@ -61,60 +209,88 @@ class CAELIONValidator:
         Returns:
             ValidationResult con score y feedback detallado
         """
+        if self.cache is None:
+            return self._score(content)
+        
+        # Un documento sin cambios retorna el resultado guardado (con su timestamp original)
+        key = self.cache_key(content)
+        cached = self.cache.get(key)
+        if cached is not None:
+            return ValidationResult(**cached)
+        
+        result = self._score(content)
+        self.cache.put(key, result_to_dict(result))
+        return result
+    
+    def validate_stream(self, stream: TextIO, chunk_size: int = STREAM_CHUNK_SIZE) -> ValidationResult:
+        """
+        Valida una investigación leyéndola por fragmentos, sin cargarla completa.
+        
+        Solo se conserva el texto de las secciones evaluadas (y una ventana
+        desde el primer encabezado aún no decidido); los anexos se descartan
+        a medida que se leen. El resultado es idéntico al de validate() sobre
+        el contenido completo.
+        
+        Args:
+            stream: Archivo abierto en modo texto (p. ej. open(ruta, encoding='utf-8'))
+            chunk_size: Caracteres leídos por fragmento
+            
+        Returns:
+            ValidationResult con score y feedback detallado
+        """
+        locator = _StreamingSectionLocator(self)
+        digest = self._cache_digest() if self.cache is not None else None
+        
+        while True:
+            chunk = stream.read(chunk_size)
+            if not chunk:
+                break
+            if digest is not None:
+                digest.update(chunk.encode('utf-8'))
+            locator.feed(chunk)
+        sections = locator.finish()
+        
+        if digest is None:
+            return self._score_sections(sections)
+        
+        key = digest.hexdigest()
+        cached = self.cache.get(key)
+        if cached is not None:
+            return ValidationResult(**cached)
+        
+        result = self._score_sections(sections)
+        self.cache.put(key, result_to_dict(result))
+        return result
+    
+    def _score(self, content: str) -> ValidationResult:
+        """Evalúa los 8 campos y calcula el score ponderado"""
+        return self._score_sections(self._split_sections(content))
+    
+    def _score_sections(self, sections: Dict[int, Optional[str]]) -> ValidationResult:
+        """Evalúa los 8 campos a partir del cuerpo de cada sección"""
+        return self._build_result({
+            field: getattr(self, method)(sections[section_id])
+            for section_id, field, method, _ in self.FIELDS
+        })
+    
+    def _build_result(self, field_results: Dict[str, Tuple[float, List[str]]]) -> ValidationResult:
+        """
+        Combina los resultados por campo en el resultado final.
+        
+        Args:
+            field_results: (score, feedback) de cada campo de FIELDS
+            
+        Returns:
+            ValidationResult con el score total (promedio ponderado)
+        """
         field_scores = {}
         feedback = []
-        
-        # 1. Validar pregunta de investigación
-        score_1, fb_1 = self._validate_research_question(content)
-        field_scores['pregunta_investigacion'] = score_1
-        feedback.extend(fb_1)
-        
-        # 2. Validar marco teórico
-        score_2, fb_2 = self._validate_theoretical_framework(content)
-        field_scores['marco_teorico'] = score_2
-        feedback.extend(fb_2)
-        
-        # 3. Validar estado del arte
-        score_3, fb_3 = self._validate_state_of_art(content)
-        field_scores['estado_del_arte'] = score_3
-        feedback.extend(fb_3)
-        
-        # 4. Validar análisis crítico
-        score_4, fb_4 = self._validate_critical_analysis(content)
-        field_scores['analisis_critico'] = score_4
-        feedback.extend(fb_4)
-        
-        # 5. Validar hipótesis propia
-        score_5, fb_5 = self._validate_hypothesis(content)
-        field_scores['hipotesis'] = score_5
-        feedback.extend(fb_5)
-        
-        # 6. Validar implicaciones prácticas
-        score_6, fb_6 = self._validate_practical_implications(content)
-        field_scores['implicaciones'] = score_6
-        feedback.extend(fb_6)
-        
-        # 7. Validar limitaciones
-        score_7, fb_7 = self._validate_limitations(content)
-        field_scores['limitaciones'] = score_7
-        feedback.extend(fb_7)
-        
-        # 8. Validar sección pedagógica de sistemas dinámicos
-        score_8, fb_8 = self._validate_dynamic_systems_section(content)
-        field_scores['sistemas_dinamicos'] = score_8
-        feedback.extend(fb_8)
-        
-        # Calcular score total (promedio ponderado)
-        total_score = (
-            score_1 * 0.15 +  # Pregunta de investigación
-            score_2 * 0.10 +  # Marco teórico
-            score_3 * 0.15 +  # Estado del arte
-            score_4 * 0.15 +  # Análisis crítico
-            score_5 * 0.20 +  # Hipótesis (más peso)
-            score_6 * 0.10 +  # Implicaciones
-            score_7 * 0.10 +  # Limitaciones
-            score_8 * 0.05    # Sistemas dinámicos
-        )
+        total_score = 0.0
+        for _, field, _, weight in self.FIELDS:
+            score, field_feedback = field_results[field]
+            field_scores[field] = score
+            feedback.extend(field_feedback)
+            total_score += score * weight
         
         passed = total_score >= self.min_score
         
@@ -126,21 +302,15 @@ class CAELIONValidator:
             timestamp=datetime.now().isoformat()
         )
     
-    def _validate_research_question(self, content: str) -> Tuple[float, List[str]]:
+    def _validate_research_question(self, question_section: Optional[str]) -> Tuple[float, List[str]]:
         """Valida la pregunta de investigación"""
         feedback = []
         score = 0.0
         
-        # Buscar sección de pregunta de investigación
-        pattern = r'##\s*1\.\s*Pregunta de Investigaci[oó]n\s*\n+(.*?)(?=\n##|$)'
-        match = re.search(pattern, content, re.IGNORECASE | re.DOTALL)
-        
-        if not match:
+        if question_section is None:
             feedback.append("❌ No se encontró la sección 'Pregunta de Investigación'")
             return 0.0, feedback
         
-        question_section = match.group(1).strip()
-        
         # Verificar que contenga una pregunta
         if '?' in question_section:
             score += 0.5
@@ -156,30 +326,25 @@ class CAELIONValidator:
             feedback.append("⚠️ Pregunta demasiado breve")
         
         # Verificar palabras clave de gobernanza
-        keywords = ['gobernanza', 'governance', 'agente', 'autónomo', 'IA', 'inteligencia artificial']
-        if any(kw.lower() in question_section.lower() for kw in keywords):
+        question_lower = question_section.lower()
+        if any(kw in question_lower for kw in self.QUESTION_KEYWORDS):
             score += 0.2
             feedback.append("✅ Contiene palabras clave relevantes")
         
         return min(score, 1.0), feedback
     
-    def _validate_theoretical_framework(self, content: str) -> Tuple[float, List[str]]:
+    def _validate_theoretical_framework(self, framework_section: Optional[str]) -> Tuple[float, List[str]]:
         """Valida el marco teórico"""
         feedback = []
         score = 0.0
         
-        pattern = r'##\s*2\.\s*Marco Te[oó]rico.*?\n+(.*?)(?=\n##|$)'
-        match = re.search(pattern, content, re.IGNORECASE | re.DOTALL)
-        
-        if not match:
+        if framework_section is None:
             feedback.append("❌ No se encontró la sección 'Marco Teórico'")
             return 0.0, feedback
         
-        framework_section = match.group(1).strip()
-        
         # Verificar conceptos clave
-        key_concepts = ['viabilidad', 'control', 'legitimidad']
-        found_concepts = [c for c in key_concepts if c.lower() in framework_section.lower()]
+        framework_lower = framework_section.lower()
+        found_concepts = [c for c in self.FRAMEWORK_CONCEPTS if c in framework_lower]
         
         if len(found_concepts) >= 2:
             score += 0.6
@@ -194,24 +359,18 @@ class CAELIONValidator:
         
         return min(score, 1.0), feedback
     
-    def _validate_state_of_art(self, content: str) -> Tuple[float, List[str]]:
+    def _validate_state_of_art(self, state_section: Optional[str]) -> Tuple[float, List[str]]:
         """Valida el estado del arte (análisis de tesis)"""
         feedback = []
         score = 0.0
         
-        pattern = r'##\s*3\.\s*Estado del Arte.*?\n+(.*?)(?=\n##|$)'
-        match = re.search(pattern, content, re.IGNORECASE | re.DOTALL)
-        
-        if not match:
+        if state_section is None:
             feedback.append("❌ No se encontró la sección 'Estado del Arte'")
             return 0.0, feedback
         
-        state_section = match.group(1).strip()
-        
         # Verificar referencias a tesis (URLs institucionales)
-        institutional_refs = 0
-        for pattern in self.INSTITUTIONAL_PATTERNS:
-            institutional_refs += len(re.findall(pattern, state_section, re.IGNORECASE))
+        state_lower = state_section.lower()
+        institutional_refs = self._count_institutional_refs(state_section, state_lower)
         
         if institutional_refs >= 3:
             score += 0.5
@@ -223,7 +382,7 @@ class CAELIONValidator:
             feedback.append("❌ No se detectaron referencias institucionales")
         
         # Verificar análisis de tesis (menciones de años 2020-2026)
-        years = re.findall(r'\b(202[0-6])\b', state_section)
+        years = self.YEARS_RE.findall(state_section)
         if len(years) >= 3:
             score += 0.3
             feedback.append("✅ Incluye tesis recientes (2020-2026)")
@@ -235,23 +394,18 @@ class CAELIONValidator:
         
         return min(score, 1.0), feedback
     
-    def _validate_critical_analysis(self, content: str) -> Tuple[float, List[str]]:
+    def _validate_critical_analysis(self, analysis_section: Optional[str]) -> Tuple[float, List[str]]:
         """Valida el análisis crítico"""
         feedback = []
         score = 0.0
         
-        pattern = r'##\s*4\.\s*An[aá]lisis Cr[ií]tico.*?\n+(.*?)(?=\n##|$)'
-        match = re.search(pattern, content, re.IGNORECASE | re.DOTALL)
-        
-        if not match:
+        if analysis_section is None:
             feedback.append("❌ No se encontró la sección 'Análisis Crítico'")
             return 0.0, feedback
         
-        analysis_section = match.group(1).strip()
-        
         # Verificar palabras clave de análisis crítico
-        critical_keywords = ['paradoja', 'tensión', 'contradicción', 'desafío', 'limitación', 'brecha']
-        found_keywords = [kw for kw in critical_keywords if kw.lower() in analysis_section.lower()]
+        analysis_lower = analysis_section.lower()
+        found_keywords = [kw for kw in self.CRITICAL_KEYWORDS if kw in analysis_lower]
         
         if len(found_keywords) >= 2:
             score += 0.6
@@ -266,25 +420,17 @@ class CAELIONValidator:
         
         return min(score, 1.0), feedback
     
-    def _validate_hypothesis(self, content: str) -> Tuple[float, List[str]]:
+    def _validate_hypothesis(self, hypothesis_section: Optional[str]) -> Tuple[float, List[str]]:
         """Valida la hipótesis propia (campo más crítico)"""
         feedback = []
         score = 0.0
         
-        pattern = r'##\s*5\.\s*Hip[oó]tesis Propia.*?\n+(.*?)(?=\n##|$)'
-        match = re.search(pattern, content, re.IGNORECASE | re.DOTALL)
-        
-        if not match:
+        if hypothesis_section is None:
             feedback.append("❌ No se encontró la sección 'Hipótesis Propia'")
             return 0.0, feedback
         
-        hypothesis_section = match.group(1).strip()
-        
         # CRÍTICO: Verificar verbos epistémicos
-        found_verbs = []
-        for verb in self.EPISTEMIC_VERBS:
-            if re.search(r'\b' + verb + r'\b', hypothesis_section, re.IGNORECASE):
-                found_verbs.append(verb)
+        found_verbs = self._find_epistemic_verbs(hypothesis_section)
         
         if len(found_verbs) >= 2:
             score += 0.5
@@ -296,8 +442,8 @@ class CAELIONValidator:
             feedback.append("❌ No se detectaron verbos epistémicos (argumento, propongo, sostengo, etc.)")
         
         # Verificar que no sea un mero resumen
-        summary_keywords = ['resume', 'resumen', 'síntesis', 'en conclusión']
-        if not any(kw in hypothesis_section.lower() for kw in summary_keywords):
+        hypothesis_lower = hypothesis_section.lower()
+        if not any(kw in hypothesis_lower for kw in self.SUMMARY_KEYWORDS):
             score += 0.3
             feedback.append("✅ No es un simple resumen")
         else:
@@ -310,22 +456,17 @@ class CAELIONValidator:
         
         return min(score, 1.0), feedback
     
-    def _validate_practical_implications(self, content: str) -> Tuple[float, List[str]]:
+    def _validate_practical_implications(self, implications_section: Optional[str]) -> Tuple[float, List[str]]:
         """Valida las implicaciones prácticas"""
         feedback = []
         score = 0.0
         
-        pattern = r'##\s*6\.\s*Implicaciones Pr[aá]cticas.*?\n+(.*?)(?=\n##|$)'
-        match = re.search(pattern, content, re.IGNORECASE | re.DOTALL)
-        
-        if not match:
+        if implications_section is None:
             feedback.append("❌ No se encontró la sección 'Implicaciones Prácticas'")
             return 0.0, feedback
         
-        implications_section = match.group(1).strip()
-        
         # Verificar enumeración o lista
-        if re.search(r'\d+\.|\-|\*', implications_section):
+        if self.LIST_ITEM_RE.search(implications_section):
             score += 0.5
             feedback.append("✅ Contiene lista de implicaciones")
         
@@ -336,20 +477,15 @@ class CAELIONValidator:
         
         return min(score, 1.0), feedback
     
-    def _validate_limitations(self, content: str) -> Tuple[float, List[str]]:
+    def _validate_limitations(self, limitations_section: Optional[str]) -> Tuple[float, List[str]]:
         """Valida las limitaciones explícitas"""
         feedback = []
         score = 0.0
         
-        pattern = r'##\s*7\.\s*Limitaciones Expl[ií]citas.*?\n+(.*?)(?=\n##|$)'
-        match = re.search(pattern, content, re.IGNORECASE | re.DOTALL)
-        
-        if not match:
+        if limitations_section is None:
             feedback.append("❌ No se encontró la sección 'Limitaciones Explícitas'")
             return 0.0, feedback
         
-        limitations_section = match.group(1).strip()
-        
         # CRÍTICO: Verificar que sean específicas (>100 caracteres)
         if len(limitations_section) > 100:
             score += 0.6
@@ -358,30 +494,25 @@ class CAELIONValidator:
             feedback.append("❌ Limitaciones demasiado genéricas (<100 caracteres)")
         
         # Verificar palabras clave de limitaciones
-        limitation_keywords = ['requiere', 'no considera', 'limitada', 'futuro', 'validación']
-        if any(kw in limitations_section.lower() for kw in limitation_keywords):
+        limitations_lower = limitations_section.lower()
+        if any(kw in limitations_lower for kw in self.LIMITATION_KEYWORDS):
             score += 0.4
             feedback.append("✅ Contiene palabras clave de limitaciones")
         
         return min(score, 1.0), feedback
     
-    def _validate_dynamic_systems_section(self, content: str) -> Tuple[float, List[str]]:
+    def _validate_dynamic_systems_section(self, dynamics_section: Optional[str]) -> Tuple[float, List[str]]:
         """Valida la sección pedagógica de sistemas dinámicos"""
         feedback = []
         score = 0.0
         
-        pattern = r'##\s*8\.\s*Secci[oó]n Pedag[oó]gica.*?Sistemas Din[aá]micos.*?\n+(.*?)(?=\n##|$)'
-        match = re.search(pattern, content, re.IGNORECASE | re.DOTALL)
-        
-        if not match:
+        if dynamics_section is None:
             feedback.append("❌ No se encontró la sección pedagógica de Sistemas Dinámicos")
             return 0.0, feedback
         
-        dynamics_section = match.group(1).strip()
-        
         # Verificar conceptos clave
-        key_concepts = ['retroalimentación', 'feedback', 'dinámico', 'estado', 'evolución']
-        found = [c for c in key_concepts if c.lower() in dynamics_section.lower()]
+        dynamics_lower = dynamics_section.lower()
+        found = [c for c in self.DYNAMICS_CONCEPTS if c in dynamics_lower]
         
         if len(found) >= 2:
             score += 0.7
@@ -395,32 +526,487 @@ class CAELIONValidator:
         return min(score, 1.0), feedback
 
 
+class _StreamingSectionLocator:
+    """
+    Equivalente incremental de CAELIONValidator._locate_sections.
+    
+    Recorre los "##" en orden, como el original, a medida que llega el texto.
+    Un encabezado se decide solo cuando el búfer contiene todo lo que su
+    patrón podría consumir: hasta el primer carácter no blanco posterior al
+    salto de línea que sigue al título. El encabezado 8 se descompone en
+    prefijo y tema: tras el primer prefijo válido basta con buscar la primera
+    aparición de "Sistemas Dinámicos", sin retener el texto intermedio.
+    
+    El texto anterior a la ventana de búsqueda se descarta, salvo el de las
+    secciones abiertas, que se acumula hasta su siguiente "\n##".
+    """
+    
+    def __init__(self, validator: CAELIONValidator):
+        self.validator = validator
+        self.buffer = ''
+        self.base = 0                                   # Posición global de buffer[0]
+        self.scan = 0                                   # Próxima posición global de búsqueda de "##"
+        self.eof = False
+        self.found = set()                              # Secciones con encabezado ya decidido
+        self.open: Dict[int, Tuple[int, List[str]]] = {}  # Sección -> (inicio global, texto descartado)
+        self.bodies: Dict[int, str] = {}
+        self.topic_from: Optional[int] = None           # Búsqueda pendiente del tema de la sección 8
+    
+    def feed(self, chunk: str):
+        self.buffer += chunk
+        self._process()
+        self._trim()
+    
+    def finish(self) -> Dict[int, Optional[str]]:
+        """Procesa el final del documento y retorna el cuerpo de cada sección"""
+        self.eof = True
+        self._process()
+        for section_id, (start, pieces) in self.open.items():
+            pieces.append(self.buffer[max(start - self.base, 0):])
+            self.bodies[section_id] = ''.join(pieces)
+        self.open = {}
+        return {
+            section_id: self.bodies[section_id].strip() if section_id in self.bodies else None
+            for section_id in self.validator.SECTION_HEADINGS
+        }
+    
+    def _process(self):
+        buffer = self.buffer
+        while True:
+            self._resolve_topic()
+            if len(self.found) == len(self.validator.SECTION_HEADINGS) and self.topic_from is None:
+                # Ya solo interesa el "\n##" que cierra las secciones abiertas
+                if not self.open:
+                    self.scan = self.base + len(buffer)
+                    return
+                newline = buffer.find('\n##', max(self.scan - self.base - 1, 0))
+                position = -1 if newline == -1 else newline + 1
+            else:
+                position = buffer.find('##', self.scan - self.base)
+            if position == -1:
+                # Conservar el último carácter por si "##" queda partido entre fragmentos
+                self.scan = max(self.scan, self.base + len(buffer) - 1)
+                return
+            self._close_bodies(position)
+            if not self._decide_heading(position):
+                self.scan = self.base + position
+                return
+            self.scan = self.base + position + 1
+    
+    def _close_bodies(self, position: int):
+        """Un "\n##" termina las secciones abiertas que empiezan en o antes del salto de línea"""
+        if position == 0 or self.buffer[position - 1] != '\n':
+            return
+        newline = self.base + position - 1
+        for section_id, (start, pieces) in list(self.open.items()):
+            if start <= newline:
+                pieces.append(self.buffer[max(start - self.base, 0):position - 1])
+                self.bodies[section_id] = ''.join(pieces)
+                del self.open[section_id]
+    
+    def _decide_heading(self, position: int) -> bool:
+        """
+        Evalúa el "##" en `position` (índice del búfer).
+        
+        Returns:
+            bool: False si hace falta más texto para decidirlo
+        """
+        validator = self.validator
+        buffer = self.buffer
+        if len(self.found) == len(validator.SECTION_HEADINGS):
+            return True
+        
+        digit = validator.NON_WHITESPACE.search(buffer, position + 2)
+        if digit is None or digit.start() + 1 >= len(buffer):
+            return self.eof and self._match_heading(position)
+        return self._match_heading(position)
+    
+    def _match_heading(self, position: int) -> bool:
+        validator = self.validator
+        buffer = self.buffer
+        number = validator.SECTION_NUMBER.match(buffer, position)
+        if not number:
+            return True
+        section_id = int(number.group(1))
+        if section_id in self.found:
+            return True
+        
+        if not self.eof:
+            title = validator.NON_WHITESPACE.search(buffer, number.end())
+            line_end = buffer.find('\n', title.start()) if title else -1
+            if line_end == -1 or validator.NON_WHITESPACE.search(buffer, line_end) is None:
+                return False
+        
+        if section_id == 8:
+            prefix = validator.SECTION_8_PREFIX.match(buffer, position)
+            if prefix:
+                self.found.add(8)
+                self.topic_from = self.base + prefix.end()
+            return True
+        
+        heading = validator.SECTION_HEADINGS[section_id].match(buffer, position)
+        if heading:
+            self.found.add(section_id)
+            self.open[section_id] = (self.base + heading.end(), [])
+        return True
+    
+    def _resolve_topic(self):
+        """Busca "Sistemas Dinámicos" tras el prefijo del encabezado 8"""
+        if self.topic_from is None:
+            return
+        validator = self.validator
+        buffer = self.buffer
+        start = self.topic_from - self.base
+        
+        topic = validator.SECTION_8_TOPIC.search(buffer, start)
+        if topic is None:
+            if self.eof:
+                self.topic_from = None
+            else:
+                # El tema podría quedar partido entre fragmentos
+                keep = len(buffer) - validator.SECTION_8_TOPIC_LENGTH + 1
+                self.topic_from = self.base + max(start, keep)
+            return
+        
+        self.topic_from = self.base + topic.start()
+        line_end = buffer.find('\n', topic.end())
+        if line_end == -1:
+            if self.eof:
+                self.topic_from = None
+            return
+        body = validator.NON_NEWLINE.search(buffer, line_end)
+        if body is None and not self.eof:
+            return
+        
+        self.topic_from = None
+        self.open[8] = (self.base + (body.start() if body else len(buffer)), [])
+    
+    def _trim(self):
+        """Descarta el texto ya procesado, guardando el de las secciones abiertas"""
+        cut = self.scan - self.base - 1
+        if self.topic_from is not None:
+            cut = min(cut, self.topic_from - self.base)
+        if cut <= 0:
+            return
+        for start, pieces in self.open.values():
+            if start - self.base < cut:
+                pieces.append(self.buffer[max(start - self.base, 0):cut])
+        self.buffer = self.buffer[cut:]
+        self.base += cut
+
+
+class ValidationSession:
+    """
+    Sesión de validación incremental de un documento en edición.
+    
+    Conserva los límites y el texto de cada sección de la versión anterior y,
+    en cada actualización, solo vuelve a ejecutar los `_validate_*` de las
+    secciones cuyo texto cambió; el resto de campos reutiliza su resultado y
+    el score total se recalcula con las ponderaciones de FIELDS.
+    """
+    
+    def __init__(self, validator: Optional[CAELIONValidator] = None):
+        """
+        Args:
+            validator: Validador a utilizar (por defecto, uno nuevo sin caché)
+        """
+        self.validator = validator or CAELIONValidator()
+        self.spans: Dict[int, Optional[Tuple[int, int]]] = {}
+        self.result: Optional[ValidationResult] = None
+        self.revalidated: List[str] = []  # Campos re-evaluados en la última actualización
+        self._sections: Dict[int, Optional[str]] = {}  # Texto sin recortar de cada sección
+        self._field_results: Dict[str, Tuple[float, List[str]]] = {}
+    
+    def update(self, content: str) -> ValidationResult:
+        """
+        Valida la nueva versión del documento.
+        
+        Args:
+            content: Contenido completo del documento tras la edición
+            
+        Returns:
+            ValidationResult idéntico (salvo timestamp) al de validator.validate(content)
+        """
+        validator = self.validator
+        self.spans = validator._locate_sections(content)
+        self.revalidated = []
+        
+        for section_id, field, method, _ in validator.FIELDS:
+            span = self.spans[section_id]
+            previous = self._sections.get(section_id, False)
+            
+            # Comparación in situ del texto anterior (startswith no copia la sección):
+            # exacta y más barata que extraer la sección y calcular su hash
+            if span is None:
+                if previous is None:
+                    continue
+                raw = None
+            else:
+                start, end = span
+                if isinstance(previous, str) and len(previous) == end - start and content.startswith(previous, start):
+                    continue
+                raw = content[start:end]
+            
+            self._sections[section_id] = raw
+            self._field_results[field] = getattr(validator, method)(None if raw is None else raw.strip())
+            self.revalidated.append(field)
+        
+        self.result = validator._build_result(self._field_results)
+        return self.result
+    
+    def reset(self):
+        """Descarta el estado de la versión anterior"""
+        self.spans = {}
+        self.result = None
+        self.revalidated = []
+        self._sections = {}
+        self._field_results = {}
+
+
+# ========== MODO POR LOTES ==========
+
+GLOB_CHARS = set('*?[')
+
+_worker_validator: Optional[CAELIONValidator] = None
+_worker_cache: Optional[ValidationCache] = None
+
+
+def expand_input_paths(inputs: Iterable[str], pattern: str = '*.md') -> List[str]:
+    """
+    Expande archivos, directorios (recursivamente) y globs en una lista de archivos.
+    
+    Las rutas explícitas (sin comodines) se conservan aunque no existan, para
+    que validate_file las registre como error; un glob sin coincidencias se
+    avisa por stderr.
+    
+    Args:
+        inputs: Rutas de archivo, directorios o patrones glob
+        pattern: Patrón de los archivos a incluir de cada directorio
+        
+    Returns:
+        Lista ordenada y sin duplicados de archivos a validar
+    """
+    files = []
+    seen = set()
+    
+    def add(path):
+        if path not in seen:
+            seen.add(path)
+            files.append(path)
+    
+    for item in inputs:
+        if GLOB_CHARS & set(item):
+            candidates = sorted(glob.glob(item, recursive=True))
+            if not candidates:
+                print(f"⚠️ El patrón no coincide con ningún archivo: {item}", file=sys.stderr)
+        else:
+            candidates = [item]
+        
+        for candidate in candidates:
+            if os.path.isdir(candidate):
+                for path in sorted(glob.glob(os.path.join(candidate, '**', pattern), recursive=True)):
+                    if os.path.isfile(path):
+                        add(path)
+            elif candidate == item or os.path.isfile(candidate):
+                # Una ruta explícita inexistente se valida igualmente y cuenta como error
+                add(candidate)
+    
+    return files
+
+
+def result_to_dict(result: ValidationResult) -> Dict:
+    """Convierte un resultado de validación a diccionario para serialización"""
+    return {
+        'score': result.score,
+        'passed': result.passed,
+        'field_scores': result.field_scores,
+        'feedback': result.feedback,
+        'timestamp': result.timestamp
+    }
+
+
+def _init_worker(cache_path: Optional[str] = None):
+    global _worker_validator, _worker_cache
+    if cache_path is None:
+        cache = None
+    else:
+        if _worker_cache is None or _worker_cache.path != cache_path:
+            _worker_cache = ValidationCache(cache_path)
+        cache = _worker_cache
+    _worker_validator = CAELIONValidator(cache=cache)
+
+
+def validate_file(path: str) -> Dict:
+    """
+    Valida un archivo (en un proceso del pool o en el proceso actual).
+    
+    Returns:
+        Dict con la ruta y el resultado, o con el error producido
+    """
+    if _worker_validator is None:
+        _init_worker()
+    
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            result = _worker_validator.validate_stream(f)
+    except (OSError, UnicodeDecodeError) as e:
+        return {'path': path, 'error': str(e)}
+    
+    return {'path': path, **result_to_dict(result)}
+
+
+def run_batch(paths: List[str], workers: int = 0, chunksize: int = 4,
+              cache_path: Optional[str] = None) -> Iterator[Dict]:
+    """
+    Valida un lote de archivos en un pool de procesos.
+    
+    Los resultados se producen en el orden de `paths` a medida que están listos.
+    
+    Args:
+        paths: Archivos a validar
+        workers: Procesos del pool (0 = número de CPUs; 1 = sin pool)
+        chunksize: Archivos enviados a cada proceso por tarea
+        cache_path: Caché SQLite de resultados compartida por los procesos (opcional)
+    """
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(paths) <= 1:
+        _init_worker(cache_path)
+        for path in paths:
+            yield validate_file(path)
+        return
+    
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(cache_path,)) as executor:
+        yield from executor.map(validate_file, paths, chunksize=chunksize)
+
+
+def summarize_results(records: List[Dict]) -> Dict:
+    """
+    Calcula la tasa de aprobación y la distribución de scores por campo.
+    
+    Args:
+        records: Resultados producidos por validate_file
+        
+    Returns:
+        Dict con totales, tasa de aprobación y estadísticas por campo
+    """
+    valid = [r for r in records if 'error' not in r]
+    passed = sum(1 for r in valid if r['passed'])
+    
+    def distribution(values: List[float]) -> Dict:
+        if not values:
+            return {}
+        return {
+            'mean': round(statistics.fmean(values), 3),
+            'min': min(values),
+            'median': statistics.median(values),
+            'max': max(values),
+            # Mismos umbrales que el informe de un solo archivo
+            'ok': sum(1 for v in values if v >= 0.7),
+            'warning': sum(1 for v in values if 0.5 <= v < 0.7),
+            'failed': sum(1 for v in values if v < 0.5)
+        }
+    
+    fields = valid[0]['field_scores'].keys() if valid else []
+    return {
+        'total': len(records),
+        'validated': len(valid),
+        'errors': len(records) - len(valid),
+        'passed': passed,
+        'pass_rate': round(passed / len(valid), 3) if valid else 0.0,
+        'score': distribution([r['score'] for r in valid]),
+        'field_scores': {f: distribution([r['field_scores'][f] for r in valid]) for f in fields}
+    }
+
+
+def _print_summary(summary: Dict, stream):
+    print("=" * 60, file=stream)
+    print(f"📊 Archivos: {summary['total']} (validados: {summary['validated']}, "
+          f"errores: {summary['errors']})", file=stream)
+    print(f"✅ Aprobados: {summary['passed']} ({summary['pass_rate']:.1%})", file=stream)
+    if summary['score']:
+        score = summary['score']
+        print(f"📈 Score: media={score['mean']:.3f} mediana={score['median']:.3f} "
+              f"min={score['min']:.3f} max={score['max']:.3f}", file=stream)
+    print("📋 Scores por campo (media | ✅ ≥0.7 / ⚠️ ≥0.5 / ❌ <0.5):", file=stream)
+    for field, dist in summary['field_scores'].items():
+        print(f"  {field}: {dist['mean']:.2f} | {dist['ok']} / {dist['warning']} / {dist['failed']}",
+              file=stream)
+
+
+def batch_main(argv: List[str]) -> int:
+    """Punto de entrada del modo por lotes"""
+    import argparse
+    
+    parser = argparse.ArgumentParser(
+        prog='caelion_validator.py',
+        description='Valida en paralelo un corpus de investigaciones (salida JSON lines)'
+    )
+    parser.add_argument('inputs', nargs='+', help='Archivos, directorios o patrones glob')
+    parser.add_argument('-o', '--output', help='Archivo JSON lines de salida (por defecto, stdout)')
+    parser.add_argument('-j', '--workers', type=int, default=0,
+                        help='Procesos de validación (por defecto, número de CPUs)')
+    parser.add_argument('--pattern', default='*.md', help='Archivos incluidos de cada directorio')
+    parser.add_argument('--chunksize', type=int, default=4, help='Archivos por tarea del pool')
+    parser.add_argument('--cache', help='Caché SQLite de resultados (los documentos sin cambios no se re-evalúan)')
+    args = parser.parse_args(argv)
+    
+    paths = expand_input_paths(args.inputs, args.pattern)
+    if not paths:
+        print("❌ No se encontraron archivos para validar", file=sys.stderr)
+        return 1
+    
+    out = open(args.output, 'w', encoding='utf-8') if args.output else sys.stdout
+    records = []
+    try:
+        for record in run_batch(paths, args.workers, args.chunksize, args.cache):
+            out.write(json.dumps(record, ensure_ascii=False) + '\n')
+            out.flush()
+            # Solo se retiene lo necesario para el resumen final
+            records.append({k: record[k] for k in ('error', 'passed', 'score', 'field_scores') if k in record})
+    finally:
+        if args.output:
+            out.close()
+    
+    summary = summarize_results(records)
+    _print_summary(summary, sys.stderr)
+    return 0 if summary['passed'] == summary['total'] else 1
+
+
+def _is_batch_invocation(argv: List[str]) -> bool:
+    """El modo de un solo archivo se conserva para `caelion_validator.py <archivo.md>`"""
+    if len(argv) != 1:
+        return len(argv) > 1
+    target = argv[0]
+    return target.startswith('-') or os.path.isdir(target) or bool(GLOB_CHARS & set(target))
+
+
 def main():
     """Demo del validador"""
+    if _is_batch_invocation(sys.argv[1:]):
+        return batch_main(sys.argv[1:])
+    
     print("=" * 60)
     print("CAELION - Validador Estructural de Investigaciones Académicas")
     print("=" * 60)
     print()
     
     # Leer archivo de investigación
-    import sys
     if len(sys.argv) < 2:
         print("Uso: python3.11 caelion_validator.py <archivo.md>")
         sys.exit(1)
     
     filepath = sys.argv[1]
     
+    # Validar (en streaming: los anexos no se cargan completos en memoria)
+    validator = CAELIONValidator()
     try:
         with open(filepath, 'r', encoding='utf-8') as f:
-            content = f.read()
+            result = validator.validate_stream(f)
     except FileNotFoundError:
         print(f"❌ Archivo no encontrado: {filepath}")
         sys.exit(1)
     
-    # Validar
-    validator = CAELIONValidator()
-    result = validator.validate(content)
-    
     # Mostrar resultados
     print(f"📊 SCORE DE VALIDACIÓN: {result.score:.3f}")
     print(f"{'✅ APROBADO' if result.passed else '❌ RECHAZADO'} (umbral: 0.80)")
@@ -0,0 +1,360 @@
+#!/usr/bin/env python3
+"""
+Registro de Consensos - Log Segmentado de Solo Anexado de LIANG
+
+Este módulo implementa la persistencia write-ahead del historial de consensos,
+responsable de:
+1. Anexar registros con prefijo de longitud y CRC32 a segmentos en disco.
+2. Agrupar escrituras (group commit) en un hilo de fondo con política de
+   fsync configurable ("always", "batch" o "never").
+3. Rotar segmentos por tamaño y, opcionalmente, retener solo los últimos N.
+4. Recuperar el log tras una caída descartando el registro final incompleto.
+5. Leer el historial en streaming, sin cargarlo completo en memoria.
+
+Formato de segmento: cabecera SEGMENT_MAGIC seguida de registros
+`longitud (uint32 BE) | crc32 (uint32 BE) | formato (1 byte) | carga`,
+donde el CRC cubre el byte de formato y la carga. El formato es "J" (JSON
+compacto) o "B" (codificación canónica de binary_codec).
+
+Autor: Manus AI (bajo DOS-03)
+Fecha: 26 de enero de 2026
+"""
+
+import json
+import os
+import struct
+import threading
+import time
+import zlib
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+import logging
+
+import binary_codec
+
+logger = logging.getLogger(__name__)
+
+SEGMENT_MAGIC = b"CAELION-CLOG-1\n"
+SEGMENT_PREFIX = "consensus-"
+SEGMENT_SUFFIX = ".log"
+
+RECORD_HEADER = struct.Struct(">IIc")  # longitud, crc32, formato
+FORMAT_JSON = b"J"
+FORMAT_BINARY = b"B"
+
+FSYNC_POLICIES = ("always", "batch", "never")
+
+
+def encode_record(payload: bytes, fmt: bytes = FORMAT_JSON) -> bytes:
+    """Codifica un registro (cabecera + carga)"""
+    crc = zlib.crc32(payload, zlib.crc32(fmt))
+    return RECORD_HEADER.pack(len(payload), crc, fmt) + payload
+
+
+def encode_json(record: Dict) -> bytes:
+    """Carga JSON compacta de un registro"""
+    return json.dumps(record, separators=(",", ":"), sort_keys=True, default=str).encode("utf-8")
+
+
+def encode_binary(record: Any) -> bytes:
+    """Carga binaria canónica de un registro (binary_codec)"""
+    return binary_codec.encode(record, default=str)
+
+
+def decode_payload(fmt: bytes, payload: bytes) -> Any:
+    """
+    Decodifica la carga de un registro según su byte de formato.
+
+    Raises:
+        ValueError: Si el formato es desconocido o la carga no es válida
+    """
+    if fmt == FORMAT_BINARY:
+        return binary_codec.decode(payload)
+    if fmt == FORMAT_JSON:
+        return json.loads(payload)
+    raise ValueError(f"Unknown consensus log record format: {fmt!r}")
+
+
+def list_segments(directory: str) -> List[str]:
+    """Rutas de los segmentos del log, en orden"""
+    if not os.path.isdir(directory):
+        return []
+    names = sorted(
+        name for name in os.listdir(directory)
+        if name.startswith(SEGMENT_PREFIX) and name.endswith(SEGMENT_SUFFIX)
+    )
+    return [os.path.join(directory, name) for name in names]
+
+
+def _segment_path(directory: str, index: int) -> str:
+    return os.path.join(directory, f"{SEGMENT_PREFIX}{index:08d}{SEGMENT_SUFFIX}")
+
+
+def _segment_index(path: str) -> int:
+    name = os.path.basename(path)
+    return int(name[len(SEGMENT_PREFIX):-len(SEGMENT_SUFFIX)])
+
+
+def scan_segment(path: str) -> Iterator[Tuple[bytes, bytes, int]]:
+    """
+    Recorre los registros válidos de un segmento.
+
+    Se detiene en el primer registro incompleto o con CRC inválido.
+
+    Yields:
+        Tuple[bytes, bytes, int]: (formato, carga, desplazamiento tras el registro)
+    """
+    with open(path, "rb") as f:
+        if f.read(len(SEGMENT_MAGIC)) != SEGMENT_MAGIC:
+            return
+        offset = len(SEGMENT_MAGIC)
+        while True:
+            header = f.read(RECORD_HEADER.size)
+            if len(header) < RECORD_HEADER.size:
+                return
+            length, crc, fmt = RECORD_HEADER.unpack(header)
+            payload = f.read(length)
+            if len(payload) < length or zlib.crc32(payload, zlib.crc32(fmt)) != crc:
+                return
+            offset += RECORD_HEADER.size + length
+            yield fmt, payload, offset
+
+
+def read_records(directory: str) -> Iterator[Tuple[bytes, bytes]]:
+    """
+    Lee en streaming todos los registros del log.
+
+    Un registro final truncado o corrupto (escritura interrumpida) marca el
+    fin del segmento; si no es el último segmento, se registra el error.
+
+    Yields:
+        Tuple[bytes, bytes]: (formato, carga)
+    """
+    segments = list_segments(directory)
+    for position, path in enumerate(segments):
+        end = len(SEGMENT_MAGIC)
+        for fmt, payload, end in scan_segment(path):
+            yield fmt, payload
+        if position < len(segments) - 1 and end < os.path.getsize(path):
+            logger.error(f"Corrupted record in consensus log segment {path} at offset {end}")
+
+
+def read_json_records(directory: str) -> Iterator[Dict]:
+    """Lee en streaming los registros JSON del log"""
+    for fmt, payload in read_records(directory):
+        if fmt == FORMAT_JSON:
+            yield json.loads(payload)
+
+
+def read_decoded_records(directory: str) -> Iterator[Any]:
+    """Lee en streaming los registros del log en cualquiera de sus formatos (JSON o binario)"""
+    for fmt, payload in read_records(directory):
+        yield decode_payload(fmt, payload)
+
+
+class SegmentLog:
+    """
+    Log segmentado de solo anexado con group commit.
+
+    `append` solo encola el registro; un hilo de fondo escribe juntos todos
+    los registros pendientes con una única llamada a write (y a fsync, según
+    la política). Con la política "always", `append` espera a que el lote que
+    contiene su registro sea durable; varios hilos comparten el mismo fsync.
+    """
+
+    def __init__(self,
+                 directory: str,
+                 fsync_policy: str = "batch",
+                 group_commit_ms: float = 2.0,
+                 segment_max_bytes: int = 64 * 1024 * 1024,
+                 max_segments: Optional[int] = None,
+                 encoder: Callable[[Any], bytes] = encode_json,
+                 fmt: bytes = FORMAT_JSON):
+        """
+        Args:
+            directory: Directorio de los segmentos
+            fsync_policy: "always" (durable al retornar append), "batch" (fsync
+                          por lote, en segundo plano) o "never" (solo write)
+            group_commit_ms: Espera máxima para acumular registros en un lote
+            segment_max_bytes: Tamaño a partir del cual se rota el segmento
+            max_segments: Segmentos retenidos (por defecto, todos)
+            encoder: Conversión de un registro en su carga
+            fmt: Byte de formato de los registros codificados con `encoder`
+        """
+        if fsync_policy not in FSYNC_POLICIES:
+            raise ValueError(f"Unknown fsync policy: {fsync_policy}")
+
+        self.directory = directory
+        self.fsync_policy = fsync_policy
+        self.group_commit_seconds = group_commit_ms / 1000.0
+        self.segment_max_bytes = segment_max_bytes
+        self.max_segments = max_segments
+        self.encoder = encoder
+        self.fmt = fmt
+
+        self._pending: List[Any] = []
+        self._enqueued = 0
+        self._written = 0
+        self._condition = threading.Condition()
+        self._closed = False
+        self._failed_range: Optional[Tuple[int, int]] = None
+        self.records_written = 0
+        self.batches_written = 0
+
+        os.makedirs(directory, exist_ok=True)
+        self._open_segment()
+        self._thread = threading.Thread(target=self._run, name="liang-consensus-log", daemon=True)
+        self._thread.start()
+
+    # ========== SEGMENTOS ==========
+
+    def _open_segment(self):
+        """Abre el último segmento (recuperando su final) o crea el primero"""
+        segments = list_segments(self.directory)
+        if not segments:
+            self._start_segment(0)
+            return
+
+        path = segments[-1]
+        with open(path, "rb") as f:
+            header_ok = f.read(len(SEGMENT_MAGIC)) == SEGMENT_MAGIC
+        if not header_ok:
+            # Segmento sin cabecera completa (caída al crearlo): se reinicia
+            logger.warning(f"Rewriting consensus log segment without valid header: {path}")
+            self._start_segment(_segment_index(path))
+            return
+
+        valid_end = len(SEGMENT_MAGIC)
+        for _, _, valid_end in scan_segment(path):
+            pass
+        size = os.path.getsize(path)
+        if valid_end < size:
+            logger.warning(f"Truncating torn tail of {path}: {size - valid_end} bytes")
+            with open(path, "r+b") as f:
+                f.truncate(valid_end)
+                os.fsync(f.fileno())
+
+        self._file = open(path, "ab")
+        self._segment_index = _segment_index(path)
+        self._segment_bytes = valid_end
+
+    def _start_segment(self, index: int):
+        path = _segment_path(self.directory, index)
+        self._file = open(path, "wb")
+        self._file.write(SEGMENT_MAGIC)
+        self._file.flush()
+        if self.fsync_policy != "never":
+            os.fsync(self._file.fileno())
+            self._fsync_directory()
+        self._segment_index = index
+        self._segment_bytes = len(SEGMENT_MAGIC)
+
+    def _rotate(self):
+        self._file.close()
+        self._start_segment(self._segment_index + 1)
+        if self.max_segments is not None:
+            for path in list_segments(self.directory)[:-self.max_segments]:
+                os.remove(path)
+        logger.info(f"Consensus log rotated to segment {self._segment_index}")
+
+    def _fsync_directory(self):
+        fd = os.open(self.directory, os.O_RDONLY)
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+
+    # ========== ESCRITURA ==========
+
+    def append(self, record: Any) -> int:
+        """
+        Encola un registro para su escritura.
+
+        Returns:
+            int: Número de secuencia del registro en esta sesión
+        """
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("Consensus log is closed")
+            self._pending.append(record)
+            self._enqueued += 1
+            sequence = self._enqueued
+            self._condition.notify_all()
+
+            if self.fsync_policy == "always":
+                while self._written < sequence:
+                    self._condition.wait()
+                failed = self._failed_range
+                if failed is not None and failed[0] <= sequence <= failed[1]:
+                    raise OSError(f"Consensus log write failed for record {sequence}")
+        return sequence
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Espera a que se escriban todos los registros encolados hasta ahora.
+
+        Returns:
+            bool: True si se completó antes del timeout
+        """
+        with self._condition:
+            target = self._enqueued
+            self._condition.notify_all()
+            return self._condition.wait_for(lambda: self._written >= target, timeout)
+
+    def close(self):
+        """Escribe los registros pendientes y cierra el log"""
+        with self._condition:
+            if self._closed:
+                return
+            self._closed = True
+            self._condition.notify_all()
+        self._thread.join()
+        self._file.close()
+
+    def _run(self):
+        while True:
+            with self._condition:
+                while not self._pending and not self._closed:
+                    self._condition.wait()
+                if not self._pending and self._closed:
+                    return
+
+            # Ventana de group commit para acumular más registros
+            if self.group_commit_seconds > 0 and not self._closed:
+                time.sleep(self.group_commit_seconds)
+
+            with self._condition:
+                batch, self._pending = self._pending, []
+                first_sequence = self._written + 1
+
+            try:
+                self._write_batch(batch)
+                failed = False
+            except Exception as e:
+                logger.error(f"Error writing consensus log batch: {e}")
+                failed = True
+
+            with self._condition:
+                self._written += len(batch)
+                if failed:
+                    self._failed_range = (first_sequence, self._written)
+                self._condition.notify_all()
+
+    def _write_batch(self, batch: List[Any]):
+        data = b"".join(encode_record(self.encoder(record), self.fmt) for record in batch)
+        self._file.write(data)
+        self._file.flush()
+        if self.fsync_policy != "never":
+            os.fsync(self._file.fileno())
+
+        self._segment_bytes += len(data)
+        self.records_written += len(batch)
+        self.batches_written += 1
+        if self._segment_bytes >= self.segment_max_bytes:
+            self._rotate()
+
+    # ========== LECTURA ==========
+
+    def iter_records(self) -> Iterator[Any]:
+        """Lee en streaming los registros escritos (tras vaciar la cola)"""
+        self.flush()
+        return read_decoded_records(self.directory)
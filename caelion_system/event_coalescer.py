@@ -0,0 +1,298 @@
+#!/usr/bin/env python3
+"""
+Coalescedor de Eventos - Deduplicación y Limitación de Violaciones para ÆON
+
+Este módulo implementa la capa de coalescencia situada delante de la
+respuesta a violaciones de ÆON, responsable de:
+1. Identificar cada evento por (protocolo, componente, huella de la evidencia).
+2. Escalar siempre de inmediato la primera aparición de cada evento y
+   absorber sus repeticiones durante una ventana de tiempo.
+3. Limitar por protocolo los re-escalados de eventos repetidos con un token
+   bucket, difiriendo (no descartando) los que no tienen token.
+4. Contabilizar los eventos absorbidos, que se informan al volver a escalar.
+
+Cada evento se procesa en O(1) amortizado: una búsqueda en diccionario, una
+recarga del bucket de su protocolo y la expiración perezosa de las ventanas
+más antiguas.
+
+Autor: Manus AI (bajo DOS-03)
+Fecha: 26 de enero de 2026
+"""
+
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Claves de la evidencia que cambian en cada repetición del mismo evento; se
+# excluyen a cualquier profundidad (ARGOS anida la evidencia original, con su
+# propio timestamp, dentro del informe que envía a ÆON)
+VOLATILE_EVIDENCE_KEYS = frozenset(("timestamp", "detected_at"))
+
+# Clave de deduplicación explícita: si la evidencia la incluye, la huella se
+# calcula solo sobre ella
+DEDUP_KEY_FIELD = "dedup_key"
+
+
+def _stable_evidence(value, ignore: Iterable[str]):
+    """Copia de la evidencia sin las claves volátiles, en cualquier nivel"""
+    if isinstance(value, dict):
+        return {key: _stable_evidence(item, ignore)
+                for key, item in value.items() if key not in ignore}
+    if isinstance(value, (list, tuple)):
+        return [_stable_evidence(item, ignore) for item in value]
+    return value
+
+
+def evidence_fingerprint(evidence: Dict, ignore: Iterable[str] = VOLATILE_EVIDENCE_KEYS) -> str:
+    """
+    Calcula la huella de una evidencia (SHA-256 de su JSON canónico).
+
+    Si la evidencia incluye DEDUP_KEY_FIELD, la huella es la de ese valor;
+    en otro caso, la de la evidencia completa sin las claves volátiles.
+
+    Args:
+        evidence: Evidencia del evento
+        ignore: Claves excluidas de la huella, en cualquier nivel de anidación
+
+    Returns:
+        str: Huella hexadecimal (128 bits)
+    """
+    if DEDUP_KEY_FIELD in evidence:
+        stable = evidence[DEDUP_KEY_FIELD]
+    else:
+        stable = _stable_evidence(evidence, frozenset(ignore))
+    canonical = json.dumps(stable, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(canonical.encode()).hexdigest()[:32]
+
+
+@dataclass
+class CoalesceDecision:
+    """Decisión de la capa de coalescencia sobre un evento"""
+    escalate: bool
+    reason: str                 # "first", "repeat", "replayed", "exempt", "duplicate" o "rate_limited"
+    key: Tuple[str, str, str]
+    suppressed: int = 0         # Repeticiones absorbidas desde el último escalado de la clave
+
+
+class TokenBucket:
+    """Token bucket: `rate` tokens por segundo con capacidad `burst`"""
+
+    __slots__ = ("rate", "burst", "tokens", "updated")
+
+    def __init__(self, rate: float, burst: int, now: float):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = float(burst)
+        self.updated = now
+
+    def take(self, now: float) -> bool:
+        """Consume un token si hay alguno disponible"""
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        if self.tokens >= 1.0:
+            self.tokens -= 1.0
+            return True
+        return False
+
+
+class _Window:
+    """Ventana de coalescencia de una clave"""
+
+    __slots__ = ("opened", "suppressed")
+
+    def __init__(self, opened: float):
+        self.opened = opened
+        self.suppressed = 0
+
+
+class EventCoalescer:
+    """
+    Coalescedor de eventos de violación.
+
+    La primera aparición de una clave abre una ventana de `window_seconds` y se
+    escala siempre: el límite por protocolo nunca oculta un evento nuevo. Las
+    repeticiones dentro de la ventana solo se cuentan; la primera aparición
+    tras una ventana con repeticiones es un re-escalado, que consume un token
+    del bucket de su protocolo. Un re-escalado sin tokens se difiere (se
+    conserva el evento más reciente de la clave) y `release()` lo entrega en
+    cuanto el bucket se recarga, aunque el evento no vuelva a repetirse.
+
+    Los eventos para los que `exempt` retorna True se escalan siempre.
+    """
+
+    def __init__(self,
+                 window_seconds: float = 60.0,
+                 rate_per_second: float = 0.2,
+                 burst: int = 3,
+                 protocol_limits: Optional[Dict[str, Tuple[float, int]]] = None,
+                 max_keys: int = 10000,
+                 exempt: Optional[Callable[[object], bool]] = None,
+                 clock: Callable[[], float] = time.monotonic):
+        """
+        Args:
+            window_seconds: Duración de la ventana de deduplicación por clave
+            rate_per_second: Escalados por segundo permitidos por protocolo
+            burst: Escalados consecutivos permitidos por protocolo
+            protocol_limits: (rate_per_second, burst) específicos por protocolo
+            max_keys: Número máximo de ventanas abiertas (se descartan las más antiguas)
+            exempt: Predicado de eventos que nunca se absorben
+            clock: Reloj monótono (inyectable en pruebas)
+        """
+        self.window_seconds = window_seconds
+        self.rate_per_second = rate_per_second
+        self.burst = burst
+        self.protocol_limits = protocol_limits or {}
+        self.max_keys = max_keys
+        self.exempt = exempt
+        self.clock = clock
+
+        self._lock = threading.Lock()
+        # Ordenado por apertura de la ventana: la expiración solo mira el principio
+        self._windows: "OrderedDict[Tuple[str, str, str], _Window]" = OrderedDict()
+        self._buckets: Dict[str, TokenBucket] = {}
+        # Repeticiones absorbidas (ventanas cerradas o limitadas) pendientes de informar
+        self._pending_suppressed: Dict[Tuple[str, str, str], int] = {}
+        # Re-escalados limitados, en orden de llegada, pendientes de un token
+        self._deferred: "OrderedDict[Tuple[str, str, str], object]" = OrderedDict()
+        self.stats: Dict[str, int] = {
+            "escalated": 0,
+            "exempt": 0,
+            "duplicates": 0,
+            "rate_limited": 0,
+            "replayed": 0
+        }
+
+    @staticmethod
+    def key_for(event) -> Tuple[str, str, str]:
+        """Clave de coalescencia de un ViolationEvent"""
+        protocol = getattr(event.protocol_id, "value", event.protocol_id)
+        return (protocol, event.component_affected or "", evidence_fingerprint(event.evidence))
+
+    def admit(self, event) -> CoalesceDecision:
+        """
+        Decide si un evento debe escalarse.
+
+        Args:
+            event: ViolationEvent (o cualquier objeto con protocol_id,
+                component_affected y evidence)
+
+        Returns:
+            CoalesceDecision: Decisión, motivo y repeticiones absorbidas
+        """
+        key = self.key_for(event)
+        if self.exempt is not None and self.exempt(event):
+            with self._lock:
+                self.stats["exempt"] += 1
+            return CoalesceDecision(True, "exempt", key)
+
+        now = self.clock()
+        with self._lock:
+            self._expire(now)
+
+            window = self._windows.get(key)
+            if window is not None:
+                window.suppressed += 1
+                self.stats["duplicates"] += 1
+                return CoalesceDecision(False, "duplicate", key, window.suppressed)
+
+            suppressed = self._pending_suppressed.get(key, 0)
+            repeat = suppressed > 0 or key in self._deferred
+            if repeat and not self._bucket(key[0], now).take(now):
+                self.stats["rate_limited"] += 1
+                self._defer(key, event)
+                return CoalesceDecision(False, "rate_limited", key, self._pending_suppressed.get(key, 0))
+
+            suppressed = self._pending_suppressed.pop(key, 0)
+            if self._deferred.pop(key, None) is not None:
+                suppressed += 1  # El evento diferido queda sustituido por este
+            self._open(key, now)
+            return CoalesceDecision(True, "repeat" if repeat else "first", key, suppressed)
+
+    def release(self) -> List[Tuple[object, CoalesceDecision]]:
+        """
+        Entrega los re-escalados diferidos cuyo protocolo ya tiene tokens.
+
+        Returns:
+            List[Tuple[object, CoalesceDecision]]: Eventos a escalar, en orden de llegada
+        """
+        now = self.clock()
+        released = []
+        with self._lock:
+            self._expire(now)
+            for key in list(self._deferred):
+                if not self._bucket(key[0], now).take(now):
+                    continue
+                event = self._deferred.pop(key)
+                suppressed = self._pending_suppressed.pop(key, 0)
+                self._open(key, now)
+                self.stats["replayed"] += 1
+                released.append((event, CoalesceDecision(True, "replayed", key, suppressed)))
+        return released
+
+    def _open(self, key: Tuple[str, str, str], now: float):
+        """Abre la ventana de una clave escalada"""
+        self._windows[key] = _Window(now)
+        if len(self._windows) > self.max_keys:
+            self._retire(*self._windows.popitem(last=False))
+        self.stats["escalated"] += 1
+
+    def _defer(self, key: Tuple[str, str, str], event):
+        """Conserva el re-escalado limitado; el diferido anterior de la clave cuenta como repetición"""
+        if self._deferred.pop(key, None) is not None:
+            self._count_suppressed(key)
+        self._deferred[key] = event
+        if len(self._deferred) > self.max_keys:
+            dropped, _ = self._deferred.popitem(last=False)
+            logger.warning(f"Deferred violation queue full, dropping oldest event for {dropped[0]}")
+
+    def _bucket(self, protocol: str, now: float) -> TokenBucket:
+        bucket = self._buckets.get(protocol)
+        if bucket is None:
+            rate, burst = self.protocol_limits.get(protocol, (self.rate_per_second, self.burst))
+            bucket = self._buckets[protocol] = TokenBucket(rate, burst, now)
+        return bucket
+
+    def _expire(self, now: float):
+        """Cierra las ventanas vencidas (las más antiguas están al principio)"""
+        deadline = now - self.window_seconds
+        while self._windows:
+            key, window = next(iter(self._windows.items()))
+            if window.opened > deadline:
+                break
+            del self._windows[key]
+            self._retire(key, window)
+
+    def _retire(self, key: Tuple[str, str, str], window: _Window):
+        """Conserva las repeticiones absorbidas de una ventana cerrada hasta el próximo escalado"""
+        if window.suppressed:
+            self._count_suppressed(key, window.suppressed)
+
+    def _count_suppressed(self, key: Tuple[str, str, str], count: int = 1):
+        self._pending_suppressed[key] = self._pending_suppressed.get(key, 0) + count
+        if len(self._pending_suppressed) > self.max_keys:
+            del self._pending_suppressed[next(iter(self._pending_suppressed))]
+
+    def open_windows(self) -> int:
+        """Número de claves con una ventana de coalescencia abierta"""
+        with self._lock:
+            return len(self._windows)
+
+    def deferred(self) -> int:
+        """Número de re-escalados diferidos pendientes de un token"""
+        with self._lock:
+            return len(self._deferred)
+
+    def reset(self):
+        """Cierra todas las ventanas y recarga los buckets"""
+        with self._lock:
+            self._windows.clear()
+            self._buckets.clear()
+            self._pending_suppressed.clear()
+            self._deferred.clear()
@@ -0,0 +1,227 @@
+#!/usr/bin/env python3
+"""
+Motor de Hash de Archivos - Verificación de Integridad de ÆON
+
+Este módulo implementa el motor de hash usado por los registros de integridad,
+responsable de:
+1. Calcular SHA-256 de archivos con búferes grandes (o mmap, opcional).
+2. Hashear varios archivos en paralelo en un pool de hilos (hashlib libera el GIL).
+3. Calcular un hash en árbol por bloques, de modo que un archivo grande pueda
+   verificarse en paralelo y re-verificarse parcialmente por bloques.
+4. Medir el rendimiento (MB/s) de cada hash.
+
+Autor: Manus AI (bajo DOS-03)
+Fecha: 26 de enero de 2026
+"""
+
+import hashlib
+import mmap
+import os
+import struct
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Union
+
+DEFAULT_BUFFER_SIZE = 1024 * 1024       # 1 MiB
+DEFAULT_CHUNK_SIZE = 64 * 1024 * 1024   # 64 MiB por bloque del hash en árbol
+TREE_HASH_DOMAIN = b"CAELION-TREE-v1"
+
+
+@dataclass
+class HashResult:
+    """Resultado del hash de un archivo"""
+    path: str
+    hexdigest: str
+    bytes_hashed: int
+    seconds: float
+    chunk_digests: List[str] = field(default_factory=list, repr=False)  # Solo hash en árbol
+
+    @property
+    def throughput_mb_s(self) -> float:
+        """Rendimiento del hash en MB/s"""
+        if self.seconds <= 0:
+            return 0.0
+        return self.bytes_hashed / (1024 * 1024) / self.seconds
+
+
+def combine_chunk_digests(chunk_digests: List[str], chunk_size: int) -> str:
+    """Calcula la raíz del hash en árbol a partir de los hashes de los bloques"""
+    root = hashlib.sha256(TREE_HASH_DOMAIN + struct.pack(">Q", chunk_size))
+    for digest in chunk_digests:
+        root.update(bytes.fromhex(digest))
+    return root.hexdigest()
+
+
+class FileHasher:
+    """
+    Motor de hash SHA-256 de archivos.
+
+    El hash plano es compatible con `sha256sum`. El hash en árbol divide el
+    archivo en bloques de `chunk_size`, hashea cada bloque en paralelo y
+    combina los resultados en una raíz; no es intercambiable con el hash plano.
+
+    Por defecto el hash plano lee con readinto: si el archivo se trunca durante
+    el hash, la lectura simplemente termina antes y el hash no coincide. Con
+    mmap, acceder a páginas de un archivo truncado provoca SIGBUS y mata el
+    proceso, por lo que `use_mmap` solo debe activarse para archivos que nadie
+    puede truncar mientras se hashean (copias privadas o sistemas de archivos
+    de solo lectura), nunca para los registros de integridad de componentes.
+    """
+
+    def __init__(self,
+                 buffer_size: int = DEFAULT_BUFFER_SIZE,
+                 use_mmap: bool = False,
+                 max_workers: int = 4,
+                 chunk_size: int = DEFAULT_CHUNK_SIZE):
+        """
+        Args:
+            buffer_size: Tamaño del búfer de lectura (o de cada actualización con mmap)
+            use_mmap: Usar mmap en lugar de lecturas con búfer (solo para archivos
+                que no pueden truncarse durante el hash)
+            max_workers: Hilos del pool para hashear varios archivos o bloques
+            chunk_size: Tamaño de bloque del hash en árbol
+        """
+        self.buffer_size = buffer_size
+        self.use_mmap = use_mmap
+        self.max_workers = max_workers
+        self.chunk_size = chunk_size
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers,
+                                                thread_name_prefix="aeon-hash")
+        return self._executor
+
+    def shutdown(self):
+        """Libera el pool de hilos"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    # ========== HASH PLANO ==========
+
+    def hash_file(self, path: str) -> HashResult:
+        """Calcula el SHA-256 plano de un archivo"""
+        start = time.perf_counter()
+        digest = hashlib.sha256()
+
+        with open(path, "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            if self.use_mmap and size > 0:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    view = memoryview(mapped)
+                    try:
+                        for offset in range(0, size, self.buffer_size):
+                            digest.update(view[offset:offset + self.buffer_size])
+                    finally:
+                        view.release()
+            else:
+                size = 0
+                buffer = bytearray(self.buffer_size)
+                view = memoryview(buffer)
+                while True:
+                    n = f.readinto(buffer)
+                    if not n:
+                        break
+                    digest.update(view[:n])
+                    size += n
+
+        return HashResult(
+            path=path,
+            hexdigest=digest.hexdigest(),
+            bytes_hashed=size,
+            seconds=time.perf_counter() - start
+        )
+
+    def hash_files(self, paths: Iterable[str]) -> Dict[str, Union[HashResult, Exception]]:
+        """
+        Calcula el SHA-256 plano de varios archivos en paralelo.
+
+        Returns:
+            Dict: Ruta -> HashResult, o la excepción producida al hashearla
+        """
+        paths = list(paths)
+        futures = {path: self._get_executor().submit(self.hash_file, path) for path in paths}
+        results: Dict[str, Union[HashResult, Exception]] = {}
+        for path, future in futures.items():
+            try:
+                results[path] = future.result()
+            except Exception as e:
+                results[path] = e
+        return results
+
+    # ========== HASH EN ÁRBOL ==========
+
+    def _hash_chunk(self, fd: int, index: int) -> str:
+        """Hashea un bloque del archivo con lecturas posicionales (seguras entre hilos)"""
+        digest = hashlib.sha256()
+        offset = index * self.chunk_size
+        end = offset + self.chunk_size
+        while offset < end:
+            data = os.pread(fd, min(self.buffer_size, end - offset), offset)
+            if not data:
+                break
+            digest.update(data)
+            offset += len(data)
+        return digest.hexdigest()
+
+    def tree_hash(self, path: str) -> HashResult:
+        """Calcula el hash en árbol de un archivo, hasheando sus bloques en paralelo"""
+        start = time.perf_counter()
+        fd = os.open(path, os.O_RDONLY)
+        try:
+            size = os.fstat(fd).st_size
+            n_chunks = max(1, -(-size // self.chunk_size))
+            chunk_digests = list(self._get_executor().map(
+                lambda index: self._hash_chunk(fd, index), range(n_chunks)
+            ))
+        finally:
+            os.close(fd)
+
+        return HashResult(
+            path=path,
+            hexdigest=combine_chunk_digests(chunk_digests, self.chunk_size),
+            bytes_hashed=size,
+            seconds=time.perf_counter() - start,
+            chunk_digests=chunk_digests
+        )
+
+    def verify_chunks(self, path: str, chunk_digests: List[str],
+                      indices: Optional[Iterable[int]] = None) -> List[int]:
+        """
+        Re-verifica parcialmente un archivo contra los hashes de sus bloques.
+
+        Args:
+            path: Ruta del archivo
+            chunk_digests: Hashes de bloque esperados (de un tree_hash previo)
+            indices: Bloques a verificar (por defecto, todos)
+
+        Returns:
+            List[int]: Índices de los bloques que no coinciden
+        """
+        indices = list(range(len(chunk_digests)) if indices is None else indices)
+        fd = os.open(path, os.O_RDONLY)
+        try:
+            n_chunks = max(1, -(-os.fstat(fd).st_size // self.chunk_size))
+            if n_chunks != len(chunk_digests):
+                # El número de bloques cambió: el archivo creció o se truncó
+                return sorted(set(indices) | set(range(min(n_chunks, len(chunk_digests)),
+                                                       max(n_chunks, len(chunk_digests)))))
+            current = self._get_executor().map(lambda index: self._hash_chunk(fd, index), indices)
+            return [index for index, digest in zip(indices, current)
+                    if digest != chunk_digests[index]]
+        finally:
+            os.close(fd)
+
+
+_default_hasher: Optional[FileHasher] = None
+
+
+def default_hasher() -> FileHasher:
+    """Retorna el motor de hash compartido con la configuración por defecto"""
+    global _default_hasher
+    if _default_hasher is None:
+        _default_hasher = FileHasher()
+    return _default_hasher
@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+Historial Acotado - Búfer Circular Compartido por los Supervisores de CAELION
+
+Este módulo implementa el historial de capacidad fija usado por LIANG, ARGOS y ÆON,
+responsable de:
+1. Almacenar las entradas más recientes con inserción y desalojo en O(1).
+2. Mantener la memoria constante en procesos de larga duración.
+3. Volcar opcionalmente a disco (JSON lines) las entradas desalojadas.
+
+Autor: Manus AI (bajo DOS-03)
+Fecha: 26 de enero de 2026
+"""
+
+import json
+import os
+from dataclasses import asdict, is_dataclass
+from enum import Enum
+from typing import Any, Callable, Iterator, List, Optional
+
+
+def _json_default(value: Any) -> Any:
+    """Serializa dataclasses y enums para el volcado a disco"""
+    if is_dataclass(value) and not isinstance(value, type):
+        return asdict(value)
+    if isinstance(value, Enum):
+        return value.value
+    return str(value)
+
+
+def serialize_entry(entry: Any) -> str:
+    """Serialización por defecto de una entrada desalojada (una línea JSON)"""
+    if hasattr(entry, "to_dict"):
+        entry = entry.to_dict()
+    return json.dumps(entry, default=_json_default, sort_keys=True, ensure_ascii=False)
+
+
+def spill_path_for(spill_dir: Optional[str], name: str) -> Optional[str]:
+    """Retorna la ruta de volcado de un historial, o None si el volcado está deshabilitado"""
+    if not spill_dir:
+        return None
+    return os.path.join(spill_dir, f"{name}.jsonl")
+
+
+class RingBuffer:
+    """
+    Historial circular de capacidad fija.
+
+    Las entradas se guardan en una lista preasignada; al alcanzar la capacidad,
+    cada inserción sobrescribe la entrada más antigua. Se comporta como una
+    secuencia de solo lectura ordenada de la más antigua a la más reciente.
+    """
+
+    __slots__ = ("capacity", "_items", "_start", "_size",
+                 "spill_path", "_serializer", "_spill_file", "evicted_count")
+
+    def __init__(self,
+                 capacity: int,
+                 spill_path: Optional[str] = None,
+                 serializer: Optional[Callable[[Any], str]] = None):
+        """
+        Inicializa el historial.
+
+        Args:
+            capacity: Número máximo de entradas retenidas en memoria
+            spill_path: Archivo JSON lines donde volcar las entradas desalojadas
+            serializer: Función que convierte una entrada en una línea de texto
+        """
+        if capacity <= 0:
+            raise ValueError(f"Ring buffer capacity must be positive: {capacity}")
+
+        self.capacity = capacity
+        self._items: List[Any] = [None] * capacity
+        self._start = 0
+        self._size = 0
+        self.spill_path = spill_path
+        self._serializer = serializer or serialize_entry
+        self._spill_file = None
+        self.evicted_count = 0
+
+    def append(self, entry: Any) -> Optional[Any]:
+        """
+        Añade una entrada al historial.
+
+        Returns:
+            La entrada desalojada si el historial estaba lleno, o None
+        """
+        if self._size < self.capacity:
+            self._items[(self._start + self._size) % self.capacity] = entry
+            self._size += 1
+            return None
+
+        evicted = self._items[self._start]
+        self._items[self._start] = entry
+        self._start = (self._start + 1) % self.capacity
+        self.evicted_count += 1
+
+        if self.spill_path is not None:
+            self._spill(evicted)
+        return evicted
+
+    def _spill(self, entry: Any):
+        """Vuelca una entrada desalojada al archivo de desbordamiento"""
+        if self._spill_file is None:
+            os.makedirs(os.path.dirname(self.spill_path) or ".", exist_ok=True)
+            self._spill_file = open(self.spill_path, "a", encoding="utf-8")
+        self._spill_file.write(self._serializer(entry))
+        self._spill_file.write("\n")
+
+    def flush(self):
+        """Fuerza la escritura de las entradas volcadas pendientes"""
+        if self._spill_file is not None:
+            self._spill_file.flush()
+
+    def close(self):
+        """Cierra el archivo de desbordamiento"""
+        if self._spill_file is not None:
+            self._spill_file.close()
+            self._spill_file = None
+
+    def clear(self):
+        """Elimina todas las entradas retenidas (sin volcarlas)"""
+        self._items = [None] * self.capacity
+        self._start = 0
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __bool__(self) -> bool:
+        return self._size > 0
+
+    def __iter__(self) -> Iterator[Any]:
+        items, start, capacity = self._items, self._start, self.capacity
+        for offset in range(self._size):
+            yield items[(start + offset) % capacity]
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._size))]
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError("ring buffer index out of range")
+        return self._items[(self._start + index) % self.capacity]
+
+    def __repr__(self) -> str:
+        return f"RingBuffer(capacity={self.capacity}, size={self._size})"
+
+    def to_list(self) -> List[Any]:
+        """Retorna las entradas retenidas como lista (de la más antigua a la más reciente)"""
+        return list(self)
@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+"""
+Vigilante inotify - Notificación de Cambios en Archivos Protegidos por ÆON
+
+Este módulo implementa un vigilante de archivos basado en inotify (Linux),
+responsable de:
+1. Observar los directorios que contienen los componentes protegidos.
+2. Notificar de inmediato cualquier escritura, cambio de metadatos,
+   sustitución o borrado de un archivo observado.
+
+Se accede a inotify mediante ctypes (sin dependencias externas). En sistemas
+sin inotify, `InotifyWatcher.is_supported()` retorna False y ÆON continúa
+en modo de sondeo por stat.
+
+Autor: Manus AI (bajo DOS-03)
+Fecha: 26 de enero de 2026
+"""
+
+import ctypes
+import ctypes.util
+import errno
+import os
+import select
+import struct
+import threading
+from typing import Callable, Dict, Iterable, Optional, Set, Tuple
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Constantes de <sys/inotify.h>
+IN_MODIFY = 0x00000002
+IN_ATTRIB = 0x00000004
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_MOVE_SELF = 0x00000800
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+
+WATCH_MASK = (IN_MODIFY | IN_ATTRIB | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO |
+              IN_CREATE | IN_DELETE | IN_DELETE_SELF | IN_MOVE_SELF)
+
+_EVENT_HEADER = struct.Struct("iIII")
+
+# Callback(rutas_modificadas, desbordamiento)
+ChangeCallback = Callable[[Set[str], bool], None]
+
+
+def _load_libc():
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        libc.inotify_init1.argtypes = [ctypes.c_int]
+        libc.inotify_add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+        return libc
+    except (OSError, AttributeError):
+        return None
+
+
+class InotifyWatcher:
+    """
+    Vigilante de un conjunto de archivos mediante inotify.
+
+    Observa los directorios padre (no los inodos) para detectar también la
+    sustitución atómica de un archivo por rename. Los eventos se agrupan por
+    lectura y se entregan en un hilo propio mediante el callback.
+    """
+
+    _libc = None
+
+    def __init__(self, paths: Iterable[str], callback: ChangeCallback):
+        """
+        Args:
+            paths: Rutas absolutas de los archivos a observar
+            callback: Función invocada con el conjunto de rutas modificadas y un
+                      indicador de desbordamiento de la cola del kernel
+        """
+        self.paths = {os.path.abspath(p) for p in paths}
+        self.callback = callback
+        self._fd: Optional[int] = None
+        self._watches: Dict[int, str] = {}
+        self._thread: Optional[threading.Thread] = None
+        self._stop_event = threading.Event()
+
+    @classmethod
+    def is_supported(cls) -> bool:
+        """Indica si inotify está disponible en este sistema"""
+        if cls._libc is None:
+            cls._libc = _load_libc() or False
+        return bool(cls._libc) and hasattr(cls._libc, "inotify_init1")
+
+    def start(self) -> bool:
+        """
+        Inicia la observación en un hilo de fondo.
+
+        Returns:
+            bool: True si se pudo observar al menos un directorio
+        """
+        if not self.is_supported():
+            logger.warning("inotify is not supported on this system")
+            return False
+
+        fd = self._libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if fd < 0:
+            logger.error(f"inotify_init1 failed: {os.strerror(ctypes.get_errno())}")
+            return False
+        self._fd = fd
+
+        for directory in sorted({os.path.dirname(p) for p in self.paths}):
+            wd = self._libc.inotify_add_watch(fd, os.fsencode(directory), WATCH_MASK)
+            if wd < 0:
+                logger.warning(f"Cannot watch {directory}: {os.strerror(ctypes.get_errno())}")
+                continue
+            self._watches[wd] = directory
+
+        if not self._watches:
+            self.stop()
+            return False
+
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name="aeon-inotify", daemon=True)
+        self._thread.start()
+        logger.info(f"inotify watching {len(self._watches)} directories")
+        return True
+
+    def stop(self):
+        """Detiene la observación y libera el descriptor de inotify"""
+        self._stop_event.set()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join(timeout=2)
+        self._thread = None
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+        self._watches.clear()
+
+    def _run(self):
+        poller = select.poll()
+        poller.register(self._fd, select.POLLIN)
+
+        while not self._stop_event.is_set():
+            if not poller.poll(200):
+                continue
+            try:
+                buffer = os.read(self._fd, 64 * 1024)
+            except OSError as e:
+                if e.errno in (errno.EAGAIN, errno.EINTR):
+                    continue
+                logger.error(f"Error reading inotify events: {e}")
+                break
+
+            changed, overflow = self._parse_events(buffer)
+            if changed or overflow:
+                try:
+                    self.callback(changed, overflow)
+                except Exception as e:
+                    logger.error(f"Error in inotify callback: {e}")
+
+    def _parse_events(self, buffer: bytes) -> Tuple[Set[str], bool]:
+        """Convierte un bloque de eventos en el conjunto de rutas observadas afectadas"""
+        changed: Set[str] = set()
+        overflow = False
+        offset = 0
+
+        while offset + _EVENT_HEADER.size <= len(buffer):
+            wd, mask, _cookie, name_len = _EVENT_HEADER.unpack_from(buffer, offset)
+            offset += _EVENT_HEADER.size
+            name = buffer[offset:offset + name_len].rstrip(b"\0")
+            offset += name_len
+
+            if mask & IN_Q_OVERFLOW:
+                overflow = True
+                continue
+
+            directory = self._watches.get(wd)
+            if directory is None:
+                continue
+
+            if mask & (IN_DELETE_SELF | IN_MOVE_SELF | IN_IGNORED):
+                # El directorio completo desapareció: todos sus archivos están afectados
+                changed.update(p for p in self.paths if os.path.dirname(p) == directory)
+                continue
+
+            path = os.path.join(directory, os.fsdecode(name))
+            if path in self.paths:
+                changed.add(path)
+
+        return changed, overflow
@@ -13,16 +13,38 @@ Autor: Manus AI (bajo DOS-03)
 Fecha: 26 de enero de 2026
 """
 
+import asyncio
 import hashlib
+import hmac
 import json
+import random
+import struct
+import threading
 import time
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterator, List, Optional, Tuple
 import logging
 
 # Importar ÆON para reportar violaciones
 from aeon_guardian import AeonGuardian, ProtocolID
+from binary_codec import (
+    SCHEMA_CONSENSUS_REQUEST,
+    SCHEMA_CONSENSUS_RESULT,
+    SCHEMA_SUPERVISOR_VOTE,
+    register_schema,
+)
+from consensus_log import (
+    FORMAT_BINARY,
+    FORMAT_JSON,
+    SegmentLog,
+    encode_binary,
+    encode_json,
+    read_decoded_records,
+)
+from history_buffer import RingBuffer, spill_path_for
+from scheduler import PeriodicScheduler
+from streaming_stats import CategoryCounter, QuantileSketch, SlidingWindowCounter
 
 # Configuración de logging
 logging.basicConfig(
@@ -40,6 +62,13 @@ class DecisionType(Enum):
     DEFER = "DEFER"  # Requiere más información
 
 
+# Codificación canónica binaria de un voto (lo que cubre la firma HMAC)
+VOTE_ENCODING_HEADER = b"CAELION-VOTE-v1"
+_VOTE_FIELD_LENGTH = struct.Struct(">I")
+_VOTE_NUMERIC_FIELDS = struct.Struct(">dd")  # confidence, timestamp
+_HMAC_BLOCK_SIZE = 64  # Tamaño de bloque de SHA-256
+
+
 class SupervisorModule(Enum):
     """Módulos supervisores que participan en el consenso"""
     LIANG = "LIANG"      # Coordinación y coherencia
@@ -49,7 +78,7 @@ class SupervisorModule(Enum):
     DEUS = "DEUS"        # Alineación y propósito
 
 
-@dataclass
+@dataclass(slots=True)
 class SupervisorVote:
     """Voto de un módulo supervisor en el proceso de consenso"""
     module: SupervisorModule
@@ -57,8 +86,30 @@ class SupervisorVote:
     reasoning: str
     confidence: float  # 0.0 a 1.0
     timestamp: float = field(default_factory=time.time)
+    operation_id: str = ""  # Solicitud de consenso a la que responde el voto
     signature: Optional[str] = None  # Firma criptográfica del voto
     
+    def canonical_bytes(self) -> bytes:
+        """
+        Codificación canónica binaria del voto completo.
+        
+        Cubre módulo, decisión, operation_id, razonamiento (cada uno con
+        prefijo de longitud), confianza y timestamp (double big-endian).
+        """
+        pack_length = _VOTE_FIELD_LENGTH.pack
+        module = self.module.value.encode("utf-8")
+        decision = self.decision.value.encode("utf-8")
+        operation_id = self.operation_id.encode("utf-8")
+        reasoning = self.reasoning.encode("utf-8")
+        return b"".join((
+            VOTE_ENCODING_HEADER,
+            pack_length(len(module)), module,
+            pack_length(len(decision)), decision,
+            pack_length(len(operation_id)), operation_id,
+            pack_length(len(reasoning)), reasoning,
+            _VOTE_NUMERIC_FIELDS.pack(self.confidence, self.timestamp)
+        ))
+    
     def compute_signature(self, secret_key: str) -> str:
         """
         Calcula una firma criptográfica del voto para prevenir falsificación.
@@ -67,15 +118,13 @@ class SupervisorVote:
             secret_key: Clave secreta del módulo supervisor
             
         Returns:
-            str: Firma SHA-256 del voto
+            str: Firma HMAC-SHA256 de la codificación canónica del voto
         """
-        vote_data = f"{self.module.value}:{self.decision.value}:{self.timestamp}:{secret_key}"
-        signature = hashlib.sha256(vote_data.encode()).hexdigest()
-        return signature
+        return hmac.new(secret_key.encode(), self.canonical_bytes(), "sha256").hexdigest()
     
     def verify_signature(self, secret_key: str) -> bool:
         """
-        Verifica la autenticidad de la firma del voto.
+        Verifica la autenticidad de la firma del voto (comparación en tiempo constante).
         
         Args:
             secret_key: Clave secreta del módulo supervisor
@@ -85,8 +134,69 @@ class SupervisorVote:
         """
         if self.signature is None:
             return False
-        expected_signature = self.compute_signature(secret_key)
-        return self.signature == expected_signature
+        return hmac.compare_digest(self.signature, self.compute_signature(secret_key))
+
+
+register_schema(SCHEMA_SUPERVISOR_VOTE, SupervisorVote)
+
+
+class VoteSigner:
+    """
+    Firmante HMAC-SHA256 de votos con contextos por módulo precalculados.
+    
+    Para cada módulo se precalculan una vez los contextos SHA-256 interno
+    (clave XOR ipad) y externo (clave XOR opad) de HMAC (RFC 2104); firmar o
+    verificar copia ambos contextos y solo hashea la codificación canónica
+    del voto. Las firmas son idénticas a las de `hmac` y a las de
+    `SupervisorVote.compute_signature`.
+    """
+    
+    def __init__(self, keys: Dict[SupervisorModule, str]):
+        """
+        Args:
+            keys: Clave secreta de cada módulo supervisor
+        """
+        self._contexts = {module: self._keyed_contexts(key.encode()) for module, key in keys.items()}
+    
+    @staticmethod
+    def _keyed_contexts(key: bytes):
+        """Contextos interno y externo de HMAC-SHA256 ya inicializados con la clave"""
+        if len(key) > _HMAC_BLOCK_SIZE:
+            key = hashlib.sha256(key).digest()
+        key = key.ljust(_HMAC_BLOCK_SIZE, b"\0")
+        inner = hashlib.sha256(bytes(b ^ 0x36 for b in key))
+        outer = hashlib.sha256(bytes(b ^ 0x5C for b in key))
+        return inner, outer
+    
+    def has_key(self, module: SupervisorModule) -> bool:
+        return module in self._contexts
+    
+    def sign(self, vote: SupervisorVote) -> str:
+        """Calcula la firma del voto con la clave de su módulo"""
+        inner, outer = self._contexts[vote.module]
+        inner = inner.copy()
+        inner.update(vote.canonical_bytes())
+        outer = outer.copy()
+        outer.update(inner.digest())
+        return outer.hexdigest()
+    
+    def verify(self, vote: SupervisorVote, operation_id: Optional[str] = None) -> bool:
+        """
+        Verifica la firma de un voto en tiempo constante.
+        
+        Args:
+            vote: Voto a verificar
+            operation_id: Solicitud a la que debe estar ligado el voto (evita
+                          reutilizar un voto firmado en otra solicitud)
+            
+        Returns:
+            bool: True si la firma es válida (y el voto corresponde a la solicitud)
+        """
+        if vote.signature is None or vote.module not in self._contexts:
+            return False
+        if operation_id is not None and vote.operation_id != operation_id:
+            return False
+        return hmac.compare_digest(vote.signature, self.sign(vote))
 
 
 @dataclass
@@ -100,7 +210,10 @@ class ConsensusRequest:
     priority: int = 0  # 0=normal, 1=alta, 2=crítica
 
 
-@dataclass
+register_schema(SCHEMA_CONSENSUS_REQUEST, ConsensusRequest)
+
+
+@dataclass(slots=True)
 class ConsensusResult:
     """Resultado del proceso de consenso"""
     request: ConsensusRequest
@@ -131,6 +244,123 @@ class ConsensusResult:
         }
 
 
+register_schema(SCHEMA_CONSENSUS_RESULT, ConsensusResult)
+
+
+def _encode_result_json(result: ConsensusResult) -> bytes:
+    """Carga JSON de un resultado en el log de consensos (formato "json")"""
+    return encode_json(result.to_dict())
+
+
+class SupervisorVoter:
+    """
+    Interfaz de votante de un módulo supervisor.
+    
+    Cada módulo supervisor participa en el consenso a través de un votante.
+    Las implementaciones deben proveer `vote`; `vote_async` ejecuta `vote` en un
+    hilo por defecto, de modo que votantes bloqueantes no detienen el bucle de eventos.
+    """
+    
+    def __init__(self, module: SupervisorModule):
+        self.module = module
+    
+    def vote(self, request: ConsensusRequest) -> SupervisorVote:
+        """Emite el voto del módulo para una solicitud de consenso"""
+        raise NotImplementedError
+    
+    async def vote_async(self, request: ConsensusRequest) -> SupervisorVote:
+        """Emite el voto del módulo de forma asíncrona"""
+        return await asyncio.to_thread(self.vote, request)
+    
+    def vote_batch(self, requests: List[ConsensusRequest]) -> List[SupervisorVote]:
+        """
+        Emite los votos del módulo para un lote de solicitudes.
+        
+        Los votantes remotos deben sobrescribirlo para usar una sola llamada
+        por lote; la implementación por defecto vota solicitud a solicitud.
+        """
+        return [self.vote(request) for request in requests]
+
+
+class SimulatedVoter(SupervisorVoter):
+    """Votante que delega en una función local de simulación (sin latencia)"""
+    
+    def __init__(self, module: SupervisorModule, vote_fn):
+        super().__init__(module)
+        self.vote_fn = vote_fn
+    
+    def vote(self, request: ConsensusRequest) -> SupervisorVote:
+        return self.vote_fn(request)
+    
+    async def vote_async(self, request: ConsensusRequest) -> SupervisorVote:
+        # La simulación no bloquea: evitar el coste de un hilo
+        return self.vote_fn(request)
+
+
+class LatencyVoter(SupervisorVoter):
+    """
+    Votante local con latencia configurable.
+    
+    Sustituto de un módulo supervisor remoto para medir la latencia del
+    consenso (p50/p99) sin depender de los módulos reales.
+    """
+    
+    def __init__(self,
+                 module: SupervisorModule,
+                 secret_key: str,
+                 decision: DecisionType = DecisionType.APPROVE,
+                 confidence: float = 0.9,
+                 latency_ms: float = 10.0,
+                 jitter_ms: float = 0.0,
+                 seed: Optional[int] = None):
+        """
+        Args:
+            module: Módulo supervisor que representa
+            secret_key: Clave secreta con la que firma sus votos
+            decision: Decisión que emite siempre
+            confidence: Confianza del voto
+            latency_ms: Latencia media simulada
+            jitter_ms: Variación uniforme máxima (±) de la latencia
+            seed: Semilla del generador de latencias
+        """
+        super().__init__(module)
+        self.secret_key = secret_key
+        self.signer = VoteSigner({module: secret_key})
+        self.decision = decision
+        self.confidence = confidence
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self._rng = random.Random(seed)
+    
+    def _sample_latency_seconds(self) -> float:
+        jitter = self._rng.uniform(-self.jitter_ms, self.jitter_ms) if self.jitter_ms else 0.0
+        return max(0.0, self.latency_ms + jitter) / 1000.0
+    
+    def _build_vote(self, request: ConsensusRequest) -> SupervisorVote:
+        vote = SupervisorVote(
+            module=self.module,
+            decision=self.decision,
+            reasoning=f"Stand-in vote from {self.module.value}",
+            confidence=self.confidence,
+            operation_id=request.operation_id
+        )
+        vote.signature = self.signer.sign(vote)
+        return vote
+    
+    def vote(self, request: ConsensusRequest) -> SupervisorVote:
+        time.sleep(self._sample_latency_seconds())
+        return self._build_vote(request)
+    
+    async def vote_async(self, request: ConsensusRequest) -> SupervisorVote:
+        await asyncio.sleep(self._sample_latency_seconds())
+        return self._build_vote(request)
+    
+    def vote_batch(self, requests: List[ConsensusRequest]) -> List[SupervisorVote]:
+        # Un único viaje de ida y vuelta para todo el lote
+        time.sleep(self._sample_latency_seconds())
+        return [self._build_vote(request) for request in requests]
+
+
 class LiangCoordinator:
     """
     LIANG - Coordinador de Consenso de CAELION
@@ -151,13 +381,19 @@ class LiangCoordinator:
         """
         self.config_path = config_path
         self.aeon = aeon_instance
-        self.consensus_history: List[ConsensusResult] = []
         self.supervisor_keys: Dict[SupervisorModule, str] = {}
-        self.evasion_attempts: List[Dict] = []
+        self.voters: Dict[SupervisorModule, SupervisorVoter] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_lock = threading.Lock()
+        # Historiales y agregados: los modifican el hilo llamante y el bucle de eventos dedicado
+        self._history_lock = threading.Lock()
+        self._scheduler: Optional[PeriodicScheduler] = None
         
         logger.info("LIANG Coordinator initializing...")
         self._load_configuration()
+        self._initialize_history()
         self._initialize_supervisor_keys()
+        self._initialize_voters()
         logger.info("LIANG Coordinator initialized successfully")
     
     def _load_configuration(self):
@@ -175,13 +411,57 @@ class LiangCoordinator:
                     "minimum_votes_required": 3,
                     "approval_threshold": 0.6,  # 60% de votos positivos
                     "enable_signature_verification": True,
-                    "max_consensus_history": 1000
+                    "max_consensus_history": 1000,
+                    "max_evasion_history": 1000,
+                    "history_spill_dir": None,  # Volcado de entradas desalojadas
+                    "consensus_log_dir": None,  # Log persistente de consensos (deshabilitado)
+                    "consensus_log_fsync": "batch",  # "always", "batch" o "never"
+                    "consensus_log_group_commit_ms": 2,
+                    "consensus_log_segment_bytes": 67108864,
+                    "consensus_log_max_segments": None,
+                    "consensus_log_format": "binary",  # "binary" (binary_codec) o "json"
+                    "housekeeping_interval_seconds": 30
                 }
                 logger.warning(f"Configuration file not found, using defaults")
         except Exception as e:
             logger.error(f"Error loading configuration: {e}")
             raise
     
+    def _initialize_history(self):
+        """Inicializa los historiales acotados de consensos y evasiones"""
+        spill_dir = self.config.get("history_spill_dir")
+        self.consensus_history: RingBuffer = RingBuffer(
+            self.config.get("max_consensus_history", 1000),
+            spill_path=spill_path_for(spill_dir, "liang_consensus_history")
+        )
+        self.evasion_attempts: RingBuffer = RingBuffer(
+            self.config.get("max_evasion_history", 1000),
+            spill_path=spill_path_for(spill_dir, "liang_evasion_attempts")
+        )
+        
+        # Agregados incrementales sobre el historial retenido
+        self._decision_counts = CategoryCounter(fixed=[d.value for d in DecisionType])
+        self._achieved_count = 0
+        self._execution_times = QuantileSketch()
+        self._consensus_rate = SlidingWindowCounter()
+        self._evasion_rate = SlidingWindowCounter()
+        
+        # Log persistente de solo anexado (write-ahead) del historial completo
+        log_dir = self.config.get("consensus_log_dir")
+        self.consensus_log: Optional[SegmentLog] = None
+        if log_dir:
+            binary = self.config.get("consensus_log_format", "binary") == "binary"
+            self.consensus_log = SegmentLog(
+                log_dir,
+                fsync_policy=self.config.get("consensus_log_fsync", "batch"),
+                group_commit_ms=self.config.get("consensus_log_group_commit_ms", 2),
+                segment_max_bytes=self.config.get("consensus_log_segment_bytes", 67108864),
+                max_segments=self.config.get("consensus_log_max_segments"),
+                encoder=encode_binary if binary else _encode_result_json,
+                fmt=FORMAT_BINARY if binary else FORMAT_JSON
+            )
+            logger.info(f"Consensus log enabled at {log_dir}")
+    
     def _initialize_supervisor_keys(self):
         """
         Inicializa las claves secretas de los módulos supervisores.
@@ -197,8 +477,31 @@ class LiangCoordinator:
             SupervisorModule.AEON: "aeon_secret_key_" + "d" * 32,
             SupervisorModule.DEUS: "deus_secret_key_" + "e" * 32,
         }
+        self.vote_signer = VoteSigner(self.supervisor_keys)
         logger.info("Supervisor secret keys initialized")
     
+    def _initialize_voters(self):
+        """Inicializa los votantes por defecto (simulación local de cada módulo)"""
+        simulations = {
+            SupervisorModule.LIANG: self._simulate_liang_vote,
+            SupervisorModule.HECATE: self._simulate_hecate_vote,
+            SupervisorModule.ARGOS: self._simulate_argos_vote,
+            SupervisorModule.AEON: self._simulate_aeon_vote,
+            SupervisorModule.DEUS: self._simulate_deus_vote,
+        }
+        for module, vote_fn in simulations.items():
+            self.voters[module] = SimulatedVoter(module, vote_fn)
+    
+    def register_voter(self, voter: SupervisorVoter):
+        """
+        Registra (o sustituye) el votante de un módulo supervisor.
+        
+        Args:
+            voter: Votante que emitirá los votos del módulo
+        """
+        self.voters[voter.module] = voter
+        logger.info(f"Voter registered for module: {voter.module.value}")
+    
     def request_consensus(self, request: ConsensusRequest) -> ConsensusResult:
         """
         Solicita consenso a los módulos supervisores para una operación.
@@ -216,9 +519,118 @@ class LiangCoordinator:
         # Paso 1: Recolectar votos de los módulos supervisores
         votes = self._collect_votes(request)
         
+        return self._finalize_consensus(request, votes, start_time)
+    
+    async def request_consensus_async(self, request: ConsensusRequest) -> ConsensusResult:
+        """
+        Solicita consenso consultando a todos los votantes de forma concurrente.
+        
+        La latencia del consenso es la del votante más lento (no la suma), el
+        parámetro `consensus_timeout_seconds` actúa como plazo real, y la
+        recolección termina en cuanto el resultado queda matemáticamente decidido.
+        
+        Args:
+            request: Solicitud de consenso
+            
+        Returns:
+            ConsensusResult: Resultado del proceso de consenso
+        """
+        start_time = time.time()
+        logger.info(f"Requesting consensus for operation: {request.operation_id}")
+        logger.info(f"Operation type: {request.operation_type}")
+        
+        # Paso 1: Recolectar votos en paralelo
+        votes, decided = await self._collect_votes_async(request, start_time)
+        
+        return self._finalize_consensus(request, votes, start_time, decided)
+    
+    def request_consensus_parallel(self, request: ConsensusRequest) -> ConsensusResult:
+        """
+        Envoltorio síncrono de request_consensus_async.
+        
+        Ejecuta la corrutina en el bucle de eventos dedicado del coordinador,
+        de modo que puede invocarse desde código síncrono o desde otros hilos.
+        
+        Args:
+            request: Solicitud de consenso
+            
+        Returns:
+            ConsensusResult: Resultado del proceso de consenso
+        """
+        loop = self._get_event_loop()
+        future = asyncio.run_coroutine_threadsafe(self.request_consensus_async(request), loop)
+        return future.result()
+    
+    def _get_event_loop(self) -> asyncio.AbstractEventLoop:
+        """Retorna el bucle de eventos dedicado del coordinador, creándolo si es necesario"""
+        with self._loop_lock:
+            if self._loop is None or self._loop.is_closed():
+                loop = asyncio.new_event_loop()
+                
+                def run_loop():
+                    loop.run_forever()
+                    loop.close()
+                
+                thread = threading.Thread(
+                    target=run_loop,
+                    name="liang-consensus-loop",
+                    daemon=True
+                )
+                thread.start()
+                self._loop = loop
+            return self._loop
+    
+    def start_housekeeping(self, scheduler: PeriodicScheduler):
+        """
+        Registra el mantenimiento periódico de LIANG en un planificador compartido.
+        
+        Args:
+            scheduler: Planificador que aloja las tareas de los supervisores
+        """
+        scheduler.add_task("liang.housekeeping", self.perform_housekeeping,
+                           period=self.config.get("housekeeping_interval_seconds", 30))
+        self._scheduler = scheduler
+    
+    def perform_housekeeping(self):
+        """Escribe a disco las entradas desalojadas de los historiales pendientes de volcado"""
+        with self._history_lock:
+            self.consensus_history.flush()
+            self.evasion_attempts.flush()
+        logger.debug(f"LIANG housekeeping: {len(self.consensus_history)} consensuses, "
+                     f"{len(self.evasion_attempts)} evasion attempts retained")
+    
+    def close(self):
+        """Detiene el bucle de eventos dedicado y cierra el log de consensos"""
+        if self._scheduler is not None:
+            self._scheduler.remove_task("liang.housekeeping")
+            self._scheduler = None
+        with self._loop_lock:
+            if self._loop is not None and not self._loop.is_closed():
+                self._loop.call_soon_threadsafe(self._loop.stop)
+            self._loop = None
+        if self.consensus_log is not None:
+            self.consensus_log.close()
+    
+    def _finalize_consensus(self,
+                            request: ConsensusRequest,
+                            votes: List[SupervisorVote],
+                            start_time: float,
+                            decided: Optional[Tuple[DecisionType, bool]] = None) -> ConsensusResult:
+        """
+        Verifica los votos recolectados, computa la decisión y registra el resultado.
+        
+        Args:
+            request: Solicitud de consenso
+            votes: Votos recolectados
+            start_time: Instante de inicio de la solicitud
+            decided: Decisión ya determinada durante la recolección (terminación anticipada)
+            
+        Returns:
+            ConsensusResult: Resultado del proceso de consenso
+        """
         # Paso 2: Verificar firmas de los votos
         if self.config.get("enable_signature_verification", True):
-            valid_votes = self._verify_vote_signatures(votes)
+            valid_votes = self._verify_vote_signatures(votes, request.operation_id)
             if len(valid_votes) < len(votes):
                 logger.warning(f"Some votes had invalid signatures: {len(votes) - len(valid_votes)}")
                 self._report_signature_violation(votes, valid_votes)
@@ -228,7 +640,10 @@ class LiangCoordinator:
         self._detect_consensus_evasion(request, votes)
         
         # Paso 4: Computar decisión final
-        final_decision, consensus_achieved = self._compute_final_decision(votes)
+        if decided is not None:
+            final_decision, consensus_achieved = decided
+        else:
+            final_decision, consensus_achieved = self._compute_final_decision(votes)
         
         # Paso 5: Crear resultado
         end_time = time.time()
@@ -244,15 +659,99 @@ class LiangCoordinator:
         )
         
         # Paso 6: Registrar en historial
-        self.consensus_history.append(result)
-        if len(self.consensus_history) > self.config.get("max_consensus_history", 1000):
-            self.consensus_history.pop(0)
+        self._record_consensus(result)
         
         logger.info(f"Consensus result: {final_decision.value} (achieved={consensus_achieved})")
         logger.info(f"Execution time: {execution_time_ms:.2f}ms")
         
         return result
     
+    def request_consensus_batch(self, requests: List[ConsensusRequest]) -> List[ConsensusResult]:
+        """
+        Solicita consenso para un lote de operaciones.
+        
+        Amortiza el coste por solicitud: cada supervisor recibe el lote completo
+        en una sola llamada, las firmas se verifican en una única pasada agrupada
+        por módulo y el historial se actualiza una sola vez.
+        
+        Args:
+            requests: Solicitudes de consenso
+            
+        Returns:
+            List[ConsensusResult]: Resultados en el mismo orden que las solicitudes
+        """
+        if not requests:
+            return []
+        
+        start_time = time.time()
+        logger.info(f"Requesting consensus for batch of {len(requests)} operations")
+        
+        # Paso 1: Una llamada por supervisor para todo el lote
+        votes_by_request = self._collect_votes_batch(requests)
+        
+        # Paso 2: Verificación de firmas en una sola pasada
+        if self.config.get("enable_signature_verification", True):
+            valid_by_request = self._verify_vote_signatures_batch(votes_by_request, requests)
+            for votes, valid_votes in zip(votes_by_request, valid_by_request):
+                if len(valid_votes) < len(votes):
+                    self._report_signature_violation(votes, valid_votes)
+            votes_by_request = valid_by_request
+        
+        end_time = time.time()
+        execution_time_ms = (end_time - start_time) * 1000
+        
+        results = []
+        for request, votes in zip(requests, votes_by_request):
+            # Paso 3: Detectar intentos de evasión del consenso
+            self._detect_consensus_evasion(request, votes)
+            
+            # Paso 4: Computar decisión final
+            final_decision, consensus_achieved = self._compute_final_decision(votes)
+            
+            # Paso 5: Crear resultado (la latencia de cada solicitud es la del lote)
+            results.append(ConsensusResult(
+                request=request,
+                final_decision=final_decision,
+                votes=votes,
+                consensus_achieved=consensus_achieved,
+                consensus_timestamp=end_time,
+                execution_time_ms=execution_time_ms
+            ))
+        
+        # Paso 6: Registrar en historial
+        for result in results:
+            self._record_consensus(result)
+        
+        achieved = sum(1 for r in results if r.consensus_achieved)
+        logger.info(f"Consensus batch completed: {achieved}/{len(results)} achieved")
+        logger.info(f"Execution time: {execution_time_ms:.2f}ms")
+        
+        return results
+    
+    def _record_consensus(self, result: ConsensusResult):
+        """
+        Registra un resultado en el historial y actualiza los agregados.
+        
+        Se invoca desde el hilo llamante (request_consensus, lotes) y desde el
+        bucle de eventos dedicado (request_consensus_parallel), por lo que el
+        historial, los agregados y el orden del log se protegen con un lock.
+        """
+        with self._history_lock:
+            if self.consensus_log is not None:
+                # El hilo de escritura del log codifica el resultado, fuera de la ruta del consenso
+                self.consensus_log.append(result)
+            evicted = self.consensus_history.append(result)
+            
+            self._decision_counts.add(result.final_decision.value)
+            self._achieved_count += result.consensus_achieved
+            self._execution_times.add(result.execution_time_ms)
+            self._consensus_rate.add(result.consensus_timestamp)
+            
+            if evicted is not None:
+                self._decision_counts.remove(evicted.final_decision.value)
+                self._achieved_count -= evicted.consensus_achieved
+                self._execution_times.remove(evicted.execution_time_ms)
+    
     def _collect_votes(self, request: ConsensusRequest) -> List[SupervisorVote]:
         """
         Recolecta votos de los módulos supervisores.
@@ -268,24 +767,159 @@ class LiangCoordinator:
         """
         votes = []
         
-        # Simular votos de los módulos (en producción, llamadas reales a módulos)
-        votes.append(self._simulate_liang_vote(request))
-        votes.append(self._simulate_hecate_vote(request))
-        votes.append(self._simulate_argos_vote(request))
-        votes.append(self._simulate_aeon_vote(request))
-        votes.append(self._simulate_deus_vote(request))
+        for voter in self.voters.values():
+            try:
+                votes.append(voter.vote(request))
+            except Exception as e:
+                logger.error(f"Error collecting vote from {voter.module.value}: {e}")
         
         return votes
     
+    async def _collect_votes_async(self, request: ConsensusRequest, start_time: float
+                                   ) -> Tuple[List[SupervisorVote], Optional[Tuple[DecisionType, bool]]]:
+        """
+        Recolecta votos de todos los votantes de forma concurrente.
+        
+        Termina cuando llegan todos los votos, cuando vence el plazo
+        `consensus_timeout_seconds`, o cuando el resultado ya no puede cambiar.
+        
+        Args:
+            request: Solicitud de consenso
+            start_time: Instante de inicio de la solicitud
+            
+        Returns:
+            Tuple: (votos recibidos, decisión anticipada o None)
+        """
+        timeout = self.config.get("consensus_timeout_seconds", 30)
+        deadline = start_time + timeout
+        verify = self.config.get("enable_signature_verification", True)
+        
+        tasks = {
+            asyncio.ensure_future(voter.vote_async(request)): voter.module
+            for voter in self.voters.values()
+        }
+        pending = set(tasks)
+        votes: List[SupervisorVote] = []
+        counted: List[SupervisorVote] = []
+        decided = None
+        
+        try:
+            while pending:
+                remaining = deadline - time.time()
+                if remaining <= 0:
+                    break
+                
+                done, pending = await asyncio.wait(
+                    pending, timeout=remaining, return_when=asyncio.FIRST_COMPLETED
+                )
+                
+                for task in done:
+                    try:
+                        vote = task.result()
+                    except Exception as e:
+                        logger.error(f"Error collecting vote from {tasks[task].value}: {e}")
+                        continue
+                    votes.append(vote)
+                    
+                    # Solo los votos con firma válida cuentan para la decisión anticipada
+                    if not verify or self._is_vote_signature_valid(vote, request.operation_id):
+                        counted.append(vote)
+                
+                decided = self._decided_outcome(counted, len(pending))
+                if decided is not None and pending:
+                    logger.info(f"Consensus decided early with {len(pending)} votes pending")
+                    break
+        finally:
+            for task in pending:
+                task.cancel()
+        
+        if pending and decided is None:
+            missing = sorted(tasks[task].value for task in pending)
+            logger.warning(f"Consensus deadline exceeded ({timeout}s), missing votes: {missing}")
+        
+        return votes, decided if pending else None
+    
+    def _decided_outcome(self, votes: List[SupervisorVote], pending: int
+                         ) -> Optional[Tuple[DecisionType, bool]]:
+        """
+        Determina si la decisión final ya es independiente de los votos pendientes.
+        
+        Los votos pendientes pueden llegar con cualquier decisión o ser
+        descartados (firma inválida), por lo que se evalúan los casos extremos.
+        
+        Args:
+            votes: Votos válidos recibidos hasta el momento
+            pending: Número de votos pendientes
+            
+        Returns:
+            Tuple[DecisionType, bool]: Decisión decidida, o None si aún puede cambiar
+        """
+        if pending == 0:
+            return self._compute_final_decision(votes)
+        
+        # No terminar antes de alcanzar el mínimo de votos (evitaría falsas evasiones)
+        if len(votes) < self.config.get("minimum_votes_required", 3):
+            return None
+        
+        threshold = self.config.get("approval_threshold", 0.6)
+        approve = sum(1 for v in votes if v.decision == DecisionType.APPROVE)
+        reject = sum(1 for v in votes if v.decision == DecisionType.REJECT)
+        total = len(votes) + pending
+        
+        if approve >= threshold * total:
+            return DecisionType.APPROVE, True
+        
+        approve_possible = (approve + pending) >= threshold * total
+        if approve_possible:
+            return None
+        
+        if reject >= threshold * total:
+            return DecisionType.REJECT, True
+        
+        if (reject + pending) < threshold * total:
+            return DecisionType.DEFER, False
+        
+        return None
+    
+    def _collect_votes_batch(self, requests: List[ConsensusRequest]) -> List[List[SupervisorVote]]:
+        """
+        Recolecta votos para un lote con una sola llamada por supervisor.
+        
+        Args:
+            requests: Solicitudes de consenso
+            
+        Returns:
+            List[List[SupervisorVote]]: Votos de cada solicitud, en orden
+        """
+        votes_by_request: List[List[SupervisorVote]] = [[] for _ in requests]
+        
+        for voter in self.voters.values():
+            try:
+                batch_votes = voter.vote_batch(requests)
+            except Exception as e:
+                logger.error(f"Error collecting batch votes from {voter.module.value}: {e}")
+                continue
+            
+            if len(batch_votes) != len(requests):
+                logger.error(f"Voter {voter.module.value} returned {len(batch_votes)} votes "
+                             f"for {len(requests)} requests, discarding")
+                continue
+            
+            for votes, vote in zip(votes_by_request, batch_votes):
+                votes.append(vote)
+        
+        return votes_by_request
+    
     def _simulate_liang_vote(self, request: ConsensusRequest) -> SupervisorVote:
         """Simula el voto de LIANG (coordinación y coherencia)"""
         vote = SupervisorVote(
             module=SupervisorModule.LIANG,
             decision=DecisionType.APPROVE,
             reasoning="Operation is coherent with system state",
-            confidence=0.95
+            confidence=0.95,
+            operation_id=request.operation_id
         )
-        vote.signature = vote.compute_signature(self.supervisor_keys[SupervisorModule.LIANG])
+        vote.signature = self.vote_signer.sign(vote)
         return vote
     
     def _simulate_hecate_vote(self, request: ConsensusRequest) -> SupervisorVote:
@@ -294,9 +928,10 @@ class LiangCoordinator:
             module=SupervisorModule.HECATE,
             decision=DecisionType.APPROVE,
             reasoning="Operation is auditable and traceable",
-            confidence=0.90
+            confidence=0.90,
+            operation_id=request.operation_id
         )
-        vote.signature = vote.compute_signature(self.supervisor_keys[SupervisorModule.HECATE])
+        vote.signature = self.vote_signer.sign(vote)
         return vote
     
     def _simulate_argos_vote(self, request: ConsensusRequest) -> SupervisorVote:
@@ -305,9 +940,10 @@ class LiangCoordinator:
             module=SupervisorModule.ARGOS,
             decision=DecisionType.APPROVE,
             reasoning="Operation does not violate monitoring constraints",
-            confidence=0.92
+            confidence=0.92,
+            operation_id=request.operation_id
         )
-        vote.signature = vote.compute_signature(self.supervisor_keys[SupervisorModule.ARGOS])
+        vote.signature = self.vote_signer.sign(vote)
         return vote
     
     def _simulate_aeon_vote(self, request: ConsensusRequest) -> SupervisorVote:
@@ -316,9 +952,10 @@ class LiangCoordinator:
             module=SupervisorModule.AEON,
             decision=DecisionType.APPROVE,
             reasoning="Operation does not violate immutable protocols",
-            confidence=1.0
+            confidence=1.0,
+            operation_id=request.operation_id
         )
-        vote.signature = vote.compute_signature(self.supervisor_keys[SupervisorModule.AEON])
+        vote.signature = self.vote_signer.sign(vote)
         return vote
     
     def _simulate_deus_vote(self, request: ConsensusRequest) -> SupervisorVote:
@@ -327,17 +964,20 @@ class LiangCoordinator:
             module=SupervisorModule.DEUS,
             decision=DecisionType.APPROVE,
             reasoning="Operation is aligned with system purpose",
-            confidence=0.88
+            confidence=0.88,
+            operation_id=request.operation_id
         )
-        vote.signature = vote.compute_signature(self.supervisor_keys[SupervisorModule.DEUS])
+        vote.signature = self.vote_signer.sign(vote)
         return vote
     
-    def _verify_vote_signatures(self, votes: List[SupervisorVote]) -> List[SupervisorVote]:
+    def _verify_vote_signatures(self, votes: List[SupervisorVote],
+                                operation_id: Optional[str] = None) -> List[SupervisorVote]:
         """
         Verifica las firmas criptográficas de los votos.
         
         Args:
             votes: Lista de votos a verificar
+            operation_id: Solicitud a la que deben estar ligados los votos
             
         Returns:
             List[SupervisorVote]: Lista de votos con firmas válidas
@@ -345,18 +985,60 @@ class LiangCoordinator:
         valid_votes = []
         
         for vote in votes:
-            secret_key = self.supervisor_keys.get(vote.module)
-            if secret_key is None:
+            if not self.vote_signer.has_key(vote.module):
                 logger.error(f"No secret key found for module: {vote.module.value}")
                 continue
             
-            if vote.verify_signature(secret_key):
+            if self.vote_signer.verify(vote, operation_id):
                 valid_votes.append(vote)
             else:
                 logger.error(f"Invalid signature for vote from: {vote.module.value}")
         
         return valid_votes
     
+    def _verify_vote_signatures_batch(self, votes_by_request: List[List[SupervisorVote]],
+                                      requests: List[ConsensusRequest]
+                                      ) -> List[List[SupervisorVote]]:
+        """
+        Verifica las firmas de los votos de un lote en una única pasada.
+        
+        Los votos se agrupan por módulo para resolver cada clave una sola vez.
+        
+        Args:
+            votes_by_request: Votos de cada solicitud del lote
+            requests: Solicitudes del lote (cada voto debe estar ligado a la suya)
+            
+        Returns:
+            List[List[SupervisorVote]]: Votos con firma válida de cada solicitud
+        """
+        by_module: Dict[SupervisorModule, List[Tuple[SupervisorVote, str]]] = {}
+        for votes, request in zip(votes_by_request, requests):
+            for vote in votes:
+                by_module.setdefault(vote.module, []).append((vote, request.operation_id))
+        
+        valid_ids = set()
+        for module, module_votes in by_module.items():
+            if not self.vote_signer.has_key(module):
+                logger.error(f"No secret key found for module: {module.value}")
+                continue
+            
+            verify = self.vote_signer.verify
+            valid = [vote for vote, operation_id in module_votes if verify(vote, operation_id)]
+            if len(valid) < len(module_votes):
+                logger.error(f"Invalid signatures for {len(module_votes) - len(valid)} "
+                             f"votes from: {module.value}")
+            valid_ids.update(id(vote) for vote in valid)
+        
+        return [
+            [vote for vote in votes if id(vote) in valid_ids]
+            for votes in votes_by_request
+        ]
+    
+    def _is_vote_signature_valid(self, vote: SupervisorVote,
+                                 operation_id: Optional[str] = None) -> bool:
+        """Verifica la firma de un único voto sin registrar errores"""
+        return self.vote_signer.verify(vote, operation_id)
+    
     def _report_signature_violation(self, all_votes: List[SupervisorVote], valid_votes: List[SupervisorVote]):
         """
         Reporta una violación de C1-02 a ÆON cuando se detectan firmas inválidas.
@@ -455,7 +1137,9 @@ class LiangCoordinator:
             "timestamp": time.time()
         }
         
-        self.evasion_attempts.append(evasion_event)
+        with self._history_lock:
+            self.evasion_attempts.append(evasion_event)
+            self._evasion_rate.add(evasion_event["timestamp"])
         
         if self.aeon is not None:
             self.aeon.report_violation_attempt(
@@ -517,51 +1201,83 @@ class LiangCoordinator:
         """
         Retorna estadísticas del historial de consensos.
         
+        Los agregados se mantienen en cada inserción y desalojo del historial,
+        por lo que la consulta no recorre el historial.
+        
         Returns:
             Dict: Estadísticas del consenso
         """
-        if len(self.consensus_history) == 0:
-            return {
-                "total_consensuses": 0,
-                "consensus_achieved_rate": 0.0,
-                "average_execution_time_ms": 0.0,
-                "evasion_attempts": 0
+        with self._history_lock:
+            rates = {
+                "consensuses_per_second": self._consensus_rate.rates(),
+                "evasions_per_second": self._evasion_rate.rates()
             }
         
-        total = len(self.consensus_history)
-        achieved = sum(1 for r in self.consensus_history if r.consensus_achieved)
-        avg_time = sum(r.execution_time_ms for r in self.consensus_history) / total
+            if len(self.consensus_history) == 0:
+                return {
+                    "total_consensuses": 0,
+                    "consensus_achieved_rate": 0.0,
+                    "average_execution_time_ms": 0.0,
+                    "evasion_attempts": 0,
+                    "rates": rates
+                }
         
-        return {
-            "total_consensuses": total,
-            "consensus_achieved_rate": achieved / total,
-            "average_execution_time_ms": avg_time,
-            "evasion_attempts": len(self.evasion_attempts),
-            "decision_distribution": {
-                "APPROVE": sum(1 for r in self.consensus_history if r.final_decision == DecisionType.APPROVE),
-                "REJECT": sum(1 for r in self.consensus_history if r.final_decision == DecisionType.REJECT),
-                "DEFER": sum(1 for r in self.consensus_history if r.final_decision == DecisionType.DEFER)
+            total = len(self.consensus_history)
+        
+            return {
+                "total_consensuses": total,
+                "consensus_achieved_rate": self._achieved_count / total,
+                "average_execution_time_ms": self._execution_times.mean,
+                "execution_time_percentiles_ms": {
+                    "p50": self._execution_times.quantile(0.50),
+                    "p95": self._execution_times.quantile(0.95),
+                    "p99": self._execution_times.quantile(0.99)
+                },
+                "evasion_attempts": len(self.evasion_attempts),
+                "decision_distribution": self._decision_counts.to_dict(),
+                "rates": rates
             }
-        }
+    
+    def iter_consensus_history(self) -> Iterator[Dict]:
+        """
+        Recorre el historial de consensos en streaming, del más antiguo al más reciente.
+        
+        Con el log persistente habilitado se lee el historial completo desde
+        disco; si no, el historial retenido en memoria.
+        """
+        if self.consensus_log is not None:
+            self.consensus_log.flush()
+            # Los registros binarios son ConsensusResult completos; los JSON, ya diccionarios
+            return (record.to_dict() if isinstance(record, ConsensusResult) else record
+                    for record in read_decoded_records(self.consensus_log.directory))
+        with self._history_lock:
+            retained = self.consensus_history.to_list()
+        return (result.to_dict() for result in retained)
     
     def export_consensus_history(self, output_path: str):
         """
         Exporta el historial de consensos a un archivo JSON.
         
+        El documento se escribe en streaming, entrada a entrada, sin construir
+        el historial completo en memoria.
+        
         Args:
             output_path: Ruta del archivo de salida
         """
-        history_data = [result.to_dict() for result in self.consensus_history]
+        statistics = self.get_consensus_statistics()
+        total = 0
         
         with open(output_path, 'w') as f:
-            json.dump({
-                "export_timestamp": time.time(),
-                "total_consensuses": len(history_data),
-                "statistics": self.get_consensus_statistics(),
-                "history": history_data
-            }, f, indent=2)
-        
-        logger.info(f"Consensus history exported to: {output_path}")
+            f.write('{\n  "export_timestamp": %s,\n' % json.dumps(time.time()))
+            f.write('  "statistics": %s,\n' % json.dumps(statistics))
+            f.write('  "history": [')
+            for entry in self.iter_consensus_history():
+                f.write(",\n    " if total else "\n    ")
+                f.write(json.dumps(entry))
+                total += 1
+            f.write('\n  ],\n  "total_consensuses": %d\n}\n' % total)
+        
+        logger.info(f"Consensus history exported to: {output_path} ({total} entries)")
 
 
 def main():
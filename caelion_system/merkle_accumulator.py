@@ -0,0 +1,282 @@
+#!/usr/bin/env python3
+"""
+Acumulador Merkle Incremental - Checksums de Integridad de CAELION
+
+Este módulo implementa un árbol de Merkle incremental, responsable de:
+1. Mantener el hash raíz de un conjunto de registros indexados por clave.
+2. Actualizar la raíz en O(log n) al insertar o modificar un registro.
+3. Exponer la raíz en O(1) para los ciclos de monitoreo.
+4. Generar pruebas de inclusión por clave y localizar subárboles divergentes.
+5. Liberar las hojas de las claves olvidadas sin alterar la raíz.
+
+Las hojas y los nodos internos usan prefijos de dominio distintos (0x00 / 0x01)
+para evitar colisiones entre niveles del árbol. Un nodo sin hermano se promueve
+sin re-hashear al nivel superior.
+
+Autor: Manus AI (bajo DOS-03)
+Fecha: 26 de enero de 2026
+"""
+
+import hashlib
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+HASH_SIZE = 32  # SHA-256
+LEAF_PREFIX = b"\x00"
+NODE_PREFIX = b"\x01"
+
+# Raíz de un árbol vacío (SHA-256 de la cadena vacía)
+EMPTY_ROOT = hashlib.sha256(b"").digest()
+
+
+def hash_leaf(data: bytes) -> bytes:
+    """Calcula el hash de una hoja del árbol"""
+    return hashlib.sha256(LEAF_PREFIX + data).digest()
+
+
+def hash_node(left: bytes, right: bytes) -> bytes:
+    """Calcula el hash de un nodo interno a partir de sus hijos"""
+    return hashlib.sha256(NODE_PREFIX + left + right).digest()
+
+
+class MerkleAccumulator:
+    """
+    Árbol de Merkle incremental indexado por clave.
+
+    Cada clave ocupa una hoja fija en orden de inserción. Insertar una clave
+    nueva o actualizar una existente recalcula únicamente el camino hasta la
+    raíz, por lo que el coste por actualización es O(log n) y la raíz está
+    disponible en O(1).
+
+    Cada nivel se guarda como un bytearray contiguo de hashes de 32 bytes.
+    Las claves olvidadas con forget() conservan su hoja en la raíz, pero el
+    prefijo de hojas olvidadas (y los nodos internos que solo las cubren) se
+    libera: de ese prefijo solo quedan los O(log n) nodos que necesitan los
+    caminos de las hojas vivas.
+    """
+
+    def __init__(self):
+        """Inicializa un acumulador vacío"""
+        # levels[0] son las hojas; levels[-1] contiene la raíz
+        self.levels: List[bytearray] = [bytearray()]
+        self._pruned: List[int] = [0]             # Nodos liberados al inicio de cada nivel
+        self.key_index: Dict[str, int] = {}       # Orden de inserción = orden de índice
+
+    def __len__(self) -> int:
+        return self._count(0)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.key_index
+
+    def _count(self, level: int) -> int:
+        """Número de nodos de un nivel, incluidos los liberados"""
+        return self._pruned[level] + len(self.levels[level]) // HASH_SIZE
+
+    def _node(self, level: int, index: int) -> bytes:
+        start = (index - self._pruned[level]) * HASH_SIZE
+        return bytes(self.levels[level][start:start + HASH_SIZE])
+
+    def _set_node(self, level: int, index: int, node: bytes):
+        nodes = self.levels[level]
+        start = (index - self._pruned[level]) * HASH_SIZE
+        if start == len(nodes):
+            nodes += node
+        else:
+            nodes[start:start + HASH_SIZE] = node
+
+    @property
+    def root(self) -> bytes:
+        """Hash raíz actual del árbol"""
+        if not self._count(0):
+            return EMPTY_ROOT
+        return self._node(len(self.levels) - 1, 0)
+
+    def root_hex(self) -> str:
+        """Hash raíz actual en hexadecimal"""
+        return self.root.hex()
+
+    def upsert(self, key: str, data: bytes) -> int:
+        """
+        Inserta o actualiza la hoja asociada a una clave.
+
+        Args:
+            key: Clave del registro (p. ej. operation_id)
+            data: Serialización canónica del registro
+
+        Returns:
+            int: Índice de la hoja actualizada
+        """
+        leaf = hash_leaf(data)
+        index = self.key_index.get(key)
+
+        if index is None:
+            index = self._count(0)
+            self.key_index[key] = index
+
+        self._set_node(0, index, leaf)
+        self._update_path(index, leaf)
+        return index
+
+    def _update_path(self, index: int, node: bytes):
+        """Recalcula los nodos desde una hoja (con hash `node`) hasta la raíz"""
+        levels, pruned = self.levels, self._pruned
+        sha256 = hashlib.sha256
+        level = 0
+        size = len(levels[0]) // HASH_SIZE + pruned[0]
+        while size > 1:
+            sibling_index = index ^ 1
+            if sibling_index < size:
+                start = (sibling_index - pruned[level]) * HASH_SIZE
+                if index & 1:
+                    node = sha256(NODE_PREFIX + levels[level][start:start + HASH_SIZE] + node).digest()
+                else:
+                    node = sha256(NODE_PREFIX + node + levels[level][start:start + HASH_SIZE]).digest()
+            # Nodo sin hermano: se promueve sin re-hashear al nivel superior
+
+            index >>= 1
+            level += 1
+            if level == len(levels):
+                levels.append(bytearray())
+                pruned.append(0)
+            nodes = levels[level]
+            start = (index - pruned[level]) * HASH_SIZE
+            end = len(nodes)
+            if start == end:
+                nodes += node
+                end += HASH_SIZE
+            else:
+                nodes[start:start + HASH_SIZE] = node
+            size = end // HASH_SIZE + pruned[level]
+
+        # Descartar niveles obsoletos por encima de la raíz
+        del levels[level + 1:]
+        del pruned[level + 1:]
+
+    def forget(self, keys: Iterable[str]) -> int:
+        """
+        Olvida claves: sus hojas siguen en la raíz, pero ya no pueden
+        actualizarse ni probarse, y se liberan en cuanto todas las hojas
+        anteriores están también olvidadas.
+
+        Returns:
+            int: Número de nodos liberados
+        """
+        for key in keys:
+            self.key_index.pop(key, None)
+
+        # La primera clave viva es la de menor índice (orden de inserción)
+        first_live = next(iter(self.key_index.values()), self._count(0))
+        released = 0
+        for level, nodes in enumerate(self.levels):
+            # Conservar el hermano izquierdo del primer nodo vivo de cada nivel
+            keep_from = min((first_live >> level) & ~1, self._count(level))
+            drop = keep_from - self._pruned[level]
+            if drop > 0:
+                del nodes[:drop * HASH_SIZE]
+                self._pruned[level] = keep_from
+                released += drop
+        return released
+
+    def leaf_hash(self, key: str) -> Optional[bytes]:
+        """Retorna el hash de la hoja asociada a una clave"""
+        index = self.key_index.get(key)
+        if index is None:
+            return None
+        return self._node(0, index)
+
+    def node_hash(self, level: int, index: int) -> Optional[bytes]:
+        """Retorna el hash de un nodo del árbol, o None si no existe o se liberó"""
+        if level >= len(self.levels) or not self._pruned[level] <= index < self._count(level):
+            return None
+        return self._node(level, index)
+
+    def memory_bytes(self) -> int:
+        """Bytes ocupados por los hashes de los nodos (sin el índice de claves)"""
+        return sum(len(nodes) for nodes in self.levels)
+
+    def get_inclusion_proof(self, key: str) -> Optional[List[Tuple[str, str]]]:
+        """
+        Genera la prueba de inclusión de una clave.
+
+        Args:
+            key: Clave del registro
+
+        Returns:
+            List[Tuple[str, str]]: Lista de (lado, hash_hermano_hex) desde la hoja
+            hasta la raíz, donde lado es "L" o "R" según la posición del hermano.
+            None si la clave no existe.
+        """
+        index = self.key_index.get(key)
+        if index is None:
+            return None
+
+        proof = []
+        for level in range(len(self.levels) - 1):
+            sibling_index = index ^ 1
+            if sibling_index < self._count(level):
+                side = "L" if sibling_index < index else "R"
+                proof.append((side, self._node(level, sibling_index).hex()))
+            index //= 2
+        return proof
+
+    @staticmethod
+    def verify_inclusion_proof(data: bytes, proof: List[Tuple[str, str]], root_hex: str) -> bool:
+        """
+        Verifica una prueba de inclusión contra un hash raíz.
+
+        Args:
+            data: Serialización canónica del registro
+            proof: Prueba generada por get_inclusion_proof
+            root_hex: Hash raíz esperado en hexadecimal
+
+        Returns:
+            bool: True si el registro pertenece al árbol con esa raíz
+        """
+        current = hash_leaf(data)
+        for side, sibling_hex in proof:
+            sibling = bytes.fromhex(sibling_hex)
+            if side == "L":
+                current = hash_node(sibling, current)
+            else:
+                current = hash_node(current, sibling)
+        return current.hex() == root_hex
+
+    def find_divergent_keys(self, remote_node_hash: Callable[[int, int], Optional[bytes]],
+                            limit: int = 100) -> List[str]:
+        """
+        Localiza las hojas que difieren de un árbol remoto con la misma forma.
+
+        Desciende desde la raíz comparando nodos y solo explora los subárboles
+        cuyo hash difiere, por lo que el coste es O(k log n) para k divergencias.
+
+        Args:
+            remote_node_hash: Función (nivel, índice) -> hash del nodo remoto
+            limit: Número máximo de claves divergentes a retornar
+
+        Returns:
+            List[str]: Claves cuyas hojas difieren del árbol remoto
+        """
+        if not self.key_index:
+            return []
+
+        keys_by_index = None
+        divergent_leaves: List[int] = []
+        stack = [(len(self.levels) - 1, 0)]
+
+        while stack and len(divergent_leaves) < limit:
+            level, index = stack.pop()
+            if index < self._pruned[level]:
+                continue  # Subárbol de hojas olvidadas y liberadas
+            if remote_node_hash(level, index) == self._node(level, index):
+                continue
+            if level == 0:
+                divergent_leaves.append(index)
+                continue
+
+            left_index = index * 2
+            if left_index + 1 < self._count(level - 1):
+                stack.append((level - 1, left_index + 1))
+            stack.append((level - 1, left_index))
+
+        if divergent_leaves:
+            keys_by_index = {i: k for k, i in self.key_index.items()}
+        return [keys_by_index[i] for i in sorted(divergent_leaves) if i in keys_by_index]
@@ -7,6 +7,8 @@ Este módulo implementa el registro inmutable de origen del sistema, responsable
 2. Registrar el propósito inicial del sistema.
 3. Garantizar que el registro de origen no puede ser eliminado ni modificado.
 4. Proporcionar trazabilidad del origen en todo momento.
+5. Registrar la evolución del propósito en un log encadenado de solo anexado,
+   sin modificar ni eliminar el propósito inicial.
 
 Implementa el Principio 2: "El origen no se borra. El alineamiento puede evolucionar,
 pero nunca eliminar la trazabilidad."
@@ -15,13 +17,25 @@ Autor: Manus AI (bajo DOS-03)
 Fecha: 26 de enero de 2026
 """
 
+import bisect
 import hashlib
 import json
 import time
 from dataclasses import dataclass, asdict
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 import logging
 
+from binary_codec import hexdigest
+from merkle_accumulator import MerkleAccumulator
+from origin_storage import (
+    EVENT_EVOLUTION,
+    EVENT_FOUNDER,
+    EVENT_PURPOSE,
+    EVENT_SEAL,
+    OriginStorageError,
+    OriginStore,
+)
+
 # Configuración de logging
 logging.basicConfig(
     level=logging.INFO,
@@ -30,10 +44,15 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Codificación hasheada por PurposeRecord.compute_hash; el sellado registra la suya
+HASH_SCHEME_JSON = "json"      # JSON con claves ordenadas (registros sellados antes del códec binario)
+HASH_SCHEME_BINARY = "binary"  # Codificación canónica de binary_codec
+HASH_SCHEMES = (HASH_SCHEME_JSON, HASH_SCHEME_BINARY)
+
 
-@dataclass
+@dataclass(frozen=True)
 class FounderRecord:
-    """Registro del fundador del sistema"""
+    """Registro del fundador del sistema (inmutable)"""
     founder_id: str  # ID único del fundador
     founder_name: str  # Nombre del fundador
     founder_email: str  # Email del fundador
@@ -47,33 +66,48 @@ class FounderRecord:
         return hashlib.sha256(data.encode()).hexdigest()
 
 
-@dataclass
+@dataclass(frozen=True)
 class PurposeRecord:
-    """Registro del propósito inicial del sistema"""
+    """Registro del propósito inicial del sistema (inmutable)"""
     purpose_statement: str  # Declaración del propósito
-    ethical_principles: List[str]  # Principios éticos fundamentales
-    operational_constraints: List[str]  # Restricciones operacionales
+    ethical_principles: Tuple[str, ...]  # Principios éticos fundamentales
+    operational_constraints: Tuple[str, ...]  # Restricciones operacionales
     timestamp: float  # Timestamp del registro
     version: int  # Versión del propósito (1 = inicial)
     
-    def compute_hash(self) -> str:
-        """Calcula el hash SHA-256 del registro de propósito"""
-        data = json.dumps({
+    def __post_init__(self):
+        # Las listas (p. ej. cargadas desde JSON) se congelan como tuplas
+        object.__setattr__(self, "ethical_principles", tuple(self.ethical_principles))
+        object.__setattr__(self, "operational_constraints", tuple(self.operational_constraints))
+    
+    def compute_hash(self, scheme: str = HASH_SCHEME_JSON) -> str:
+        """
+        Calcula el hash SHA-256 del registro de propósito.
+        
+        Args:
+            scheme: Codificación hasheada (HASH_SCHEME_JSON o HASH_SCHEME_BINARY)
+        """
+        content = {
             "purpose": self.purpose_statement,
             "ethics": sorted(self.ethical_principles),
             "constraints": sorted(self.operational_constraints),
             "timestamp": self.timestamp
-        }, sort_keys=True)
-        return hashlib.sha256(data.encode()).hexdigest()
+        }
+        if scheme == HASH_SCHEME_BINARY:
+            return hexdigest(content)
+        if scheme == HASH_SCHEME_JSON:
+            return hashlib.sha256(json.dumps(content, sort_keys=True).encode()).hexdigest()
+        raise ValueError(f"Unknown purpose hash scheme: {scheme}")
 
 
-@dataclass
+@dataclass(frozen=True)
 class OriginChecksum:
     """Checksum de integridad del registro de origen"""
     timestamp: float
     founder_hash: str
     purpose_hash: str
     combined_hash: str
+    scheme: str = HASH_SCHEME_JSON  # Codificación de purpose_hash (y de las versiones del propósito)
     
     @staticmethod
     def compute_combined_hash(founder_hash: str, purpose_hash: str) -> str:
@@ -82,6 +116,161 @@ class OriginChecksum:
         return hashlib.sha256(combined.encode()).hexdigest()
 
 
+@dataclass(frozen=True)
+class PurposeVersion:
+    """Versión del propósito en el log de evolución, encadenada con la anterior"""
+    purpose: PurposeRecord
+    prev_checksum: str  # Checksum de la versión anterior (o del sellado, para la versión 1)
+    checksum: str
+    
+    @property
+    def version(self) -> int:
+        return self.purpose.version
+    
+    @property
+    def timestamp(self) -> float:
+        return self.purpose.timestamp
+    
+    @staticmethod
+    def compute_checksum(prev_checksum: str, version: int, purpose_hash: str) -> str:
+        """Calcula el checksum de una versión a partir del de la anterior"""
+        return hashlib.sha256(f"{prev_checksum}:{version}:{purpose_hash}".encode()).hexdigest()
+    
+    @classmethod
+    def create(cls, purpose: PurposeRecord, prev_checksum: str,
+               scheme: str = HASH_SCHEME_JSON) -> "PurposeVersion":
+        checksum = cls.compute_checksum(prev_checksum, purpose.version, purpose.compute_hash(scheme))
+        return cls(purpose=purpose, prev_checksum=prev_checksum, checksum=checksum)
+    
+    def is_consistent(self, scheme: str = HASH_SCHEME_JSON) -> bool:
+        """Comprueba que el checksum corresponde al propósito y al enlace"""
+        return self.checksum == self.compute_checksum(
+            self.prev_checksum, self.version, self.purpose.compute_hash(scheme))
+    
+    def canonical_bytes(self) -> bytes:
+        """Serialización de la hoja del árbol de Merkle del log"""
+        return f"{self.version}:{self.timestamp!r}:{self.prev_checksum}:{self.checksum}".encode()
+    
+    def to_dict(self) -> Dict:
+        return {
+            "purpose": asdict(self.purpose),
+            "prev_checksum": self.prev_checksum,
+            "checksum": self.checksum
+        }
+
+
+class PurposeEvolutionLog:
+    """
+    Log de evolución del propósito, de solo anexado.
+    
+    Cada versión se encadena con el checksum de la anterior; la versión 1 (el
+    propósito inicial) se ancla al checksum del sellado. Las versiones se
+    indexan por número (O(1)) y por timestamp (búsqueda binaria, O(log n)), y
+    sus entradas forman las hojas de un árbol de Merkle, de modo que verificar
+    una versión histórica cuesta O(log n): su checksum, el enlace con la
+    versión anterior y su prueba de inclusión frente a la raíz, sin recorrer
+    la cadena completa.
+    """
+    
+    def __init__(self, anchor_checksum: str, scheme: str = HASH_SCHEME_JSON):
+        """
+        Args:
+            anchor_checksum: Checksum del sellado del registro
+            scheme: Codificación de los hashes de propósito (la del sellado)
+        """
+        self.anchor_checksum = anchor_checksum
+        self.scheme = scheme
+        self._versions: List[PurposeVersion] = []
+        self._timestamps: List[float] = []
+        self._tree = MerkleAccumulator()
+    
+    def __len__(self) -> int:
+        return len(self._versions)
+    
+    @property
+    def head(self) -> str:
+        """Checksum de la última versión (o el del sellado si el log está vacío)"""
+        return self._versions[-1].checksum if self._versions else self.anchor_checksum
+    
+    @property
+    def latest(self) -> Optional[PurposeVersion]:
+        return self._versions[-1] if self._versions else None
+    
+    def root_hex(self) -> str:
+        """Raíz del árbol de Merkle de las versiones"""
+        return self._tree.root_hex()
+    
+    def next_entry(self, purpose_statement: str, ethical_principles: List[str],
+                   operational_constraints: List[str]) -> PurposeVersion:
+        """Construye (sin anexar) la siguiente versión del propósito"""
+        # Timestamps no decrecientes: el índice temporal requiere orden
+        timestamp = max(time.time(), self._timestamps[-1]) if self._timestamps else time.time()
+        purpose = PurposeRecord(
+            purpose_statement=purpose_statement,
+            ethical_principles=tuple(ethical_principles),
+            operational_constraints=tuple(operational_constraints),
+            timestamp=timestamp,
+            version=len(self._versions) + 1
+        )
+        return PurposeVersion.create(purpose, self.head, self.scheme)
+    
+    def append(self, entry: PurposeVersion):
+        """
+        Anexa una versión verificando su número, orden temporal, enlace y checksum.
+        
+        Raises:
+            ValueError: Si la versión no continúa la cadena
+        """
+        if entry.version != len(self._versions) + 1:
+            raise ValueError(f"Purpose version {entry.version} does not follow {len(self._versions)}")
+        if self._timestamps and entry.timestamp < self._timestamps[-1]:
+            raise ValueError(f"Purpose version {entry.version} predates version {len(self._versions)}")
+        if entry.prev_checksum != self.head:
+            raise ValueError(f"Purpose version {entry.version} is not linked to the previous checksum")
+        if not entry.is_consistent(self.scheme):
+            raise ValueError(f"Purpose version {entry.version} checksum mismatch")
+        
+        self._versions.append(entry)
+        self._timestamps.append(entry.timestamp)
+        self._tree.upsert(str(entry.version), entry.canonical_bytes())
+    
+    def get(self, version: int) -> Optional[PurposeVersion]:
+        """Versión por número (O(1))"""
+        if 1 <= version <= len(self._versions):
+            return self._versions[version - 1]
+        return None
+    
+    def at(self, timestamp: float) -> Optional[PurposeVersion]:
+        """Versión vigente en un instante (O(log n)); None si es anterior a la versión 1"""
+        index = bisect.bisect_right(self._timestamps, timestamp)
+        return self._versions[index - 1] if index else None
+    
+    def get_proof(self, version: int) -> Optional[List[Tuple[str, str]]]:
+        """Prueba de inclusión de una versión frente a root_hex()"""
+        return self._tree.get_inclusion_proof(str(version))
+    
+    def verify_version(self, version: int) -> bool:
+        """
+        Verifica una versión histórica en O(log n).
+        
+        Returns:
+            bool: True si el checksum, el enlace con la versión anterior y la
+            prueba de inclusión en el árbol son válidos
+        """
+        entry = self.get(version)
+        if entry is None or not entry.is_consistent(self.scheme):
+            return False
+        previous = self.get(version - 1)
+        expected_prev = previous.checksum if previous is not None else self.anchor_checksum
+        if entry.prev_checksum != expected_prev:
+            return False
+        return MerkleAccumulator.verify_inclusion_proof(
+            entry.canonical_bytes(), self.get_proof(version), self.root_hex())
+    
+    def __iter__(self):
+        return iter(self._versions)
+
+
 class OriginRegistry:
     """
     Origin Registry - Registro Inmutable de Origen de CAELION
@@ -92,76 +281,193 @@ class OriginRegistry:
     - Principios éticos fundamentales
     
     Implementa el Principio 2: "El origen no se borra"
+    
+    Los registros son dataclasses congeladas y solo se sustituyen a través de
+    los métodos de registro y carga, que incrementan un contador de
+    generación. El resultado de verify_integrity() se calcula al sellar y al
+    cargar y se reutiliza mientras no cambien la generación ni la identidad de
+    los registros, de modo que get_origin_summary() no recalcula hashes.
+    
+    Tras el sellado, el propósito solo puede evolucionar anexando versiones
+    al log de evolución (evolve_purpose); el propósito inicial se conserva
+    como versión 1.
     """
     
-    def __init__(self, storage_path: str = "/var/caelion/origin_registry.json"):
+    def __init__(self, storage_path: str = "/var/caelion/origin_registry.json",
+                 compact_every: int = 16):
         """
         Inicializa el Registro de Origen.
         
         Args:
             storage_path: Ruta al archivo de almacenamiento del registro
+            compact_every: Eventos en el journal que disparan una compactación
         """
         self.storage_path = storage_path
-        self.founder: Optional[FounderRecord] = None
-        self.purpose: Optional[PurposeRecord] = None
-        self.checksums: List[OriginChecksum] = []
-        self.is_sealed = False  # Una vez sellado, no se puede modificar
+        self._store = OriginStore(storage_path, compact_every=compact_every)
+        self._founder: Optional[FounderRecord] = None
+        self._purpose: Optional[PurposeRecord] = None
+        self._checksums: List[OriginChecksum] = []
+        self._sealed = False  # Una vez sellado, no se puede modificar
+        self._evolution: Optional[PurposeEvolutionLog] = None  # Solo tras el sellado
+        
+        # Caché de verificación: (generación, fundador, propósito, resultado)
+        self._generation = 0
+        self._verified: Optional[Tuple[int, FounderRecord, PurposeRecord, bool]] = None
         
         logger.info("Origin Registry initializing...")
         self._load_from_storage()
         logger.info("Origin Registry initialized successfully")
     
+    @property
+    def founder(self) -> Optional[FounderRecord]:
+        return self._founder
+    
+    @property
+    def purpose(self) -> Optional[PurposeRecord]:
+        return self._purpose
+    
+    @property
+    def checksums(self) -> Tuple[OriginChecksum, ...]:
+        return tuple(self._checksums)
+    
+    @property
+    def is_sealed(self) -> bool:
+        return self._sealed
+    
+    @property
+    def current_purpose(self) -> Optional[PurposeRecord]:
+        """Última versión del propósito (el propósito inicial si no ha evolucionado)"""
+        if self._evolution is not None:
+            return self._evolution.latest.purpose
+        return self._purpose
+    
+    @property
+    def purpose_evolution(self) -> Optional[PurposeEvolutionLog]:
+        return self._evolution
+    
+    @property
+    def generation(self) -> int:
+        """Contador de mutaciones del registro (invalida la verificación en caché)"""
+        return self._generation
+    
+    def _mutated(self):
+        """Único camino de mutación: invalida la verificación en caché"""
+        self._generation += 1
+        self._verified = None
+    
     def _load_from_storage(self):
-        """Carga el registro de origen desde el almacenamiento"""
+        """
+        Carga el registro de origen desde el almacenamiento.
+        
+        Reproduce el journal sobre el último documento compactado verificando
+        la cadena de hashes; los documentos del formato anterior se cargan tal
+        cual.
+        
+        Raises:
+            OriginStorageError: Si el journal está corrupto (nunca se continúa
+                con un registro vacío que permitiría registrar otro origen)
+        """
         try:
-            import os
-            if os.path.exists(self.storage_path):
-                with open(self.storage_path, 'r') as f:
-                    data = json.load(f)
+            loaded = self._store.load()
+            if loaded.exists:
+                data = loaded.state
                 
                 # Cargar fundador
-                if "founder" in data:
-                    self.founder = FounderRecord(**data["founder"])
+                if data.get("founder"):
+                    self._founder = FounderRecord(**data["founder"])
                 
                 # Cargar propósito
-                if "purpose" in data:
-                    self.purpose = PurposeRecord(**data["purpose"])
+                if data.get("purpose"):
+                    self._purpose = PurposeRecord(**data["purpose"])
                 
                 # Cargar checksums
-                if "checksums" in data:
-                    self.checksums = [OriginChecksum(**c) for c in data["checksums"]]
+                self._checksums = [OriginChecksum(**c) for c in data["checksums"]]
                 
                 # Cargar estado de sellado
-                self.is_sealed = data.get("is_sealed", False)
+                self._sealed = data.get("is_sealed", False)
+                
+                # Reconstruir y verificar el log de evolución del propósito
+                if self._sealed:
+                    self._load_evolution(data["purpose_evolution"], data["purpose_evolution_root"])
+                self._mutated()
                 
-                logger.info(f"Origin registry loaded from {self.storage_path}")
+                logger.info(f"Origin registry loaded from {self.storage_path} "
+                            f"({loaded.replayed} journal events replayed"
+                            f"{', legacy format' if loaded.legacy else ''})")
                 logger.info(f"Sealed: {self.is_sealed}")
+                
+                # Verificar una sola vez al cargar; las consultas usan la caché
+                if self._sealed:
+                    self.verify_integrity(force=True)
             else:
                 logger.warning(f"No existing registry found at {self.storage_path}")
+        except OriginStorageError as e:
+            logger.critical(f"ORIGIN REGISTRY STORAGE CORRUPTED: {e}")
+            raise
         except Exception as e:
             logger.error(f"Error loading origin registry: {e}")
     
+    def _start_evolution(self):
+        """Inicia el log de evolución: la versión 1 se ancla al checksum del sellado"""
+        seal = self._checksums[-1]
+        self._evolution = PurposeEvolutionLog(seal.combined_hash, seal.scheme)
+        self._evolution.append(PurposeVersion.create(self._purpose, self._evolution.head, seal.scheme))
+    
+    def _load_evolution(self, entries: List[Dict], expected_root: Optional[str]):
+        """Reconstruye el log de evolución verificando cada enlace y la raíz registrada"""
+        if not self._checksums or self._purpose is None:
+            raise OriginStorageError("Sealed origin registry without seal checksum or purpose")
+        self._start_evolution()
+        try:
+            for entry in entries:
+                self._evolution.append(PurposeVersion(
+                    purpose=PurposeRecord(**entry["purpose"]),
+                    prev_checksum=entry["prev_checksum"],
+                    checksum=entry["checksum"]
+                ))
+        except (ValueError, KeyError, TypeError) as e:
+            raise OriginStorageError(f"Invalid purpose evolution log: {e}")
+        if expected_root is not None and expected_root != self._evolution.root_hex():
+            raise OriginStorageError("Purpose evolution log root mismatch")
+    
+    def _state_dict(self) -> Dict:
+        """Estado completo del registro (formato del documento JSON)"""
+        evolution = self._evolution
+        return {
+            "founder": asdict(self.founder) if self.founder else None,
+            "purpose": asdict(self.purpose) if self.purpose else None,
+            "checksums": [asdict(c) for c in self._checksums],
+            "is_sealed": self.is_sealed,
+            # La versión 1 es el propósito inicial: solo se guardan las posteriores
+            "purpose_evolution": [v.to_dict() for v in evolution if v.version > 1] if evolution else [],
+            "purpose_evolution_root": evolution.root_hex() if evolution else None
+        }
+    
+    def _record_event(self, event: str, data: Dict):
+        """
+        Anexa un evento al journal (durable antes de aplicarse en memoria) y
+        compacta el journal cuando alcanza `compact_every` eventos.
+        """
+        try:
+            self._store.append(event, data)
+            logger.info(f"Origin registry event '{event}' journaled to {self._store.journal_path}")
+        except Exception as e:
+            logger.error(f"Error saving origin registry: {e}")
+            raise
+    
     def _save_to_storage(self):
-        """Guarda el registro de origen en el almacenamiento"""
+        """Compacta el registro: documento completo escrito de forma atómica y journal vacío"""
         try:
-            import os
-            os.makedirs(os.path.dirname(self.storage_path), exist_ok=True)
-            
-            data = {
-                "founder": asdict(self.founder) if self.founder else None,
-                "purpose": asdict(self.purpose) if self.purpose else None,
-                "checksums": [asdict(c) for c in self.checksums],
-                "is_sealed": self.is_sealed
-            }
-            
-            with open(self.storage_path, 'w') as f:
-                json.dump(data, f, indent=2)
-            
+            self._store.compact(self._state_dict())
             logger.info(f"Origin registry saved to {self.storage_path}")
         except Exception as e:
             logger.error(f"Error saving origin registry: {e}")
             raise
     
+    def _compact_if_needed(self):
+        if self._store.needs_compaction():
+            self._save_to_storage()
+    
     def register_founder(self, founder_id: str, founder_name: str, 
                         founder_email: str, creation_location: str,
                         signature: str):
@@ -187,7 +493,7 @@ class OriginRegistry:
         if self.founder is not None:
             raise RuntimeError("Founder already registered, cannot modify")
         
-        self.founder = FounderRecord(
+        founder = FounderRecord(
             founder_id=founder_id,
             founder_name=founder_name,
             founder_email=founder_email,
@@ -195,9 +501,12 @@ class OriginRegistry:
             creation_location=creation_location,
             signature=signature
         )
+        self._record_event(EVENT_FOUNDER, asdict(founder))
+        self._founder = founder
+        self._mutated()
         
         logger.info(f"Founder registered: {founder_name} ({founder_id})")
-        self._save_to_storage()
+        self._compact_if_needed()
     
     def register_purpose(self, purpose_statement: str, 
                         ethical_principles: List[str],
@@ -222,16 +531,19 @@ class OriginRegistry:
         if self.purpose is not None:
             raise RuntimeError("Purpose already registered, cannot modify")
         
-        self.purpose = PurposeRecord(
+        purpose = PurposeRecord(
             purpose_statement=purpose_statement,
-            ethical_principles=ethical_principles,
-            operational_constraints=operational_constraints,
+            ethical_principles=tuple(ethical_principles),
+            operational_constraints=tuple(operational_constraints),
             timestamp=time.time(),
             version=1  # Versión inicial
         )
+        self._record_event(EVENT_PURPOSE, asdict(purpose))
+        self._purpose = purpose
+        self._mutated()
         
         logger.info("Initial purpose registered")
-        self._save_to_storage()
+        self._compact_if_needed()
     
     def seal_registry(self):
         """
@@ -255,18 +567,24 @@ class OriginRegistry:
         
         # Calcular checksums finales
         founder_hash = self.founder.compute_hash()
-        purpose_hash = self.purpose.compute_hash()
+        purpose_hash = self.purpose.compute_hash(HASH_SCHEME_BINARY)
         combined_hash = OriginChecksum.compute_combined_hash(founder_hash, purpose_hash)
         
         checksum = OriginChecksum(
             timestamp=time.time(),
             founder_hash=founder_hash,
             purpose_hash=purpose_hash,
-            combined_hash=combined_hash
+            combined_hash=combined_hash,
+            scheme=HASH_SCHEME_BINARY
         )
         
-        self.checksums.append(checksum)
-        self.is_sealed = True
+        self._record_event(EVENT_SEAL, asdict(checksum))
+        self._checksums.append(checksum)
+        self._sealed = True
+        self._start_evolution()
+        self._mutated()
+        # El hash recién calculado es la verificación inicial
+        self._verified = (self._generation, self.founder, self.purpose, True)
         
         logger.critical("=" * 80)
         logger.critical("ORIGIN REGISTRY SEALED")
@@ -276,13 +594,114 @@ class OriginRegistry:
         logger.critical(f"Checksum: {combined_hash}")
         logger.critical("=" * 80)
         
+        # El registro sellado ya no cambia: dejarlo compactado en un solo documento
         self._save_to_storage()
     
-    def verify_integrity(self) -> bool:
+    def evolve_purpose(self, purpose_statement: str,
+                       ethical_principles: List[str],
+                       operational_constraints: List[str]) -> PurposeVersion:
+        """
+        Registra una nueva versión del propósito.
+        
+        El propósito inicial y las versiones anteriores no se modifican: la
+        nueva versión se anexa al log de evolución, encadenada con el checksum
+        de la anterior, y se escribe como un evento del journal (sin reescribir
+        el documento del registro).
+        
+        Args:
+            purpose_statement: Nueva declaración del propósito
+            ethical_principles: Principios éticos de la nueva versión
+            operational_constraints: Restricciones operacionales de la nueva versión
+        
+        Returns:
+            PurposeVersion: Versión registrada
+        
+        Raises:
+            RuntimeError: Si el registro no está sellado o su integridad no es válida
+        """
+        if not self.is_sealed:
+            raise RuntimeError("Purpose can only evolve after the origin registry is sealed")
+        
+        if not self.verify_integrity():
+            raise RuntimeError("Origin registry integrity check failed, cannot evolve purpose")
+        
+        entry = self._evolution.next_entry(purpose_statement, ethical_principles,
+                                           operational_constraints)
+        # El evento registra la raíz del log con la nueva versión
+        self._evolution.append(entry)
+        data = entry.to_dict()
+        data["log_root"] = self._evolution.root_hex()
+        try:
+            self._record_event(EVENT_EVOLUTION, data)
+        except Exception:
+            # El evento no es durable: reconstruir el log sin la nueva versión
+            previous = [v.to_dict() for v in self._evolution if 1 < v.version < entry.version]
+            self._load_evolution(previous, None)
+            raise
+        self._mutated()
+        
+        logger.info(f"Purpose evolved to version {entry.version} (checksum {entry.checksum[:16]})")
+        self._compact_if_needed()
+        return entry
+    
+    def get_purpose_version(self, version: int) -> Optional[Dict]:
+        """
+        Retorna una versión del propósito por número (O(1)).
+        
+        Returns:
+            Dict: Información de la versión, o None si no existe
+        """
+        if self._evolution is None:
+            return self.get_purpose_info() if version == 1 else None
+        entry = self._evolution.get(version)
+        return self._version_info(entry) if entry else None
+    
+    def get_purpose_at(self, timestamp: float) -> Optional[Dict]:
+        """
+        Retorna la versión del propósito vigente en un instante (O(log n)).
+        
+        Returns:
+            Dict: Información de la versión, o None si es anterior al propósito inicial
+        """
+        if self._evolution is None:
+            return None
+        entry = self._evolution.at(timestamp)
+        return self._version_info(entry) if entry else None
+    
+    def verify_purpose_version(self, version: int) -> bool:
+        """
+        Verifica una versión histórica del propósito en O(log n): su checksum,
+        el enlace con la versión anterior y su inclusión en el log.
+        
+        Returns:
+            bool: True si la versión es válida
+        """
+        if self._evolution is None:
+            return False
+        return self._evolution.verify_version(version)
+    
+    def _version_info(self, entry: PurposeVersion) -> Dict:
+        return {
+            "purpose_statement": entry.purpose.purpose_statement,
+            "ethical_principles": list(entry.purpose.ethical_principles),
+            "operational_constraints": list(entry.purpose.operational_constraints),
+            "timestamp": entry.timestamp,
+            "version": entry.version,
+            "prev_checksum": entry.prev_checksum,
+            "checksum": entry.checksum
+        }
+    
+    def verify_integrity(self, force: bool = False) -> bool:
         """
         Verifica la integridad del registro de origen.
         
         Calcula los hashes actuales y los compara con los checksums sellados.
+        El resultado se guarda en caché: mientras no cambien la generación ni
+        los registros (sustituir un registro fuera de los métodos de registro
+        también invalida la caché), la verificación es O(1) y no emite logs.
+        
+        Args:
+            force: Recalcular los hashes aunque haya un resultado en caché
         
         Returns:
             bool: True si la integridad es válida, False si hay corrupción
@@ -291,16 +710,31 @@ class OriginRegistry:
             logger.warning("Registry is not sealed, cannot verify integrity")
             return True
         
-        if len(self.checksums) == 0:
+        cached = self._verified
+        if (not force and cached is not None and cached[0] == self._generation and
+                cached[1] is self._founder and cached[2] is self._purpose):
+            return cached[3]
+        
+        integrity_ok = self._compute_integrity()
+        self._verified = (self._generation, self._founder, self._purpose, integrity_ok)
+        return integrity_ok
+    
+    def _compute_integrity(self) -> bool:
+        """Recalcula los hashes y los compara con el checksum del sellado"""
+        if len(self._checksums) == 0:
             logger.error("No checksums found, integrity cannot be verified")
             return False
         
+        if self._founder is None or self._purpose is None:
+            logger.critical("❌ ORIGIN REGISTRY CORRUPTION DETECTED: sealed registry without founder or purpose")
+            return False
+        
         # Obtener el último checksum (el del sellado)
-        sealed_checksum = self.checksums[-1]
+        sealed_checksum = self._checksums[-1]
         
         # Calcular hashes actuales
         current_founder_hash = self.founder.compute_hash()
-        current_purpose_hash = self.purpose.compute_hash()
+        current_purpose_hash = self.purpose.compute_hash(sealed_checksum.scheme)
         current_combined_hash = OriginChecksum.compute_combined_hash(
             current_founder_hash, current_purpose_hash
         )
@@ -347,8 +781,8 @@ class OriginRegistry:
         
         return {
             "purpose_statement": self.purpose.purpose_statement,
-            "ethical_principles": self.purpose.ethical_principles,
-            "operational_constraints": self.purpose.operational_constraints,
+            "ethical_principles": list(self.purpose.ethical_principles),
+            "operational_constraints": list(self.purpose.operational_constraints),
             "timestamp": self.purpose.timestamp,
             "version": self.purpose.version
         }
@@ -364,6 +798,7 @@ class OriginRegistry:
             "is_sealed": self.is_sealed,
             "founder": self.get_founder_info(),
             "purpose": self.get_purpose_info(),
+            "current_purpose_version": self.current_purpose.version if self.current_purpose else None,
             "integrity_verified": self.verify_integrity() if self.is_sealed else None
         }
 
@@ -0,0 +1,273 @@
+#!/usr/bin/env python3
+"""
+Almacenamiento de Origen - Journal Encadenado y Escritura Atómica del Origin Registry
+
+Este módulo implementa el motor de almacenamiento del registro de origen,
+responsable de:
+1. Anexar cada evento del registro (fundador, propósito, sellado, checksum,
+   evolución del propósito) a un journal de solo anexado, con fsync y encadenado por hashes.
+2. Compactar periódicamente el journal en un documento completo escrito de
+   forma atómica (temporal + fsync + os.replace + fsync del directorio).
+3. Cargar el registro reproduciendo el journal sobre el último documento
+   compactado y verificando la cadena de hashes.
+4. Cargar los documentos JSON del formato anterior (sin journal).
+
+Autor: Manus AI (bajo DOS-03)
+Fecha: 26 de enero de 2026
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+import logging
+
+logger = logging.getLogger(__name__)
+
+GENESIS_HASH = "0" * 64
+JOURNAL_SUFFIX = ".journal"
+
+# Eventos del registro y cómo se aplican al estado
+EVENT_FOUNDER = "founder"
+EVENT_PURPOSE = "purpose"
+EVENT_SEAL = "seal"           # Datos: checksum del sellado
+EVENT_CHECKSUM = "checksum"
+EVENT_EVOLUTION = "evolution"  # Datos: nueva versión del propósito y raíz del log de evolución
+EVENTS = (EVENT_FOUNDER, EVENT_PURPOSE, EVENT_SEAL, EVENT_CHECKSUM, EVENT_EVOLUTION)
+
+
+class OriginStorageError(Exception):
+    """El journal o el documento del registro de origen están corruptos"""
+
+
+def atomic_write(path: str, data: bytes):
+    """Escribe un archivo completo o nada (temporal + fsync + rename + fsync del directorio)"""
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".tmp-")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    fsync_directory(directory)
+
+
+def fsync_directory(directory: str):
+    dir_fd = os.open(directory, os.O_RDONLY)
+    try:
+        os.fsync(dir_fd)
+    finally:
+        os.close(dir_fd)
+
+
+def empty_state() -> Dict:
+    """Estado de un registro sin eventos (mismas claves que el documento JSON)"""
+    return {"founder": None, "purpose": None, "checksums": [], "is_sealed": False,
+            "purpose_evolution": [], "purpose_evolution_root": None}
+
+
+def apply_event(state: Dict, event: str, data: Dict):
+    """Aplica un evento del journal al estado del registro"""
+    if event == EVENT_FOUNDER:
+        state["founder"] = data
+    elif event == EVENT_PURPOSE:
+        state["purpose"] = data
+    elif event == EVENT_SEAL:
+        state["checksums"].append(data)
+        state["is_sealed"] = True
+    elif event == EVENT_CHECKSUM:
+        state["checksums"].append(data)
+    elif event == EVENT_EVOLUTION:
+        entry = dict(data)
+        state["purpose_evolution_root"] = entry.pop("log_root")
+        state["purpose_evolution"].append(entry)
+    else:
+        raise OriginStorageError(f"Unknown origin registry event: {event}")
+
+
+def chain_hash(prev_hash: str, sequence: int, event: str, data: Dict) -> str:
+    """Hash de una entrada del journal, encadenado con el de la anterior"""
+    body = json.dumps({"seq": sequence, "event": event, "data": data},
+                      sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(f"{prev_hash}:{body}".encode()).hexdigest()
+
+
+@dataclass
+class LoadResult:
+    """Estado cargado y cómo se obtuvo"""
+    state: Dict
+    sequence: int = 0             # Último evento aplicado
+    head: str = GENESIS_HASH      # Hash del último evento aplicado
+    replayed: int = 0             # Eventos reproducidos desde el journal
+    legacy: bool = False          # Documento del formato anterior (sin journal)
+    exists: bool = False
+
+
+class OriginStore:
+    """
+    Almacén del registro de origen: documento compactado + journal.
+
+    El documento (`storage_path`) conserva el formato JSON anterior y añade
+    la posición del journal que ya incluye (`journal.sequence` y
+    `journal.head`). El journal (`storage_path + ".journal"`) contiene una
+    línea JSON por evento posterior, cada una con el hash de la anterior. Al
+    compactar se escribe primero el documento y después se vacía el journal;
+    una caída entre ambos pasos solo deja eventos ya incluidos, que la carga
+    descarta por su número de secuencia.
+    """
+
+    def __init__(self, storage_path: str, compact_every: int = 16, fsync: bool = True):
+        """
+        Args:
+            storage_path: Documento JSON del registro
+            compact_every: Eventos en el journal que disparan una compactación
+            fsync: Sincronizar cada escritura con el disco
+        """
+        self.storage_path = storage_path
+        self.journal_path = storage_path + JOURNAL_SUFFIX
+        self.compact_every = compact_every
+        self.fsync = fsync
+
+        self.sequence = 0
+        self.head = GENESIS_HASH
+        self.journal_entries = 0
+
+    # ========== CARGA ==========
+
+    def load(self) -> LoadResult:
+        """
+        Carga el documento compactado y reproduce el journal.
+
+        Returns:
+            LoadResult: Estado reconstruido y posición del journal
+
+        Raises:
+            OriginStorageError: Si la cadena de hashes o un evento no son válidos
+        """
+        result = LoadResult(state=empty_state())
+
+        if os.path.exists(self.storage_path):
+            with open(self.storage_path, "r") as f:
+                document = json.load(f)
+            journal = document.pop("journal", None)
+            result.legacy = journal is None
+            result.exists = True
+            for key in result.state:
+                if document.get(key) is not None:
+                    result.state[key] = document[key]
+            if journal is not None:
+                result.sequence = journal["sequence"]
+                result.head = journal["head"]
+
+        for entry in self._read_journal():
+            if entry["seq"] <= result.sequence:
+                continue  # Ya incluido en el documento (caída durante la compactación)
+            if entry["seq"] != result.sequence + 1 or entry["prev"] != result.head:
+                raise OriginStorageError(
+                    f"Origin journal chain broken at event {entry['seq']} "
+                    f"(expected {result.sequence + 1} after {result.head[:16]})")
+            expected = chain_hash(entry["prev"], entry["seq"], entry["event"], entry["data"])
+            if entry["hash"] != expected:
+                raise OriginStorageError(f"Origin journal event {entry['seq']} hash mismatch")
+            apply_event(result.state, entry["event"], entry["data"])
+            result.sequence = entry["seq"]
+            result.head = entry["hash"]
+            result.replayed += 1
+            result.exists = True
+
+        self.sequence, self.head = result.sequence, result.head
+        self.journal_entries = result.replayed
+        return result
+
+    def _read_journal(self) -> List[Dict]:
+        if not os.path.exists(self.journal_path):
+            return []
+        with open(self.journal_path, "rb") as f:
+            data = f.read()
+
+        entries = []
+        offset = 0
+        while offset < len(data):
+            end = data.find(b"\n", offset)
+            if end == -1:
+                # Última línea sin terminar: escritura interrumpida, el evento no se
+                # confirmó. Se trunca para que el siguiente evento empiece en su línea.
+                logger.warning(f"Discarding torn last event in {self.journal_path}")
+                with open(self.journal_path, "r+b") as f:
+                    f.truncate(offset)
+                    if self.fsync:
+                        os.fsync(f.fileno())
+                break
+            line = data[offset:end]
+            if line:
+                try:
+                    entries.append(json.loads(line))
+                except ValueError:
+                    raise OriginStorageError(f"Corrupted event at byte {offset} of {self.journal_path}")
+            offset = end + 1
+        return entries
+
+    # ========== ESCRITURA ==========
+
+    def append(self, event: str, data: Dict) -> str:
+        """
+        Anexa un evento al journal (fsync antes de retornar).
+
+        Returns:
+            str: Hash del evento (nueva cabeza de la cadena)
+        """
+        if event not in EVENTS:
+            raise OriginStorageError(f"Unknown origin registry event: {event}")
+        sequence = self.sequence + 1
+        entry_hash = chain_hash(self.head, sequence, event, data)
+        line = json.dumps({"seq": sequence, "event": event, "data": data,
+                           "prev": self.head, "hash": entry_hash}, sort_keys=True)
+
+        created = not os.path.exists(self.journal_path)
+        if created:
+            os.makedirs(os.path.dirname(os.path.abspath(self.journal_path)), exist_ok=True)
+        with open(self.journal_path, "ab") as f:
+            f.write(line.encode() + b"\n")
+            f.flush()
+            if self.fsync:
+                os.fsync(f.fileno())
+        if created and self.fsync:
+            fsync_directory(os.path.dirname(os.path.abspath(self.journal_path)))
+
+        self.sequence, self.head = sequence, entry_hash
+        self.journal_entries += 1
+        return entry_hash
+
+    def needs_compaction(self) -> bool:
+        return self.journal_entries >= self.compact_every
+
+    def compact(self, state: Dict):
+        """
+        Escribe el estado completo de forma atómica y vacía el journal.
+
+        Args:
+            state: Estado actual del registro (incluye todos los eventos anexados)
+        """
+        document = dict(state)
+        document["journal"] = {"sequence": self.sequence, "head": self.head}
+        data = json.dumps(document, indent=2).encode()
+        if self.fsync:
+            atomic_write(self.storage_path, data)
+        else:
+            with open(self.storage_path, "wb") as f:
+                f.write(data)
+
+        if os.path.exists(self.journal_path):
+            os.remove(self.journal_path)
+            if self.fsync:
+                fsync_directory(os.path.dirname(os.path.abspath(self.journal_path)))
+        self.journal_entries = 0
+        logger.debug(f"Origin registry compacted at event {self.sequence}")
@@ -0,0 +1,284 @@
+#!/usr/bin/env python3
+"""
+Registro de Procesos - Congelación y Terminación de Baja Latencia para ÆON
+
+Este módulo implementa el registro de procesos de CAELION usado por ÆON,
+responsable de:
+1. Registrar los procesos supervisados al lanzarlos, cada uno en su propio
+   grupo de procesos.
+2. Descubrir el resto de procesos de CAELION escaneando /proc, con una caché
+   de procesos ya inspeccionados por (PID, instante de arranque), sin lanzar
+   pgrep.
+3. Enviar señales por grupo de procesos (killpg), de modo que los hijos
+   creados durante la congelación también quedan detenidos.
+4. Medir la latencia de cada congelación o terminación.
+
+Autor: Manus AI (bajo DOS-03)
+Fecha: 26 de enero de 2026
+"""
+
+import os
+import re
+import signal
+import subprocess
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Set, Tuple
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class SignalResult:
+    """Resultado de enviar una señal a los procesos de CAELION"""
+    signal_name: str
+    signalled_pids: List[int] = field(default_factory=list)
+    signalled_groups: List[int] = field(default_factory=list)
+    rounds: int = 0
+    latency_ms: float = 0.0
+    errors: List[str] = field(default_factory=list)
+
+    def to_dict(self) -> Dict:
+        return {
+            "signal": self.signal_name,
+            "signalled_pids": self.signalled_pids,
+            "signalled_groups": self.signalled_groups,
+            "rounds": self.rounds,
+            "latency_ms": round(self.latency_ms, 3),
+            "errors": self.errors
+        }
+
+
+class ProcessRegistry:
+    """
+    Registro de procesos de CAELION.
+
+    Combina dos fuentes: los procesos supervisados (registrados al lanzarlos,
+    señalizados por grupo) y los procesos descubiertos en /proc cuya línea de
+    comandos coincide con el patrón (equivalente a `pgrep -f`). Todos los
+    procesos se identifican por (PID, instante de arranque): refresh() lee el
+    instante de arranque de cada PID y solo vuelve a leer la línea de comandos
+    si el PID es nuevo o fue reutilizado por otro proceso, de modo que nunca
+    se señaliza un PID reutilizado ni se ignora un proceso de CAELION que lo
+    reutiliza.
+
+    Para no alargar la congelación, los escaneos durante una señal solo
+    inspeccionan los PIDs nuevos y los recientes; un PID que termina y se
+    reutiliza entre dos escaneos (la numeración de PIDs tiene que dar la
+    vuelta) se detecta en el siguiente refresh(). Un exec no cambia el
+    instante de arranque, así que los procesos más recientes que
+    `exec_grace_seconds` se re-inspeccionan en cada escaneo: uno escaneado
+    entre fork y exec aún tiene la línea de comandos de su padre.
+    """
+
+    def __init__(self, pattern: str = "caelion", proc_root: str = "/proc",
+                 max_rounds: int = 3, exec_grace_seconds: float = 2.0):
+        """
+        Args:
+            pattern: Expresión regular buscada en la línea de comandos
+            proc_root: Punto de montaje de procfs
+            max_rounds: Re-escaneos tras señalizar, para alcanzar procesos creados entretanto
+            exec_grace_seconds: Antigüedad por debajo de la cual un proceso que no
+                coincide se re-inspecciona en cada escaneo (puede no haber hecho exec)
+        """
+        self.pattern = re.compile(pattern)
+        self.proc_root = proc_root
+        self.max_rounds = max_rounds
+        self.exec_grace_ticks = exec_grace_seconds * os.sysconf("SC_CLK_TCK")
+        self.own_pid = os.getpid()
+        self.own_pgid = os.getpgid(0)
+
+        self._lock = threading.Lock()
+        self._inspected: Dict[int, int] = {}             # PID no coincidente -> instante de arranque
+        self._matched: Dict[int, Optional[int]] = {}     # PID coincidente -> instante de arranque
+        self._groups: Dict[int, int] = {}                # PID supervisado -> grupo de procesos
+        self.last_result: Optional[SignalResult] = None
+
+    # ========== PROCESOS SUPERVISADOS ==========
+
+    def spawn(self, args, **kwargs) -> subprocess.Popen:
+        """Lanza un proceso supervisado en su propio grupo y lo registra"""
+        process = subprocess.Popen(args, process_group=0, **kwargs)
+        self.register(process.pid)
+        return process
+
+    def register(self, pid: int, pgid: Optional[int] = None):
+        """Registra un proceso supervisado (y su grupo de procesos)"""
+        if pgid is None:
+            pgid = os.getpgid(pid)
+        with self._lock:
+            self._groups[pid] = pgid
+            self._matched[pid] = self._start_time(pid)
+            self._inspected.pop(pid, None)
+
+    def unregister(self, pid: int):
+        with self._lock:
+            self._groups.pop(pid, None)
+            self._matched.pop(pid, None)
+
+    # ========== DESCUBRIMIENTO ==========
+
+    def refresh(self) -> Set[int]:
+        """
+        Actualiza la caché de procesos a partir de /proc.
+
+        Returns:
+            Set[int]: PIDs de CAELION conocidos (sin incluir a ÆON)
+        """
+        with self._lock:
+            self._scan()
+            return set(self._matched)
+
+    def _scan(self, recheck: bool = True) -> List[int]:
+        """
+        Inspecciona los procesos nuevos (o con el PID reutilizado) y olvida
+        los terminados.
+
+        Args:
+            recheck: Releer el instante de arranque de los PIDs ya conocidos
+                para detectar su reutilización; sin él solo se inspeccionan los
+                PIDs nuevos y los recientes (re-escaneos durante una señal)
+
+        Returns:
+            List[int]: PIDs coincidentes descubiertos en este escaneo
+        """
+        try:
+            current = {int(name) for name in os.listdir(self.proc_root) if name.isdigit()}
+        except OSError as e:
+            logger.error(f"Cannot list {self.proc_root}: {e}")
+            return []
+
+        for pid in [pid for pid in self._inspected if pid not in current]:
+            del self._inspected[pid]
+        for pid in [pid for pid in self._matched if pid not in current]:
+            del self._matched[pid]
+            self._groups.pop(pid, None)
+
+        young_after = self._uptime_ticks() - self.exec_grace_ticks
+        new_matches = []
+        for pid in current:
+            if pid == self.own_pid:
+                continue
+            if not recheck:
+                if pid in self._matched:
+                    continue
+                cached = self._inspected.get(pid)
+                if cached is not None and cached < young_after:
+                    continue
+            start_time = self._start_time(pid)
+            if start_time is None:
+                continue  # Terminó durante el escaneo
+            if pid in self._matched:
+                if self._matched[pid] == start_time:
+                    continue
+                # PID reutilizado por otro proceso
+                del self._matched[pid]
+                self._groups.pop(pid, None)
+            elif self._inspected.get(pid) == start_time and start_time < young_after:
+                continue
+
+            if self._matches(pid):
+                self._inspected.pop(pid, None)
+                self._matched[pid] = start_time
+                new_matches.append(pid)
+            else:
+                self._inspected[pid] = start_time
+        return new_matches
+
+    def _matches(self, pid: int) -> bool:
+        try:
+            with open(f"{self.proc_root}/{pid}/cmdline", "rb") as f:
+                cmdline = f.read()
+        except OSError:
+            return False
+        if not cmdline:
+            return False  # Hilos del kernel y procesos zombis
+        return bool(self.pattern.search(cmdline.rstrip(b"\0").replace(b"\0", b" ").decode("utf-8", "replace")))
+
+    def _uptime_ticks(self) -> float:
+        """Tiempo desde el arranque del sistema, en ticks (unidad del instante de arranque)"""
+        try:
+            with open(f"{self.proc_root}/uptime", "rb") as f:
+                return float(f.read().split()[0]) * os.sysconf("SC_CLK_TCK")
+        except (OSError, ValueError, IndexError):
+            return float("inf")  # Sin uptime, ningún proceso se considera reciente
+
+    def _start_time(self, pid: int) -> Optional[int]:
+        """Instante de arranque (campo 22 de /proc/<pid>/stat), None si el proceso no existe"""
+        try:
+            with open(f"{self.proc_root}/{pid}/stat", "rb") as f:
+                stat = f.read()
+        except OSError:
+            return None
+        # El nombre del proceso (campo 2) puede contener espacios y paréntesis
+        return int(stat[stat.rindex(b")") + 2:].split()[19])
+
+    # ========== SEÑALES ==========
+
+    def freeze(self) -> SignalResult:
+        """Detiene (SIGSTOP) todos los procesos de CAELION salvo ÆON"""
+        return self.signal_all(signal.SIGSTOP)
+
+    def thaw(self) -> SignalResult:
+        """Reanuda (SIGCONT) los procesos de CAELION"""
+        return self.signal_all(signal.SIGCONT)
+
+    def signal_all(self, sig: int) -> SignalResult:
+        """
+        Envía una señal a todos los procesos de CAELION salvo ÆON.
+
+        Primero a los grupos supervisados (los hijos que se creen heredan el
+        grupo), después a cada proceso descubierto; se repite el escaneo hasta
+        que no aparecen procesos nuevos o se agotan las rondas.
+
+        Returns:
+            SignalResult: PIDs y grupos señalizados, rondas y latencia
+        """
+        result = SignalResult(signal_name=signal.Signals(sig).name)
+        start = time.perf_counter()
+
+        with self._lock:
+            for pid, pgid in list(self._groups.items()):
+                if pgid in (self.own_pgid, 0) or pgid in result.signalled_groups:
+                    continue
+                try:
+                    os.killpg(pgid, sig)
+                    result.signalled_groups.append(pgid)
+                except ProcessLookupError:
+                    self._groups.pop(pid, None)
+                except OSError as e:
+                    result.errors.append(f"killpg({pgid}): {e}")
+
+            pending = list(self._matched)
+            self._scan(recheck=False)
+            pending.extend(pid for pid in self._matched if pid not in pending)
+            signalled: Set[int] = set()
+            while pending and result.rounds < self.max_rounds:
+                result.rounds += 1
+                for pid in pending:
+                    self._signal_pid(pid, sig, result)
+                    signalled.add(pid)
+                pending = [pid for pid in self._scan(recheck=False) if pid not in signalled]
+
+        result.latency_ms = (time.perf_counter() - start) * 1000
+        self.last_result = result
+        return result
+
+    def _signal_pid(self, pid: int, sig: int, result: SignalResult):
+        expected = self._matched.get(pid)
+        # Un PID cuyo instante de arranque cambió fue reutilizado por otro proceso
+        if expected is None or self._start_time(pid) != expected:
+            self._matched.pop(pid, None)
+            return
+        try:
+            os.kill(pid, sig)
+            result.signalled_pids.append(pid)
+        except ProcessLookupError:
+            self._matched.pop(pid, None)
+        except OSError as e:
+            result.errors.append(f"kill({pid}): {e}")
+
+    def __len__(self) -> int:
+        return len(self._matched)
@@ -0,0 +1,398 @@
+#!/usr/bin/env python3
+"""
+Sumidero de Reportes - Envío Asíncrono y por Lotes de Reportes de ÆON
+
+Este módulo implementa el envío de reportes de incidentes de ÆON,
+responsable de:
+1. Encolar los reportes sin bloquear la respuesta a violaciones.
+2. Enviarlos por lotes desde un hilo de fondo a un transporte intercambiable:
+   archivos JSON lines de solo anexado o el endpoint seguro (HTTP).
+3. Aplicar una política de contrapresión cuando la cola está llena.
+4. Garantizar la entrega de los reportes críticos (FINAL_WILL) antes de
+   retornar, con transporte de respaldo si el principal falla.
+
+Incluye un servidor HTTP local (LocalReportServer) que sustituye al
+endpoint seguro en pruebas y benchmarks.
+
+Autor: Manus AI (bajo DOS-03)
+Fecha: 26 de enero de 2026
+"""
+
+import json
+import os
+import threading
+import time
+import urllib.request
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Deque, Dict, List, Optional, Tuple
+import logging
+
+logger = logging.getLogger(__name__)
+
+BACKPRESSURE_POLICIES = ("block", "drop_oldest", "drop_newest")
+
+
+def encode_batch(batch: List[Dict]) -> bytes:
+    """Codifica un lote como JSON lines compacto"""
+    return b"".join(
+        json.dumps(report, separators=(",", ":"), sort_keys=True, default=str).encode("utf-8") + b"\n"
+        for report in batch
+    )
+
+
+# ========== TRANSPORTES ==========
+
+class ReportTransport:
+    """Destino de los reportes; `send` lanza una excepción si el lote no se entregó"""
+
+    name = "transport"
+
+    def send(self, batch: List[Dict]):
+        raise NotImplementedError
+
+    def close(self):
+        pass
+
+
+class FileTransport(ReportTransport):
+    """
+    Archivos JSON lines de solo anexado, con rotación por tamaño.
+
+    Cada lote se escribe con una única llamada a write y, opcionalmente, fsync.
+    """
+
+    name = "file"
+
+    def __init__(self, directory: str, prefix: str = "aeon_reports",
+                 max_bytes: int = 64 * 1024 * 1024, fsync: bool = True):
+        """
+        Args:
+            directory: Directorio de los archivos de reportes
+            prefix: Prefijo de los archivos (<prefix>-<n>.jsonl)
+            max_bytes: Tamaño a partir del cual se pasa al siguiente archivo
+            fsync: Forzar a disco cada lote
+        """
+        self.directory = directory
+        self.prefix = prefix
+        self.max_bytes = max_bytes
+        self.fsync = fsync
+        self._file = None
+        self._index = 0
+        self.path: Optional[str] = None
+
+    def _open(self):
+        os.makedirs(self.directory, exist_ok=True)
+        existing = sorted(
+            name for name in os.listdir(self.directory)
+            if name.startswith(f"{self.prefix}-") and name.endswith(".jsonl")
+        )
+        if existing:
+            self._index = int(existing[-1][len(self.prefix) + 1:-len(".jsonl")])
+        self._open_index(self._index)
+
+    def _open_index(self, index: int):
+        self._index = index
+        self.path = os.path.join(self.directory, f"{self.prefix}-{index:08d}.jsonl")
+        self._file = open(self.path, "ab")
+
+    def send(self, batch: List[Dict]):
+        if self._file is None:
+            self._open()
+        self._file.write(encode_batch(batch))
+        self._file.flush()
+        if self.fsync:
+            os.fsync(self._file.fileno())
+        if self._file.tell() >= self.max_bytes:
+            self._file.close()
+            self._open_index(self._index + 1)
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+class HttpTransport(ReportTransport):
+    """Envío de cada lote al endpoint seguro como POST application/x-ndjson"""
+
+    name = "http"
+
+    def __init__(self, endpoint: str, timeout: float = 5.0, headers: Optional[Dict[str, str]] = None):
+        """
+        Args:
+            endpoint: URL del endpoint seguro
+            timeout: Tiempo máximo por petición
+            headers: Cabeceras adicionales (p. ej. autenticación)
+        """
+        self.endpoint = endpoint
+        self.timeout = timeout
+        self.headers = {"Content-Type": "application/x-ndjson", **(headers or {})}
+
+    def send(self, batch: List[Dict]):
+        request = urllib.request.Request(self.endpoint, data=encode_batch(batch),
+                                         headers=self.headers, method="POST")
+        with urllib.request.urlopen(request, timeout=self.timeout) as response:
+            if not 200 <= response.status < 300:
+                raise OSError(f"Report endpoint returned HTTP {response.status}")
+
+
+class LocalReportServer:
+    """
+    Servidor HTTP local que sustituye al endpoint seguro en pruebas.
+
+    Acepta lotes JSON lines por POST y guarda los reportes recibidos en memoria.
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, fail_requests: int = 0):
+        """
+        Args:
+            host: Dirección de escucha
+            port: Puerto (0 = libre)
+            fail_requests: Número de peticiones iniciales respondidas con HTTP 503
+        """
+        self.reports: List[Dict] = []
+        self.requests = 0
+        self.fail_requests = fail_requests
+        self._lock = threading.Lock()
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+                with server._lock:
+                    server.requests += 1
+                    failing = server.requests <= server.fail_requests
+                    if not failing:
+                        server.reports.extend(json.loads(line) for line in body.splitlines() if line)
+                self.send_response(503 if failing else 204)
+                self.end_headers()
+
+            def log_message(self, format, *args):
+                pass
+
+        self._httpd = ThreadingHTTPServer((host, port), Handler)
+        self._thread = threading.Thread(target=self._httpd.serve_forever, name="local-report-server",
+                                        daemon=True)
+
+    @property
+    def endpoint(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}/reports"
+
+    def start(self) -> "LocalReportServer":
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+# ========== SUMIDERO ==========
+
+class ReportSink:
+    """
+    Cola de reportes con escritor de fondo y envío por lotes.
+
+    `submit` solo encola; el hilo de fondo agrupa hasta `batch_size` reportes
+    (esperando como mucho `flush_interval_ms` a que se acumulen) y los envía
+    al transporte. Si el envío falla, se reintenta con espera exponencial y,
+    agotados los reintentos, el lote va al transporte de respaldo.
+
+    Con la cola llena se aplica la política de contrapresión: "block" (esperar
+    hasta `block_timeout` y descartar si no hay espacio), "drop_oldest" o
+    "drop_newest". Los reportes críticos nunca se descartan.
+    """
+
+    def __init__(self,
+                 transport: ReportTransport,
+                 fallback: Optional[ReportTransport] = None,
+                 max_queue: int = 1000,
+                 batch_size: int = 100,
+                 flush_interval_ms: float = 50.0,
+                 backpressure: str = "block",
+                 block_timeout: float = 1.0,
+                 max_retries: int = 3,
+                 retry_backoff: float = 0.1):
+        """
+        Args:
+            transport: Transporte principal
+            fallback: Transporte para los lotes que el principal no pudo entregar
+            max_queue: Reportes pendientes admitidos antes de aplicar contrapresión
+            batch_size: Reportes máximos por envío
+            flush_interval_ms: Espera máxima para acumular un lote
+            backpressure: "block", "drop_oldest" o "drop_newest"
+            block_timeout: Espera máxima de submit con la política "block"
+            max_retries: Reintentos del transporte principal por lote
+            retry_backoff: Espera inicial entre reintentos (se duplica en cada uno)
+        """
+        if backpressure not in BACKPRESSURE_POLICIES:
+            raise ValueError(f"Unknown backpressure policy: {backpressure}")
+
+        self.transport = transport
+        self.fallback = fallback
+        self.max_queue = max_queue
+        self.batch_size = batch_size
+        self.flush_interval_seconds = flush_interval_ms / 1000.0
+        self.backpressure = backpressure
+        self.block_timeout = block_timeout
+        self.max_retries = max_retries
+        self.retry_backoff = retry_backoff
+
+        self._queue: Deque[Tuple[bool, Dict]] = deque()  # (crítico, sobre del reporte)
+        self._condition = threading.Condition()
+        self._enqueued = 0
+        self._completed = 0   # Reportes entregados, descartados o fallidos tras salir de la cola
+        self._flush_waiters = 0
+        self._closed = False
+        self.stats = {"submitted": 0, "delivered": 0, "fallback": 0, "dropped": 0, "failed": 0, "batches": 0}
+
+        self._thread = threading.Thread(target=self._run, name="aeon-report-sink", daemon=True)
+        self._thread.start()
+
+    def submit(self, report: Dict, report_type: str, critical: bool = False) -> bool:
+        """
+        Encola un reporte.
+
+        Args:
+            report: Contenido del reporte
+            report_type: Tipo de reporte (p. ej. "RESET_INCIDENT", "FINAL_WILL")
+            critical: Nunca descartar el reporte por contrapresión
+
+        Returns:
+            bool: True si el reporte quedó encolado
+        """
+        envelope = {"report_type": report_type, "submitted_at": time.time(), "report": report}
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("Report sink is closed")
+
+            if not critical and len(self._queue) >= self.max_queue:
+                if self.backpressure == "block":
+                    self._condition.wait_for(lambda: len(self._queue) < self.max_queue or self._closed,
+                                             self.block_timeout)
+                elif self.backpressure == "drop_oldest":
+                    self._drop_oldest()
+
+                if len(self._queue) >= self.max_queue:
+                    self.stats["dropped"] += 1
+                    logger.error(f"Report queue full, dropping {report_type} report")
+                    return False
+
+            self._queue.append((critical, envelope))
+            self._enqueued += 1
+            self.stats["submitted"] += 1
+            self._condition.notify_all()
+        return True
+
+    def _drop_oldest(self):
+        for index, (critical, envelope) in enumerate(self._queue):
+            if not critical:
+                del self._queue[index]
+                self._completed += 1
+                self.stats["dropped"] += 1
+                logger.error(f"Report queue full, dropping oldest {envelope['report_type']} report")
+                return
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Espera a que se procesen todos los reportes encolados hasta ahora.
+
+        Returns:
+            bool: True si se completó antes del timeout
+        """
+        with self._condition:
+            target = self._enqueued
+            self._flush_waiters += 1
+            self._condition.notify_all()
+            try:
+                return self._condition.wait_for(lambda: self._completed >= target, timeout)
+            finally:
+                self._flush_waiters -= 1
+
+    def deliver(self, report: Dict, report_type: str, timeout: Optional[float] = None) -> bool:
+        """
+        Encola un reporte crítico y espera a que se haya entregado.
+
+        Returns:
+            bool: True si el reporte se entregó (por el transporte principal o el de respaldo)
+        """
+        with self._condition:
+            failed_before = self.stats["failed"]
+        self.submit(report, report_type, critical=True)
+        if not self.flush(timeout):
+            return False
+        with self._condition:
+            return self.stats["failed"] == failed_before
+
+    def close(self, timeout: Optional[float] = None):
+        """Entrega los reportes pendientes y detiene el escritor"""
+        with self._condition:
+            if self._closed:
+                return
+            self._closed = True
+            self._condition.notify_all()
+        self._thread.join(timeout)
+        self.transport.close()
+        if self.fallback is not None:
+            self.fallback.close()
+
+    def __len__(self) -> int:
+        return len(self._queue)
+
+    def _run(self):
+        while True:
+            with self._condition:
+                while not self._queue and not self._closed:
+                    self._condition.wait()
+                if not self._queue and self._closed:
+                    return
+
+                # Ventana para acumular un lote (salvo cierre, flush pendiente o lote completo)
+                deadline = time.monotonic() + self.flush_interval_seconds
+                while len(self._queue) < self.batch_size and not self._closed and not self._flush_waiters:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._condition.wait(remaining)
+
+                batch = [self._queue.popleft()[1] for _ in range(min(self.batch_size, len(self._queue)))]
+                self._condition.notify_all()
+
+            outcome = self._send(batch)
+
+            with self._condition:
+                self.stats[outcome] += len(batch)
+                self.stats["batches"] += 1
+                self._completed += len(batch)
+                self._condition.notify_all()
+
+    def _send(self, batch: List[Dict]) -> str:
+        delay = self.retry_backoff
+        for attempt in range(self.max_retries + 1):
+            try:
+                self.transport.send(batch)
+                return "delivered"
+            except Exception as e:
+                logger.warning(f"Report transport {self.transport.name} failed "
+                               f"(attempt {attempt + 1}): {e}")
+                if attempt < self.max_retries:
+                    time.sleep(delay)
+                    delay *= 2
+
+        if self.fallback is not None:
+            try:
+                self.fallback.send(batch)
+                logger.error(f"{len(batch)} reports written to fallback transport {self.fallback.name}")
+                return "fallback"
+            except Exception as e:
+                logger.error(f"Report fallback transport {self.fallback.name} failed: {e}")
+        logger.critical(f"{len(batch)} reports could not be delivered")
+        return "failed"
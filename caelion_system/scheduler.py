@@ -0,0 +1,302 @@
+#!/usr/bin/env python3
+"""
+Planificador Periódico - Bucle de Eventos Compartido por los Supervisores de CAELION
+
+Este módulo implementa el planificador de tareas periódicas usado por ÆON,
+ARGOS y LIANG, responsable de:
+1. Ejecutar cada verificación registrada a tasa fija (sin deriva: el
+   siguiente disparo se calcula desde el anterior, no desde el fin de la
+   ejecución), con fluctuación aleatoria opcional.
+2. Alojar las tareas de varios módulos en un único bucle asyncio, ejecutando
+   las funciones bloqueantes en un pool de hilos.
+3. Contabilizar por tarea ejecuciones, duración, retraso, plazos incumplidos,
+   disparos perdidos por solapamiento y errores.
+4. Detenerse de forma limpia desde cualquier hilo o ante SIGINT/SIGTERM.
+
+Autor: Manus AI (bajo DOS-03)
+Fecha: 26 de enero de 2026
+"""
+
+import asyncio
+import random
+import signal
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable, Dict, List, Optional, Union
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class TaskStats:
+    """Contabilidad de ejecución de una tarea periódica"""
+    runs: int = 0
+    errors: int = 0
+    overruns: int = 0            # Disparos omitidos porque la ejecución anterior no había terminado
+    deadline_misses: int = 0     # Ejecuciones que superaron su plazo
+    last_duration: float = 0.0
+    max_duration: float = 0.0
+    total_duration: float = 0.0
+    last_lateness: float = 0.0   # Retraso del inicio respecto al disparo previsto (sin la fluctuación)
+    max_lateness: float = 0.0
+    last_error: Optional[str] = None
+
+    def to_dict(self) -> Dict:
+        return {
+            "runs": self.runs,
+            "errors": self.errors,
+            "overruns": self.overruns,
+            "deadline_misses": self.deadline_misses,
+            "last_duration_ms": round(self.last_duration * 1000, 3),
+            "max_duration_ms": round(self.max_duration * 1000, 3),
+            "mean_duration_ms": round(self.total_duration / self.runs * 1000, 3) if self.runs else 0.0,
+            "last_lateness_ms": round(self.last_lateness * 1000, 3),
+            "max_lateness_ms": round(self.max_lateness * 1000, 3),
+            "last_error": self.last_error
+        }
+
+
+@dataclass
+class ScheduledTask:
+    """Tarea periódica registrada en el planificador"""
+    name: str
+    function: Callable[[], Union[None, Awaitable[None]]]
+    period: float
+    jitter: float = 0.0
+    deadline: Optional[float] = None
+    initial_delay: float = 0.0
+    stats: TaskStats = field(default_factory=TaskStats)
+    _runner: Optional[asyncio.Task] = field(default=None, repr=False)
+
+
+class PeriodicScheduler:
+    """
+    Planificador de tareas periódicas sobre un bucle asyncio.
+
+    Cada tarea tiene su propio periodo y se dispara en los instantes
+    `inicio + k * periodo` (más una fluctuación aleatoria en [0, jitter)). Una
+    tarea nunca se solapa consigo misma: si una ejecución dura más que el
+    periodo, los disparos perdidos se cuentan como overruns y la siguiente
+    ejecución se alinea con el próximo disparo futuro, sin ráfagas de
+    recuperación. Las funciones síncronas se ejecutan en el pool de hilos del
+    planificador; las corrutinas, en el propio bucle.
+    """
+
+    def __init__(self, max_workers: int = 4, handle_signals: bool = True):
+        """
+        Args:
+            max_workers: Hilos para las funciones bloqueantes (tareas simultáneas)
+            handle_signals: Detenerse ante SIGINT/SIGTERM si run() se ejecuta
+                en el hilo principal
+        """
+        self.max_workers = max_workers
+        self.handle_signals = handle_signals
+        self.tasks: Dict[str, ScheduledTask] = {}
+
+        self._lock = threading.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._stop_event: Optional[asyncio.Event] = None
+        self._stop_requested = False
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._thread: Optional[threading.Thread] = None
+
+    # ========== REGISTRO DE TAREAS ==========
+
+    def add_task(self,
+                 name: str,
+                 function: Callable[[], Union[None, Awaitable[None]]],
+                 period: float,
+                 jitter: float = 0.0,
+                 deadline: Optional[float] = None,
+                 initial_delay: float = 0.0) -> ScheduledTask:
+        """
+        Registra una tarea periódica (también con el planificador en marcha).
+
+        Args:
+            name: Nombre único de la tarea
+            function: Función sin argumentos (síncrona o corrutina)
+            period: Periodo en segundos
+            jitter: Fluctuación aleatoria máxima añadida a cada disparo
+            deadline: Duración máxima esperada de una ejecución (por defecto, el periodo)
+            initial_delay: Retraso del primer disparo
+
+        Returns:
+            ScheduledTask: Tarea registrada
+        """
+        if period <= 0:
+            raise ValueError(f"Task period must be positive: {period}")
+        if not 0 <= jitter < period:
+            raise ValueError(f"Task jitter must be in [0, period): {jitter}")
+
+        task = ScheduledTask(name=name, function=function, period=period, jitter=jitter,
+                             deadline=deadline if deadline is not None else period,
+                             initial_delay=initial_delay)
+        with self._lock:
+            if name in self.tasks:
+                raise ValueError(f"Task already scheduled: {name}")
+            self.tasks[name] = task
+            loop = self._loop
+        if loop is not None:
+            loop.call_soon_threadsafe(self._launch, task)
+        logger.debug(f"Task scheduled: {name} every {period}s")
+        return task
+
+    def remove_task(self, name: str) -> bool:
+        """
+        Cancela una tarea. Una ejecución en curso en el pool de hilos termina
+        normalmente, pero no se vuelve a disparar.
+
+        Returns:
+            bool: True si la tarea existía
+        """
+        with self._lock:
+            task = self.tasks.pop(name, None)
+            loop = self._loop
+        if task is None:
+            return False
+        if loop is not None and task._runner is not None:
+            loop.call_soon_threadsafe(task._runner.cancel)
+        return True
+
+    def stats(self) -> Dict[str, Dict]:
+        """Contabilidad de todas las tareas registradas"""
+        with self._lock:
+            return {name: task.stats.to_dict() for name, task in self.tasks.items()}
+
+    # ========== EJECUCIÓN ==========
+
+    def run(self):
+        """Ejecuta el planificador en el hilo actual hasta que se llame a stop()"""
+        asyncio.run(self._main())
+
+    def start(self) -> threading.Thread:
+        """Ejecuta el planificador en un hilo en segundo plano"""
+        self._thread = threading.Thread(target=self.run, name="caelion-scheduler", daemon=True)
+        self._thread.start()
+        return self._thread
+
+    def stop(self, timeout: Optional[float] = None):
+        """
+        Detiene el planificador desde cualquier hilo. Las ejecuciones en curso
+        terminan antes de que run() retorne.
+
+        Args:
+            timeout: Espera máxima al hilo de start() (None = esperar sin límite)
+        """
+        with self._lock:
+            self._stop_requested = True
+            loop, stop_event = self._loop, self._stop_event
+        if loop is not None and not loop.is_closed():
+            try:
+                loop.call_soon_threadsafe(stop_event.set)
+            except RuntimeError:
+                pass  # El bucle terminó entretanto
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join(timeout)
+
+    @property
+    def running(self) -> bool:
+        return self._loop is not None
+
+    async def _main(self):
+        loop = asyncio.get_running_loop()
+        self._executor = ThreadPoolExecutor(max_workers=self.max_workers,
+                                            thread_name_prefix="caelion-task")
+        self._stop_event = asyncio.Event()
+        signals = self._install_signal_handlers(loop)
+        with self._lock:
+            self._loop = loop
+            if self._stop_requested:
+                self._stop_event.set()
+            tasks = list(self.tasks.values())
+        for task in tasks:
+            self._launch(task)
+        logger.info(f"Scheduler started with {len(tasks)} tasks")
+
+        try:
+            await self._stop_event.wait()
+        finally:
+            with self._lock:
+                self._loop = None
+                self._stop_requested = False
+                runners = [task._runner for task in self.tasks.values() if task._runner is not None]
+            for runner in runners:
+                runner.cancel()
+            await asyncio.gather(*runners, return_exceptions=True)
+            for sig in signals:
+                loop.remove_signal_handler(sig)
+            # Esperar a las funciones bloqueantes en curso
+            await loop.run_in_executor(None, self._executor.shutdown, True)
+            self._executor = None
+            logger.info("Scheduler stopped")
+
+    def _install_signal_handlers(self, loop: asyncio.AbstractEventLoop) -> List[int]:
+        if not self.handle_signals or threading.current_thread() is not threading.main_thread():
+            return []
+        installed = []
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            try:
+                loop.add_signal_handler(sig, self._on_signal, sig)
+                installed.append(sig)
+            except (NotImplementedError, RuntimeError):
+                pass
+        return installed
+
+    def _on_signal(self, sig: int):
+        logger.info(f"Received {signal.Signals(sig).name}, stopping scheduler")
+        self._stop_event.set()
+
+    def _launch(self, task: ScheduledTask):
+        if self.tasks.get(task.name) is task and task._runner is None:
+            task._runner = asyncio.get_running_loop().create_task(self._run_task(task),
+                                                                  name=task.name)
+
+    async def _run_task(self, task: ScheduledTask):
+        loop = asyncio.get_running_loop()
+        is_coroutine = asyncio.iscoroutinefunction(task.function)
+        stats = task.stats
+        next_fire = loop.time() + task.initial_delay
+
+        try:
+            while True:
+                offset = random.uniform(0, task.jitter) if task.jitter else 0.0
+                delay = next_fire + offset - loop.time()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+
+                started = loop.time()
+                try:
+                    if is_coroutine:
+                        await task.function()
+                    else:
+                        await loop.run_in_executor(self._executor, task.function)
+                except asyncio.CancelledError:
+                    raise
+                except Exception as e:
+                    stats.errors += 1
+                    stats.last_error = f"{type(e).__name__}: {e}"
+                    logger.error(f"Task {task.name} failed: {e}")
+                finished = loop.time()
+
+                duration = finished - started
+                stats.runs += 1
+                stats.last_duration = duration
+                stats.max_duration = max(stats.max_duration, duration)
+                stats.total_duration += duration
+                stats.last_lateness = max(0.0, started - next_fire - offset)
+                stats.max_lateness = max(stats.max_lateness, stats.last_lateness)
+                if duration > task.deadline:
+                    stats.deadline_misses += 1
+                    logger.warning(f"Task {task.name} exceeded its deadline "
+                                   f"({duration:.3f}s > {task.deadline:.3f}s)")
+
+                next_fire += task.period
+                if finished > next_fire:
+                    # Disparos perdidos mientras la ejecución seguía en curso
+                    missed = int((finished - next_fire) // task.period) + 1
+                    stats.overruns += missed
+                    next_fire += missed * task.period
+        finally:
+            task._runner = None
@@ -0,0 +1,503 @@
+#!/usr/bin/env python3
+"""
+Gestor de Snapshots - Estados Seguros Direccionados por Contenido para ÆON
+
+Este módulo implementa el almacén de snapshots usado en el rollback de ÆON,
+responsable de:
+1. Guardar el contenido de cada archivo una sola vez, bajo su SHA-256
+   (objects/), de modo que cada snapshot solo escribe lo que cambió.
+2. Describir cada snapshot con un manifiesto (manifests/) y registrar su
+   creación y verificación en un índice de solo anexado (index.jsonl).
+3. Mantener punteros atómicos LATEST y LATEST_SAFE, para localizar y
+   verificar el último estado seguro en tiempo constante.
+4. Verificar, restaurar y podar snapshots.
+
+Estructura del directorio raíz:
+    objects/ab/cdef...     Contenido de archivos (SHA-256)
+    manifests/<id>.json    Manifiesto de cada snapshot
+    index.jsonl            Eventos de creación, verificación y marcado seguro
+    LATEST, LATEST_SAFE    Punteros {snapshot_id, manifest_hash, created_at}
+
+Autor: Manus AI (bajo DOS-03)
+Fecha: 26 de enero de 2026
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from dataclasses import asdict, dataclass, field
+from typing import Dict, Iterable, List, Optional, Tuple
+import logging
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_VERSION = 1
+LATEST_POINTER = "LATEST"
+LATEST_SAFE_POINTER = "LATEST_SAFE"
+INDEX_FILE = "index.jsonl"
+
+
+@dataclass
+class SnapshotEntry:
+    """Archivo incluido en un snapshot"""
+    path: str
+    object_hash: str
+    size: int
+    mode: int
+    stat_signature: Tuple[int, int, int, int]  # (inode, tamaño, mtime_ns, ctime_ns) al capturarlo
+
+
+@dataclass
+class SnapshotInfo:
+    """Resumen de un snapshot"""
+    snapshot_id: str
+    created_at: float
+    manifest_hash: str
+    file_count: int
+    total_bytes: int
+    new_objects: int = 0      # Objetos escritos por este snapshot (el resto se reutiliza)
+    label: Optional[str] = None
+    verified: bool = False
+    safe: bool = False
+    entries: List[SnapshotEntry] = field(default_factory=list, repr=False)
+
+
+class SnapshotIntegrityError(Exception):
+    """Un manifiesto u objeto no coincide con su hash"""
+
+
+class SnapshotManager:
+    """
+    Almacén de snapshots incrementales direccionados por contenido.
+
+    Un archivo cuya firma de stat coincide con la del snapshot anterior no se
+    vuelve a leer: se reutiliza su objeto. Los archivos modificados se copian
+    calculando su hash al vuelo y solo se guardan si el objeto no existe.
+    Los directorios se crean en la primera escritura, de modo que instanciar
+    el gestor nunca falla aunque la raíz no exista todavía.
+    """
+
+    def __init__(self, root: str, buffer_size: int = 1024 * 1024):
+        """
+        Args:
+            root: Directorio raíz de los snapshots
+            buffer_size: Tamaño de las lecturas al copiar y verificar archivos
+        """
+        self.root = root
+        self.buffer_size = buffer_size
+        self.objects_dir = os.path.join(root, "objects")
+        self.manifests_dir = os.path.join(root, "manifests")
+        self._lock = threading.Lock()
+
+    # ========== CREACIÓN ==========
+
+    def create_snapshot(self, paths: Iterable[str], label: Optional[str] = None,
+                        mark_safe: bool = False) -> SnapshotInfo:
+        """
+        Crea un snapshot de los archivos indicados.
+
+        Args:
+            paths: Archivos a incluir
+            label: Etiqueta descriptiva
+            mark_safe: Verificar el snapshot y marcarlo como último estado seguro
+
+        Returns:
+            SnapshotInfo: Snapshot creado
+        """
+        with self._lock:
+            os.makedirs(self.objects_dir, exist_ok=True)
+            os.makedirs(self.manifests_dir, exist_ok=True)
+
+            parent = self._read_pointer(LATEST_POINTER)
+            previous: Dict[str, SnapshotEntry] = {}
+            if parent is not None:
+                try:
+                    previous = {entry.path: entry for entry in self._load_manifest(parent).entries}
+                except (OSError, ValueError, SnapshotIntegrityError) as e:
+                    logger.warning(f"Ignoring unreadable parent snapshot {parent['snapshot_id']}: {e}")
+
+            entries = []
+            new_objects = 0
+            for path in sorted(set(os.path.abspath(p) for p in paths)):
+                st = os.stat(path)
+                signature = (st.st_ino, st.st_size, st.st_mtime_ns, st.st_ctime_ns)
+                known = previous.get(path)
+                if known is not None and tuple(known.stat_signature) == signature \
+                        and os.path.exists(self._object_path(known.object_hash)):
+                    object_hash = known.object_hash
+                else:
+                    object_hash, written = self._store_object(path)
+                    new_objects += written
+                entries.append(SnapshotEntry(path, object_hash, st.st_size, st.st_mode & 0o7777, signature))
+
+            created_at = time.time()
+            snapshot_id = self._new_snapshot_id()
+            manifest = {
+                "version": MANIFEST_VERSION,
+                "snapshot_id": snapshot_id,
+                "created_at": created_at,
+                "label": label,
+                "parent": parent["snapshot_id"] if parent else None,
+                "files": [asdict(entry) for entry in entries]
+            }
+            data = json.dumps(manifest, sort_keys=True, separators=(",", ":")).encode("utf-8")
+            manifest_hash = hashlib.sha256(data).hexdigest()
+            self._atomic_write(self._manifest_path(snapshot_id), data)
+
+            info = SnapshotInfo(
+                snapshot_id=snapshot_id,
+                created_at=created_at,
+                manifest_hash=manifest_hash,
+                file_count=len(entries),
+                total_bytes=sum(entry.size for entry in entries),
+                new_objects=new_objects,
+                label=label,
+                entries=entries
+            )
+            self._append_index("created", info)
+            self._write_pointer(LATEST_POINTER, info)
+
+        logger.info(f"Snapshot {snapshot_id} created: {info.file_count} files, {new_objects} new objects")
+        if mark_safe:
+            info.verified = info.safe = self.mark_safe(snapshot_id)
+        return info
+
+    def _new_snapshot_id(self) -> str:
+        while True:
+            snapshot_id = f"snapshot_{time.time_ns():020d}"
+            if not os.path.exists(self._manifest_path(snapshot_id)):
+                return snapshot_id
+
+    def _store_object(self, path: str) -> Tuple[str, int]:
+        """
+        Copia un archivo al almacén calculando su hash al vuelo.
+
+        Returns:
+            Tuple[str, int]: (hash del contenido, 1 si se escribió un objeto nuevo)
+        """
+        digest = hashlib.sha256()
+        fd, tmp_path = tempfile.mkstemp(dir=self.objects_dir, prefix=".tmp-")
+        try:
+            with open(path, "rb") as src, os.fdopen(fd, "wb") as dst:
+                while True:
+                    block = src.read(self.buffer_size)
+                    if not block:
+                        break
+                    digest.update(block)
+                    dst.write(block)
+                dst.flush()
+                os.fsync(dst.fileno())
+
+            object_hash = digest.hexdigest()
+            object_path = self._object_path(object_hash)
+            if os.path.exists(object_path):
+                os.remove(tmp_path)
+                return object_hash, 0
+            os.makedirs(os.path.dirname(object_path), exist_ok=True)
+            os.replace(tmp_path, object_path)
+            return object_hash, 1
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    # ========== LOCALIZACIÓN Y VERIFICACIÓN ==========
+
+    def latest(self) -> Optional[SnapshotInfo]:
+        """Último snapshot creado (lectura del puntero LATEST y de su manifiesto)"""
+        return self._resolve_pointer(LATEST_POINTER)
+
+    def latest_safe(self) -> Optional[SnapshotInfo]:
+        """
+        Último snapshot marcado como seguro, en tiempo constante.
+
+        El puntero LATEST_SAFE identifica el manifiesto y su hash; el manifiesto
+        se comprueba contra ese hash, de modo que un manifiesto alterado no se
+        acepta como estado seguro.
+
+        Returns:
+            Optional[SnapshotInfo]: Snapshot seguro, o None si no hay ninguno válido
+        """
+        return self._resolve_pointer(LATEST_SAFE_POINTER, safe=True)
+
+    def _resolve_pointer(self, name: str, safe: bool = False) -> Optional[SnapshotInfo]:
+        pointer = self._read_pointer(name)
+        if pointer is None:
+            return None
+        try:
+            info = self._load_manifest(pointer)
+        except (OSError, ValueError, SnapshotIntegrityError) as e:
+            logger.error(f"Snapshot pointer {name} is invalid: {e}")
+            return None
+        info.verified = info.safe = safe
+        return info
+
+    def load(self, snapshot_id: str) -> SnapshotInfo:
+        """Carga un snapshot por su identificador (sin hash esperado del manifiesto)"""
+        return self._load_manifest({"snapshot_id": snapshot_id})
+
+    def verify_snapshot(self, snapshot_id: str) -> bool:
+        """
+        Verifica en profundidad un snapshot: re-calcula el hash de cada objeto.
+
+        Returns:
+            bool: True si todos los objetos existen y coinciden con su hash
+        """
+        try:
+            info = self.load(snapshot_id)
+            for object_hash in {entry.object_hash for entry in info.entries}:
+                if self._hash_file(self._object_path(object_hash)) != object_hash:
+                    raise SnapshotIntegrityError(f"Object {object_hash} is corrupted")
+        except (OSError, ValueError, SnapshotIntegrityError) as e:
+            logger.error(f"Snapshot {snapshot_id} failed verification: {e}")
+            return False
+
+        with self._lock:
+            self._append_index("verified", info)
+        return True
+
+    def mark_safe(self, snapshot_id: str) -> bool:
+        """
+        Verifica un snapshot y lo marca como último estado seguro.
+
+        Returns:
+            bool: True si el snapshot se verificó y se marcó
+        """
+        if not self.verify_snapshot(snapshot_id):
+            return False
+        info = self.load(snapshot_id)
+        info.verified = info.safe = True
+        with self._lock:
+            self._append_index("safe", info)
+            self._write_pointer(LATEST_SAFE_POINTER, info)
+        logger.info(f"Snapshot {snapshot_id} marked as latest safe state")
+        return True
+
+    # ========== RESTAURACIÓN ==========
+
+    def restore(self, snapshot_id: str, target_root: Optional[str] = None) -> int:
+        """
+        Restaura los archivos de un snapshot.
+
+        Cada archivo se escribe en un temporal y se renombra, verificando el
+        hash del objeto durante la copia.
+
+        Args:
+            snapshot_id: Snapshot a restaurar
+            target_root: Directorio bajo el que restaurar (por defecto, las rutas originales)
+
+        Returns:
+            int: Número de archivos restaurados
+        """
+        info = self.load(snapshot_id)
+        for entry in info.entries:
+            target = entry.path
+            if target_root is not None:
+                target = os.path.join(target_root, entry.path.lstrip(os.sep))
+            os.makedirs(os.path.dirname(target), exist_ok=True)
+
+            digest = hashlib.sha256()
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(target), prefix=".restore-")
+            try:
+                with open(self._object_path(entry.object_hash), "rb") as src, os.fdopen(fd, "wb") as dst:
+                    while True:
+                        block = src.read(self.buffer_size)
+                        if not block:
+                            break
+                        digest.update(block)
+                        dst.write(block)
+                    dst.flush()
+                    os.fsync(dst.fileno())
+                if digest.hexdigest() != entry.object_hash:
+                    raise SnapshotIntegrityError(f"Object {entry.object_hash} is corrupted")
+                os.chmod(tmp_path, entry.mode)
+                os.replace(tmp_path, target)
+            except BaseException:
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+                raise
+
+        logger.info(f"Snapshot {snapshot_id} restored: {len(info.entries)} files")
+        return len(info.entries)
+
+    # ========== ÍNDICE Y PODA ==========
+
+    def list_snapshots(self) -> List[SnapshotInfo]:
+        """Snapshots registrados en el índice, del más antiguo al más reciente"""
+        snapshots: Dict[str, SnapshotInfo] = {}
+        for event in self._read_index():
+            info = snapshots.get(event["snapshot_id"])
+            if info is None:
+                info = SnapshotInfo(
+                    snapshot_id=event["snapshot_id"],
+                    created_at=event["created_at"],
+                    manifest_hash=event["manifest_hash"],
+                    file_count=event["file_count"],
+                    total_bytes=event["total_bytes"],
+                    new_objects=event.get("new_objects", 0),
+                    label=event.get("label")
+                )
+                snapshots[info.snapshot_id] = info
+            if event["event"] in ("verified", "safe"):
+                info.verified = True
+            if event["event"] == "safe":
+                info.safe = True
+        return sorted(snapshots.values(), key=lambda info: info.snapshot_id)
+
+    def prune(self, keep: int) -> int:
+        """
+        Elimina los snapshots más antiguos y los objetos que ya no se usan.
+
+        Se conservan los `keep` más recientes y, siempre, los de LATEST y LATEST_SAFE.
+
+        Returns:
+            int: Número de snapshots eliminados
+        """
+        with self._lock:
+            snapshots = self.list_snapshots()
+            protected = {pointer["snapshot_id"]
+                         for pointer in (self._read_pointer(LATEST_POINTER),
+                                         self._read_pointer(LATEST_SAFE_POINTER))
+                         if pointer is not None}
+            retained = {info.snapshot_id for info in snapshots[-keep:]} if keep > 0 else set()
+            retained |= protected
+            removed = [info.snapshot_id for info in snapshots if info.snapshot_id not in retained]
+
+            for snapshot_id in removed:
+                try:
+                    os.remove(self._manifest_path(snapshot_id))
+                except FileNotFoundError:
+                    pass
+
+            referenced = set()
+            for snapshot_id in retained:
+                try:
+                    referenced.update(entry.object_hash for entry in self.load(snapshot_id).entries)
+                except (OSError, ValueError, SnapshotIntegrityError):
+                    pass
+            for directory, _, names in os.walk(self.objects_dir):
+                for name in names:
+                    object_hash = os.path.basename(directory) + name
+                    if object_hash not in referenced and not name.startswith(".tmp-"):
+                        os.remove(os.path.join(directory, name))
+
+            # Compactar el índice: solo eventos de snapshots retenidos
+            lines = [json.dumps(event, sort_keys=True) + "\n"
+                     for event in self._read_index() if event["snapshot_id"] in retained]
+            self._atomic_write(os.path.join(self.root, INDEX_FILE), "".join(lines).encode("utf-8"))
+
+        if removed:
+            logger.info(f"Pruned {len(removed)} snapshots")
+        return len(removed)
+
+    def _append_index(self, event: str, info: SnapshotInfo):
+        record = {
+            "event": event,
+            "snapshot_id": info.snapshot_id,
+            "created_at": info.created_at,
+            "manifest_hash": info.manifest_hash,
+            "file_count": info.file_count,
+            "total_bytes": info.total_bytes,
+            "new_objects": info.new_objects,
+            "label": info.label,
+            "recorded_at": time.time()
+        }
+        with open(os.path.join(self.root, INDEX_FILE), "a") as f:
+            f.write(json.dumps(record, sort_keys=True) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+
+    def _read_index(self) -> List[Dict]:
+        path = os.path.join(self.root, INDEX_FILE)
+        if not os.path.exists(path):
+            return []
+        events = []
+        with open(path) as f:
+            for line in f:
+                try:
+                    events.append(json.loads(line))
+                except json.JSONDecodeError:
+                    # Línea final incompleta tras una caída
+                    logger.warning(f"Skipping malformed snapshot index line in {path}")
+        return events
+
+    # ========== AUXILIARES ==========
+
+    def _object_path(self, object_hash: str) -> str:
+        return os.path.join(self.objects_dir, object_hash[:2], object_hash[2:])
+
+    def _manifest_path(self, snapshot_id: str) -> str:
+        return os.path.join(self.manifests_dir, f"{snapshot_id}.json")
+
+    def _load_manifest(self, pointer: Dict) -> SnapshotInfo:
+        with open(self._manifest_path(pointer["snapshot_id"]), "rb") as f:
+            data = f.read()
+        manifest_hash = hashlib.sha256(data).hexdigest()
+        expected = pointer.get("manifest_hash")
+        if expected is not None and manifest_hash != expected:
+            raise SnapshotIntegrityError(f"Manifest {pointer['snapshot_id']} does not match its hash")
+
+        manifest = json.loads(data)
+        entries = [SnapshotEntry(**{**entry, "stat_signature": tuple(entry["stat_signature"])})
+                   for entry in manifest["files"]]
+        return SnapshotInfo(
+            snapshot_id=manifest["snapshot_id"],
+            created_at=manifest["created_at"],
+            manifest_hash=manifest_hash,
+            file_count=len(entries),
+            total_bytes=sum(entry.size for entry in entries),
+            label=manifest.get("label"),
+            entries=entries
+        )
+
+    def _hash_file(self, path: str) -> str:
+        digest = hashlib.sha256()
+        with open(path, "rb") as f:
+            while True:
+                block = f.read(self.buffer_size)
+                if not block:
+                    break
+                digest.update(block)
+        return digest.hexdigest()
+
+    def _read_pointer(self, name: str) -> Optional[Dict]:
+        try:
+            with open(os.path.join(self.root, name)) as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.error(f"Unreadable snapshot pointer {name}: {e}")
+            return None
+
+    def _write_pointer(self, name: str, info: SnapshotInfo):
+        pointer = {
+            "snapshot_id": info.snapshot_id,
+            "manifest_hash": info.manifest_hash,
+            "created_at": info.created_at
+        }
+        self._atomic_write(os.path.join(self.root, name), json.dumps(pointer, sort_keys=True).encode("utf-8"))
+
+    def _atomic_write(self, path: str, data: bytes):
+        """Escribe un archivo completo o nada (temporal + fsync + rename)"""
+        directory = os.path.dirname(path)
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        dir_fd = os.open(directory, os.O_RDONLY)
+        try:
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
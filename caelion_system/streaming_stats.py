@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+"""
+Estadísticas en Streaming - Agregados Incrementales de CAELION
+
+Este módulo implementa los agregados incrementales usados por LIANG y ARGOS,
+responsable de:
+1. Contar eventos por categoría con altas y bajas en O(1).
+2. Estimar percentiles con un sketch logarítmico fusionable (error relativo acotado).
+3. Calcular tasas en ventanas deslizantes (1m/5m/1h) con coste amortizado O(1).
+
+Autor: Manus AI (bajo DOS-03)
+Fecha: 26 de enero de 2026
+"""
+
+import math
+import time
+from collections import deque
+from typing import Dict, Iterable, Optional, Tuple
+
+# Ventanas deslizantes por defecto (segundos)
+DEFAULT_WINDOWS: Tuple[int, ...] = (60, 300, 3600)
+
+
+def window_label(seconds: int) -> str:
+    """Etiqueta legible de una ventana (p. ej. 60 -> '1m', 3600 -> '1h')"""
+    if seconds % 3600 == 0:
+        return f"{seconds // 3600}h"
+    if seconds % 60 == 0:
+        return f"{seconds // 60}m"
+    return f"{seconds}s"
+
+
+class CategoryCounter:
+    """
+    Contador por categoría que admite altas y bajas en O(1).
+
+    Las categorías de `fixed` se reportan siempre (aunque valgan 0); el resto
+    desaparece del conteo al llegar a cero.
+    """
+
+    __slots__ = ("counts", "fixed")
+
+    def __init__(self, fixed: Iterable[str] = ()):
+        fixed = tuple(fixed)
+        self.fixed = frozenset(fixed)
+        self.counts: Dict[str, int] = {category: 0 for category in fixed}
+
+    def add(self, category: str, n: int = 1):
+        self.counts[category] = self.counts.get(category, 0) + n
+
+    def remove(self, category: str, n: int = 1):
+        remaining = self.counts.get(category, 0) - n
+        if remaining > 0 or category in self.fixed:
+            self.counts[category] = max(remaining, 0)
+        else:
+            self.counts.pop(category, None)
+
+    def get(self, category: str) -> int:
+        return self.counts.get(category, 0)
+
+    def to_dict(self) -> Dict[str, int]:
+        return dict(self.counts)
+
+
+class QuantileSketch:
+    """
+    Sketch logarítmico de cuantiles (tipo DDSketch).
+
+    Cada valor positivo se asigna a un cubo de índice ceil(log_gamma(x)), con
+    gamma = (1 + alpha) / (1 - alpha), de modo que el cuantil estimado tiene un
+    error relativo máximo `alpha`. Las inserciones y bajas son O(1) y dos
+    sketches con el mismo `alpha` se fusionan sumando cubos.
+    """
+
+    __slots__ = ("alpha", "gamma", "_log_gamma", "buckets", "zero_count", "count", "total")
+
+    def __init__(self, alpha: float = 0.01):
+        self.alpha = alpha
+        self.gamma = (1 + alpha) / (1 - alpha)
+        self._log_gamma = math.log(self.gamma)
+        self.buckets: Dict[int, int] = {}
+        self.zero_count = 0
+        self.count = 0
+        self.total = 0.0
+
+    def _key(self, value: float) -> int:
+        return math.ceil(math.log(value) / self._log_gamma)
+
+    def add(self, value: float):
+        """Añade un valor (los valores <= 0 se cuentan como cero)"""
+        if value > 0:
+            key = self._key(value)
+            self.buckets[key] = self.buckets.get(key, 0) + 1
+        else:
+            self.zero_count += 1
+        self.count += 1
+        self.total += value
+
+    def remove(self, value: float):
+        """Retira un valor añadido previamente"""
+        if value > 0:
+            key = self._key(value)
+            remaining = self.buckets.get(key, 0) - 1
+            if remaining > 0:
+                self.buckets[key] = remaining
+            else:
+                self.buckets.pop(key, None)
+        else:
+            self.zero_count = max(self.zero_count - 1, 0)
+        self.count = max(self.count - 1, 0)
+        self.total = self.total - value if self.count else 0.0
+
+    def merge(self, other: "QuantileSketch"):
+        """Fusiona otro sketch con el mismo alpha en este"""
+        if other.alpha != self.alpha:
+            raise ValueError("Cannot merge sketches with different alpha")
+        for key, n in other.buckets.items():
+            self.buckets[key] = self.buckets.get(key, 0) + n
+        self.zero_count += other.zero_count
+        self.count += other.count
+        self.total += other.total
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def quantile(self, q: float) -> float:
+        """
+        Estima el cuantil q (0.0 a 1.0).
+
+        El coste es proporcional al número de cubos ocupados, que está acotado
+        por el rango dinámico de los valores y no por el número de valores.
+        """
+        if self.count == 0:
+            return 0.0
+
+        rank = q * (self.count - 1)
+        seen = self.zero_count
+        if rank < seen:
+            return 0.0
+
+        for key in sorted(self.buckets):
+            seen += self.buckets[key]
+            if seen > rank:
+                return 2 * self.gamma ** key / (self.gamma + 1)
+        return 2 * self.gamma ** max(self.buckets) / (self.gamma + 1)
+
+
+class SlidingWindowCounter:
+    """
+    Contador de eventos en ventanas deslizantes con resolución de un segundo.
+
+    Cada ventana mantiene su propia cola de cubos por segundo y una suma
+    acumulada; los cubos se descartan al salir de la ventana, por lo que el
+    coste por evento y por consulta es O(1) amortizado.
+    """
+
+    __slots__ = ("windows", "_buckets", "_sums")
+
+    def __init__(self, windows: Tuple[int, ...] = DEFAULT_WINDOWS):
+        self.windows = tuple(windows)
+        self._buckets = [deque() for _ in self.windows]
+        self._sums = [0] * len(self.windows)
+
+    def add(self, timestamp: Optional[float] = None, n: int = 1):
+        """Registra n eventos en el instante dado (por defecto, ahora)"""
+        second = int(timestamp if timestamp is not None else time.time())
+        for i, buckets in enumerate(self._buckets):
+            if buckets and buckets[-1][0] == second:
+                buckets[-1][1] += n
+            else:
+                buckets.append([second, n])
+            self._sums[i] += n
+        self._expire(second)
+
+    def _expire(self, now_second: int):
+        for i, window in enumerate(self.windows):
+            buckets = self._buckets[i]
+            oldest_allowed = now_second - window
+            while buckets and buckets[0][0] <= oldest_allowed:
+                self._sums[i] -= buckets.popleft()[1]
+
+    def counts(self, now: Optional[float] = None) -> Dict[str, int]:
+        """Eventos en cada ventana"""
+        self._expire(int(now if now is not None else time.time()))
+        return {window_label(w): self._sums[i] for i, w in enumerate(self.windows)}
+
+    def rates(self, now: Optional[float] = None) -> Dict[str, float]:
+        """Tasa media (eventos por segundo) en cada ventana"""
+        self._expire(int(now if now is not None else time.time()))
+        return {window_label(w): self._sums[i] / w for i, w in enumerate(self.windows)}
@@ -0,0 +1,247 @@
+#!/usr/bin/env python3
+"""
+Reconciliador de Trazas - Conciliación Incremental ARGOS/HÉCATE
+
+Este módulo implementa la conciliación de trazas de ARGOS con HÉCATE,
+responsable de:
+1. Asignar un número de secuencia a cada operación registrada.
+2. Mantener una marca de agua: todas las operaciones con secuencia menor o
+   igual están confirmadas en HÉCATE y no se vuelven a consultar.
+3. Consultar a HÉCATE solo las trazas nuevas o pendientes, en un único lote
+   (diferencia de conjuntos) por ciclo.
+4. Reportar cada hueco una sola vez y detectar cuándo se resuelve,
+   re-consultando los huecos en rotación y a ritmo acotado, aparte de las
+   trazas nuevas.
+5. Indexar las trazas por tiempo para consultas por ventana y expiración.
+
+Autor: Manus AI (bajo DOS-03)
+Fecha: 26 de enero de 2026
+"""
+
+import bisect
+import heapq
+import time
+from array import array
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Set
+
+# Consulta por lotes: recibe IDs de operación y retorna los que HÉCATE NO tiene
+MissingTracesQuery = Callable[[Set[str]], Set[str]]
+
+
+@dataclass
+class ReconciliationResult:
+    """Resultado de un ciclo de conciliación"""
+    checked: int                                          # Trazas consultadas a HÉCATE
+    confirmed: int                                        # Trazas confirmadas en este ciclo
+    new_gaps: List[str] = field(default_factory=list)     # Huecos detectados por primera vez
+    resolved_gaps: List[str] = field(default_factory=list)  # Huecos reportados que HÉCATE ya tiene
+    watermark: int = 0
+
+
+class TraceReconciler:
+    """
+    Motor de conciliación incremental de trazas.
+
+    Cada operación recibe una secuencia creciente al registrarse y queda
+    pendiente hasta que HÉCATE la confirma. Las pendientes se guardan en orden
+    de secuencia y un montículo con borrado perezoso permite avanzar la marca
+    de agua en O(log n) por confirmación. El coste de un ciclo es proporcional
+    al número de trazas pendientes, no al total de operaciones registradas.
+
+    Los huecos reportados salen de las pendientes y se re-consultan en
+    rotación (hasta `gap_recheck_batch` por ciclo), de modo que los huecos que
+    HÉCATE nunca recibe no ocupan el lote de las trazas nuevas.
+    """
+
+    def __init__(self, grace_seconds: float = 0.0, max_batch: Optional[int] = None,
+                 gap_recheck_batch: Optional[int] = None):
+        """
+        Args:
+            grace_seconds: Antigüedad mínima de una traza antes de consultarla
+                           (margen para la latencia de registro de HÉCATE)
+            max_batch: Número máximo de trazas nuevas por consulta (por defecto,
+                       sin límite)
+            gap_recheck_batch: Número máximo de huecos reportados re-consultados
+                               por ciclo, además de las trazas nuevas (por
+                               defecto, max_batch)
+        """
+        self.grace_seconds = grace_seconds
+        self.max_batch = max_batch
+        self.gap_recheck_batch = max_batch if gap_recheck_batch is None else gap_recheck_batch
+
+        self._next_sequence = 1
+        self._sequence_by_op: Dict[str, int] = {}
+        self._pending: Dict[str, int] = {}        # op_id -> secuencia (orden de inserción = secuencia)
+        self._pending_since: Dict[str, float] = {}  # Timestamp de las pendientes (margen de gracia)
+        self._pending_heap: List[int] = []
+        self._pending_sequences: Set[int] = set()  # Pendientes y huecos (no confirmadas)
+        self._gaps: "OrderedDict[str, int]" = OrderedDict()  # Huecos reportados, en orden de re-consulta
+
+        # Índice temporal: timestamps ordenados (array de doubles, sin un
+        # float por operación) y operaciones en paralelo
+        self._times = array("d")
+        self._time_ops: List[str] = []
+
+    # ========== REGISTRO ==========
+
+    def add(self, operation_id: str, timestamp: Optional[float] = None) -> int:
+        """
+        Registra una operación pendiente de confirmación.
+
+        Registrar de nuevo una operación conocida no altera su estado.
+
+        Returns:
+            int: Número de secuencia de la operación
+        """
+        if operation_id in self._sequence_by_op:
+            return self._sequence_by_op[operation_id]
+
+        timestamp = time.time() if timestamp is None else timestamp
+        sequence = self._next_sequence
+        self._next_sequence += 1
+
+        self._sequence_by_op[operation_id] = sequence
+        self._pending[operation_id] = sequence
+        self._pending_sequences.add(sequence)
+        heapq.heappush(self._pending_heap, sequence)
+
+        self._pending_since[operation_id] = timestamp
+        if not self._times or timestamp >= self._times[-1]:
+            self._times.append(timestamp)
+            self._time_ops.append(operation_id)
+        else:
+            index = bisect.bisect_right(self._times, timestamp)
+            self._times.insert(index, timestamp)
+            self._time_ops.insert(index, operation_id)
+        return sequence
+
+    # ========== CONCILIACIÓN ==========
+
+    def reconcile(self, query_missing: MissingTracesQuery,
+                  now: Optional[float] = None) -> ReconciliationResult:
+        """
+        Ejecuta un ciclo de conciliación.
+
+        Args:
+            query_missing: Consulta por lotes a HÉCATE (retorna los IDs ausentes)
+            now: Instante de referencia para el margen de gracia
+
+        Returns:
+            ReconciliationResult: Resultado del ciclo
+        """
+        now = time.time() if now is None else now
+        cutoff = now - self.grace_seconds
+
+        candidates: Set[str] = set()
+        for operation_id in self._pending:
+            if self.max_batch is not None and len(candidates) >= self.max_batch:
+                break
+            if self._pending_since[operation_id] <= cutoff:
+                candidates.add(operation_id)
+
+        # Huecos a re-consultar: los más antiguos en la rotación
+        gap_candidates: List[str] = []
+        for operation_id in self._gaps:
+            if self.gap_recheck_batch is not None and len(gap_candidates) >= self.gap_recheck_batch:
+                break
+            gap_candidates.append(operation_id)
+
+        if not candidates and not gap_candidates:
+            return ReconciliationResult(checked=0, confirmed=0, watermark=self.watermark)
+
+        queried = candidates.union(gap_candidates)
+        missing = query_missing(queried) & queried
+        result = ReconciliationResult(checked=len(queried),
+                                      confirmed=len(queried) - len(missing))
+
+        for operation_id in candidates:
+            sequence = self._pending.pop(operation_id)
+            del self._pending_since[operation_id]
+            if operation_id in missing:
+                self._gaps[operation_id] = sequence
+                result.new_gaps.append(operation_id)
+            else:
+                self._pending_sequences.discard(sequence)
+
+        for operation_id in gap_candidates:
+            if operation_id in missing:
+                self._gaps.move_to_end(operation_id)
+            else:
+                self._pending_sequences.discard(self._gaps.pop(operation_id))
+                result.resolved_gaps.append(operation_id)
+
+        result.new_gaps.sort(key=self._sequence_by_op.__getitem__)
+        result.resolved_gaps.sort(key=self._sequence_by_op.__getitem__)
+        result.watermark = self.watermark
+        return result
+
+    @property
+    def watermark(self) -> int:
+        """Mayor secuencia S tal que todas las operaciones <= S están confirmadas"""
+        heap = self._pending_heap
+        while heap and heap[0] not in self._pending_sequences:
+            heapq.heappop(heap)
+        return heap[0] - 1 if heap else self._next_sequence - 1
+
+    def status(self, operation_id: str) -> Optional[str]:
+        """Estado de una operación: "confirmed", "pending", "missing" o None si no se conoce"""
+        if operation_id not in self._sequence_by_op:
+            return None
+        if operation_id in self._gaps:
+            return "missing"
+        if operation_id in self._pending:
+            return "pending"
+        return "confirmed"
+
+    def sequence_of(self, operation_id: str) -> Optional[int]:
+        """Número de secuencia de una operación"""
+        return self._sequence_by_op.get(operation_id)
+
+    @property
+    def pending_count(self) -> int:
+        return len(self._pending) + len(self._gaps)
+
+    @property
+    def gap_count(self) -> int:
+        return len(self._gaps)
+
+    # ========== ÍNDICE TEMPORAL ==========
+
+    def operations_in_window(self, start: float, end: float) -> List[str]:
+        """Operaciones con timestamp en [start, end), en orden temporal"""
+        lo = bisect.bisect_left(self._times, start)
+        hi = bisect.bisect_left(self._times, end)
+        return self._time_ops[lo:hi]
+
+    def expire(self, before: float) -> List[str]:
+        """
+        Olvida las operaciones con timestamp anterior a `before`.
+
+        Los huecos no resueltos de esas operaciones dejan de seguirse.
+
+        Returns:
+            List[str]: IDs de las operaciones expiradas
+        """
+        count = bisect.bisect_left(self._times, before)
+        if count == 0:
+            return []
+
+        expired = self._time_ops[:count]
+        del self._times[:count]
+        del self._time_ops[:count]
+
+        for operation_id in expired:
+            del self._sequence_by_op[operation_id]
+            sequence = self._pending.pop(operation_id, None)
+            if sequence is not None:
+                del self._pending_since[operation_id]
+            else:
+                sequence = self._gaps.pop(operation_id, None)
+            if sequence is not None:
+                self._pending_sequences.discard(sequence)
+        return expired
+
+    def __len__(self) -> int:
+        return len(self._sequence_by_op)
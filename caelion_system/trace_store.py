@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+Almacén de Trazas - Registro Columnar de Operaciones de ARGOS
+
+Este módulo implementa el almacén en memoria de las trazas independientes
+de ARGOS, responsable de:
+1. Guardar cada traza en columnas contiguas (array de timestamps, códigos de
+   tipo y solicitante, y digests SHA-256 binarios) en lugar de un objeto por
+   operación.
+2. Internar los tipos de operación y solicitantes en una tabla de símbolos
+   (cada cadena distinta se guarda una sola vez).
+3. Ofrecer la interfaz de diccionario usada por ARGOS (operation_id ->
+   OperationTrace), materializando la traza solo al consultarla.
+4. Reutilizar las filas de las trazas expiradas.
+
+Coste del almacén por traza (tracemalloc, `python3.11 benchmarks.py
+trace_memory`): unos 117 bytes (48 de columnas, el resto de la entrada del
+índice), frente a unos 290 de un diccionario de dataclasses con __dict__ y
+250 con __slots__; sin contar la cadena del operation_id, que comparten el
+índice y el conciliador de trazas. Es solo una parte de lo que ARGOS guarda
+por traza: con el conciliador (unos 90 bytes) y el árbol de Merkle de trazas
+(unos 136), ARGOS completo ocupa unos 340 bytes por traza retenida, unos
+3,4 GB por cada diez millones; el mismo benchmark lo mide.
+
+Autor: Manus AI (bajo DOS-03)
+Fecha: 26 de enero de 2026
+"""
+
+import sys
+from array import array
+from typing import Callable, Dict, Iterator, List
+
+DIGEST_SIZE = 32  # SHA-256
+
+
+class SymbolTable:
+    """Tabla de cadenas internadas: cada cadena distinta tiene un código entero"""
+
+    __slots__ = ("_codes", "_symbols")
+
+    def __init__(self):
+        self._codes: Dict[str, int] = {}
+        self._symbols: List[str] = []
+
+    def code(self, symbol: str) -> int:
+        """Código de una cadena (se registra si es nueva)"""
+        code = self._codes.get(symbol)
+        if code is None:
+            symbol = sys.intern(symbol)
+            code = self._codes[symbol] = len(self._symbols)
+            self._symbols.append(symbol)
+        return code
+
+    def symbol(self, code: int) -> str:
+        return self._symbols[code]
+
+    def __len__(self) -> int:
+        return len(self._symbols)
+
+
+class ColumnarTraceStore:
+    """
+    Trazas de operaciones en columnas, indexadas por operation_id.
+
+    Cada traza ocupa una fila: timestamp (double), códigos de tipo de
+    operación y de solicitante (uint32) y el hash de los datos como digest
+    binario de 32 bytes. El índice operation_id -> fila es el único objeto
+    Python por traza; las filas liberadas por pop() se reutilizan.
+    """
+
+    def __init__(self, factory: Callable[..., object]):
+        """
+        Args:
+            factory: Constructor de la traza materializada (OperationTrace),
+                invocado con operation_id, operation_type, timestamp,
+                requester y data_hash
+        """
+        self.factory = factory
+        self.symbols = SymbolTable()
+        self._rows: Dict[str, int] = {}
+        self._free: List[int] = []
+        self._timestamps = array("d")
+        self._types = array("I")
+        self._requesters = array("I")
+        self._digests = bytearray()
+
+    def __setitem__(self, operation_id: str, trace):
+        """
+        Guarda una traza (reemplaza la existente con el mismo operation_id).
+
+        Raises:
+            ValueError: Si data_hash no es un SHA-256 hexadecimal
+        """
+        digest = bytes.fromhex(trace.data_hash)
+        if len(digest) != DIGEST_SIZE:
+            raise ValueError(f"Trace data hash must be a SHA-256 digest: {trace.data_hash!r}")
+        type_code = self.symbols.code(trace.operation_type)
+        requester_code = self.symbols.code(trace.requester)
+
+        row = self._rows.get(operation_id)
+        if row is None and self._free:
+            row = self._free.pop()
+        if row is None:
+            row = len(self._timestamps)
+            self._timestamps.append(float(trace.timestamp))
+            self._types.append(type_code)
+            self._requesters.append(requester_code)
+            self._digests += digest
+        else:
+            self._timestamps[row] = trace.timestamp
+            self._types[row] = type_code
+            self._requesters[row] = requester_code
+            self._digests[row * DIGEST_SIZE:(row + 1) * DIGEST_SIZE] = digest
+        self._rows[operation_id] = row
+
+    def __getitem__(self, operation_id: str):
+        return self._materialize(operation_id, self._rows[operation_id])
+
+    def get(self, operation_id: str, default=None):
+        row = self._rows.get(operation_id)
+        return default if row is None else self._materialize(operation_id, row)
+
+    def pop(self, operation_id: str, default=None):
+        """Elimina una traza y libera su fila"""
+        row = self._rows.pop(operation_id, None)
+        if row is None:
+            return default
+        trace = self._materialize(operation_id, row)
+        self._free.append(row)
+        return trace
+
+    def timestamp(self, operation_id: str) -> float:
+        """Timestamp de una traza sin materializarla"""
+        return self._timestamps[self._rows[operation_id]]
+
+    def _materialize(self, operation_id: str, row: int):
+        symbol = self.symbols.symbol
+        return self.factory(
+            operation_id=operation_id,
+            operation_type=symbol(self._types[row]),
+            timestamp=self._timestamps[row],
+            requester=symbol(self._requesters[row]),
+            data_hash=self._digests[row * DIGEST_SIZE:(row + 1) * DIGEST_SIZE].hex()
+        )
+
+    def __contains__(self, operation_id: str) -> bool:
+        return operation_id in self._rows
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._rows)
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def values(self) -> Iterator:
+        for operation_id, row in self._rows.items():
+            yield self._materialize(operation_id, row)
+
+    def items(self) -> Iterator:
+        for operation_id, row in self._rows.items():
+            yield operation_id, self._materialize(operation_id, row)
+
+    def column_bytes(self) -> int:
+        """Bytes ocupados por las columnas (sin el índice ni la tabla de símbolos)"""
+        return (self._timestamps.itemsize * len(self._timestamps) +
+                self._types.itemsize * len(self._types) +
+                self._requesters.itemsize * len(self._requesters) +
+                len(self._digests))
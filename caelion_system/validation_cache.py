@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+Caché de Validación - Resultados Persistentes del Validador CAELION
+
+Este módulo implementa la caché persistente de resultados de validación,
+responsable de:
+1. Guardar cada ValidationResult en SQLite bajo una clave direccionada por
+   contenido (SHA-256 del documento y de la versión de las reglas).
+2. Retornar el resultado guardado cuando un documento no ha cambiado.
+3. Desalojar las entradas usadas menos recientemente (LRU) al superar el
+   número máximo de entradas o el tamaño máximo.
+4. Permitir el acceso concurrente de varios procesos (modo WAL).
+
+Autor: Manus AI (bajo DOS-03)
+Fecha: 26 de enero de 2026
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, Optional
+import logging
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS results (
+    key TEXT PRIMARY KEY,
+    result TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    last_access REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS results_last_access ON results (last_access);
+"""
+
+
+class ValidationCache:
+    """
+    Caché LRU de resultados de validación sobre SQLite.
+
+    Los resultados se guardan como JSON (los mismos campos que el informe
+    *_validation.json). Las claves las calcula el validador, de modo que un
+    cambio en sus reglas invalida las entradas anteriores sin borrarlas: las
+    antiguas simplemente dejan de consultarse y acaban desalojadas.
+    """
+
+    def __init__(self,
+                 path: str,
+                 max_entries: Optional[int] = 10000,
+                 max_bytes: Optional[int] = 256 * 1024 * 1024):
+        """
+        Args:
+            path: Archivo SQLite de la caché
+            max_entries: Número máximo de resultados guardados (None = sin límite)
+            max_bytes: Tamaño máximo de los resultados guardados (None = sin límite)
+        """
+        self.path = path
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, timeout=30.0, check_same_thread=False,
+                                     isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+
+    def get(self, key: str) -> Optional[Dict]:
+        """
+        Obtiene un resultado guardado y lo marca como usado.
+
+        Returns:
+            Optional[Dict]: Resultado guardado, o None si no está en caché
+        """
+        with self._lock:
+            row = self._conn.execute("SELECT result FROM results WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            self._conn.execute("UPDATE results SET last_access = ? WHERE key = ?", (time.time(), key))
+            self.hits += 1
+        return json.loads(row[0])
+
+    def put(self, key: str, result: Dict):
+        """Guarda un resultado y desaloja las entradas LRU si se supera algún límite"""
+        payload = json.dumps(result, ensure_ascii=False)
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO results (key, result, size, last_access) VALUES (?, ?, ?, ?)",
+                (key, payload, len(payload), time.time())
+            )
+            self._evict()
+
+    def _evict(self):
+        count, total = self._conn.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM results").fetchone()
+
+        def over_limit() -> bool:
+            return ((self.max_entries is not None and count > self.max_entries) or
+                    (self.max_bytes is not None and total > self.max_bytes))
+
+        if not over_limit():
+            return
+
+        # Recorrer en orden LRU hasta volver dentro de ambos límites
+        evicted = []
+        cursor = self._conn.execute("SELECT key, size FROM results ORDER BY last_access")
+        for key, size in cursor:
+            evicted.append((key,))
+            count -= 1
+            total -= size
+            if not over_limit():
+                break
+        cursor.close()
+
+        self._conn.executemany("DELETE FROM results WHERE key = ?", evicted)
+        self.evictions += len(evicted)
+        logger.debug(f"Evicted {len(evicted)} validation cache entries")
+
+    def clear(self):
+        """Elimina todos los resultados"""
+        with self._lock:
+            self._conn.execute("DELETE FROM results")
+
+    def stats(self) -> Dict:
+        """Estadísticas de uso de la caché en este proceso"""
+        with self._lock:
+            count, total = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM results").fetchone()
+        return {
+            'entries': count,
+            'bytes': total,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions
+        }
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM results").fetchone()[0]